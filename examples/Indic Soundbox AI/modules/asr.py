@@ -1,7 +1,8 @@
-import requests
 import os
 from dotenv import load_dotenv
 
+from modules.http_client import sarvam_post
+
 load_dotenv()
 
 SARVAM_API_KEY = os.getenv("SARVAM_API_KEY")
@@ -20,7 +21,7 @@ def speech_to_text(audio_blob):
     }
     headers = {'api-subscription-key': SARVAM_API_KEY}
 
-    response = requests.post('https://api.sarvam.ai/speech-to-text', files=files, data=data, headers=headers)
+    response = sarvam_post('/speech-to-text', files=files, data=data, headers=headers)
 
     if not response.ok:
         raise Exception(f"ASR API request failed with status {response.status_code}: {response.text}")
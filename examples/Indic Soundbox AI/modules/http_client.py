@@ -0,0 +1,84 @@
+import os
+import random
+import threading
+import time
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+load_dotenv()
+
+SARVAM_API_BASE = "https://api.sarvam.ai"
+
+# Connection pool and retry settings, overridable from .env
+POOL_SIZE = int(os.getenv("SARVAM_HTTP_POOL_SIZE", "10"))  # keep-alive connections kept open
+CONNECT_TIMEOUT = float(os.getenv("SARVAM_HTTP_CONNECT_TIMEOUT", "5"))  # seconds
+READ_TIMEOUT = float(os.getenv("SARVAM_HTTP_READ_TIMEOUT", "60"))  # seconds; LLM replies can be slow
+MAX_RETRIES = int(os.getenv("SARVAM_HTTP_MAX_RETRIES", "3"))
+BACKOFF_BASE = 0.5  # seconds; doubles per attempt
+BACKOFF_MAX = 8.0  # seconds
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    Returns the process-wide requests.Session shared by all modules.
+
+    Every call to api.sarvam.ai reuses a pooled keep-alive connection instead
+    of paying a fresh TCP + TLS handshake. One session is shared across Flask's
+    request threads (urllib3's connection pool is thread-safe); cookies are
+    refused so no per-request state ever lives on it.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE, pool_block=False)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def _backoff_delay(attempt, response=None):
+    """Full-jitter exponential backoff, honouring Retry-After when the API sends it."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), BACKOFF_MAX)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def sarvam_post(path, **kwargs):
+    """
+    POSTs to a Sarvam API path (e.g. '/text-lid') over the shared session.
+
+    Retries with jittered backoff on 429/5xx responses and on connection errors
+    (including a pooled connection the server has since closed). Returns the
+    last response, so callers still check `response.ok` themselves.
+    """
+    kwargs.setdefault("timeout", (CONNECT_TIMEOUT, READ_TIMEOUT))
+    url = f"{SARVAM_API_BASE}{path}"
+    session = get_session()
+
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = session.post(url, **kwargs)
+        except requests.ConnectionError as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = _backoff_delay(attempt)
+            print(f"[modules/http_client.py] POST {path}: connection error ({e}); retrying in {delay:.2f}s")
+        else:
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            delay = _backoff_delay(attempt, response)
+            print(f"[modules/http_client.py] POST {path}: status {response.status_code}; retrying in {delay:.2f}s")
+        time.sleep(delay)
@@ -1,7 +1,8 @@
-import requests
 import os
 from dotenv import load_dotenv
 
+from modules.http_client import sarvam_post
+
 load_dotenv()
 
 SARVAM_API_KEY = os.getenv("SARVAM_API_KEY")
@@ -19,7 +20,7 @@ def identify_language(text):
     }
     payload = {'input': text}
 
-    response = requests.post('https://api.sarvam.ai/text-lid', json=payload, headers=headers)
+    response = sarvam_post('/text-lid', json=payload, headers=headers)
 
     if not response.ok:
         raise Exception(f"LID API request failed with status {response.status_code}: {response.text}")
@@ -1,7 +1,8 @@
-import requests
 import os
 from dotenv import load_dotenv
 
+from modules.http_client import sarvam_post
+
 load_dotenv()
 
 SARVAM_API_KEY = os.getenv("SARVAM_API_KEY")
@@ -121,7 +122,7 @@ WhatsApp और Facebook पर अपनी दुकान की जानक
         'stream': False
     }
 
-    response = requests.post('https://api.sarvam.ai/v1/chat/completions', json=payload, headers=headers)
+    response = sarvam_post('/v1/chat/completions', json=payload, headers=headers)
 
     if not response.ok:
         raise Exception(f"Chat API request failed with status {response.status_code}: {response.text}")
@@ -2,10 +2,11 @@ import os
 import base64
 import wave
 import io
-import requests
 import re # Added for regex cleaning
 from dotenv import load_dotenv
 
+from modules.http_client import sarvam_post
+
 load_dotenv()
 
 SARVAM_API_KEY = os.getenv("SARVAM_API_KEY")
@@ -66,7 +67,7 @@ def _call_sarvam_tts(text_chunk, lang_code, speaker='shubh', model='bulbul:v3'):
         'model': model
     }
 
-    response = requests.post('https://api.sarvam.ai/text-to-speech', json=payload, headers=headers)
+    response = sarvam_post('/text-to-speech', json=payload, headers=headers)
 
     if not response.ok:
         error_msg = f"Sarvam TTS API request failed for chunk with status {response.status_code}: {response.text}"
@@ -1,9 +1,14 @@
-from flask import Flask, render_template, request
+from flask import Flask, Response, render_template, request
 from flask_socketio import SocketIO, emit
 import asyncio
+import base64
+import io
+import wave
 from sarvamai import AsyncSarvamAI
 import logging
 import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
 import config
 
 # Configure logging
@@ -31,117 +36,624 @@ def _extract_text(resp):
     return ""
 
 
+class TranscriptStore:
+    """Append-only transcript segments for one video and mode, indexed by video position.
+
+    Each result from the streaming API is stored as (start, end, text) for
+    the span of video whose audio produced it, in a list kept sorted by
+    start so a time range is a bisect away. `covered` records which spans
+    of the video have had their results stored (not merely sent); when
+    playback returns to one (a seek back, or a replay), its captions are
+    served from here instead of paying for STT on the same audio again.
+    """
+
+    # Frame positions are browser-side estimates; treat spans this close
+    # together as contiguous.
+    TOLERANCE_SECONDS = 0.25
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._starts = []
+        self._segments = []  # (start, end, text), sorted by start
+        self._covered = []  # disjoint [start, end] spans, sorted
+
+    def add(self, start, end, text):
+        with self._lock:
+            i = bisect_right(self._starts, start)
+            self._starts.insert(i, start)
+            self._segments.insert(i, (start, end, text))
+
+    def between(self, start, end, overlapping=False):
+        """Segments that start within [start, end).
+
+        With `overlapping`, also the segment already running at `start`,
+        for the first frame after a seek lands mid-segment.
+        """
+        with self._lock:
+            i = bisect_left(self._starts, start)
+            if overlapping and i and self._segments[i - 1][1] > start:
+                i -= 1
+            return self._segments[i:bisect_left(self._starts, end)]
+
+    def mark_covered(self, start, end):
+        with self._lock:
+            spans = self._covered
+            i = bisect_left(spans, [start - self.TOLERANCE_SECONDS])
+            if i and spans[i - 1][1] >= start - self.TOLERANCE_SECONDS:
+                i -= 1
+            j = i
+            while j < len(spans) and spans[j][0] <= end + self.TOLERANCE_SECONDS:
+                start = min(start, spans[j][0])
+                end = max(end, spans[j][1])
+                j += 1
+            spans[i:j] = [[start, end]]
+
+    def is_covered(self, start, end):
+        with self._lock:
+            i = bisect_right(self._covered, [start + self.TOLERANCE_SECONDS, float("inf")])
+            return bool(i) and self._covered[i - 1][1] >= end - self.TOLERANCE_SECONDS
+
+
+# Transcript stores keyed by (sid, video_id, mode), least recently used
+# first. video_id is the browser's own identifier for the loaded file, so a
+# video watched again in the same tab reuses what was already transcribed.
+# Stores are per client: video_id is client-supplied, so sharing them would
+# hand one viewer's transcripts to anyone sending the same string.
+transcript_stores = OrderedDict()
+transcript_stores_lock = threading.Lock()
+
+
+def get_transcript_store(sid, video_id, mode):
+    key = (sid, video_id, mode)
+    with transcript_stores_lock:
+        store = transcript_stores.get(key)
+        if store is None:
+            store = transcript_stores[key] = TranscriptStore()
+            while len(transcript_stores) > 2 * config.TRANSCRIPT_STORE_MAX_VIDEOS:
+                transcript_stores.popitem(last=False)
+        transcript_stores.move_to_end(key)
+        return store
+
+
+def drop_transcript_stores(sid):
+    with transcript_stores_lock:
+        for key in [key for key in transcript_stores if key[0] == sid]:
+            del transcript_stores[key]
+
+
+def _merge_wav(first_b64, second_b64):
+    """Concatenate two base64 WAV frames with the same format into one."""
+    out = io.BytesIO()
+    with wave.open(io.BytesIO(base64.b64decode(first_b64))) as first, wave.open(
+        io.BytesIO(base64.b64decode(second_b64))
+    ) as second:
+        if first.getparams()[:3] != second.getparams()[:3]:
+            raise ValueError("frames differ in format")
+        with wave.open(out, "wb") as merged:
+            merged.setparams(first.getparams())
+            merged.writeframes(first.readframes(first.getnframes()))
+            merged.writeframes(second.readframes(second.getnframes()))
+    return base64.b64encode(out.getvalue()).decode("ascii")
+
+
+class FrameQueue:
+    """A channel's queue: audio frames, bounded, plus control markers, unbounded.
+
+    Audio items are (audio_b64, store, start, end) tuples; anything else
+    (the None stop sentinel, pause/resume markers) is a marker and is never
+    shed. Once `max_frames` audio frames are waiting, `put_frame` sheds
+    according to `policy`:
+
+    - "drop_oldest": discard the oldest queued frame
+    - "coalesce": merge the new frame into the newest queued one, so the
+      backlog drains in fewer, larger sends; falls back to drop_oldest
+      when the frames can't be merged or the merged one would exceed
+      COALESCE_MAX_SECONDS
+    - "reject": discard the new frame
+
+    Only ever used from the session's loop thread; `frames` and `shed` are
+    read from elsewhere for metrics.
+    """
+
+    POLICIES = ("drop_oldest", "coalesce", "reject")
+    COALESCE_MAX_SECONDS = 10
+
+    def __init__(self, max_frames, policy):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+        self.max_frames = max_frames
+        self.policy = policy
+        self.frames = 0  # audio frames waiting
+        self.shed = 0  # audio frames dropped or merged away
+        self.overloaded = False  # shed since the queue was last empty
+        self._items = deque()
+        self._ready = asyncio.Event()
+
+    def put_marker(self, marker):
+        self._items.append(marker)
+        self._ready.set()
+
+    def put_frame(self, item):
+        """Queue an audio frame. True if something had to be shed for it."""
+        if self.frames < self.max_frames:
+            self._append_frame(item)
+            return False
+        self.shed += 1
+        self.overloaded = True
+        if self.policy == "reject":
+            return True
+        if self.policy == "coalesce" and self._coalesce(item):
+            return True
+        self._drop_oldest()
+        self._append_frame(item)
+        return True
+
+    async def get(self):
+        while not self._items:
+            self._ready.clear()
+            await self._ready.wait()
+        item = self._items.popleft()
+        if isinstance(item, tuple):
+            self.frames -= 1
+            if not self.frames:
+                self.overloaded = False
+        return item
+
+    def _append_frame(self, item):
+        self._items.append(item)
+        self.frames += 1
+        self._ready.set()
+
+    def _drop_oldest(self):
+        for i, queued in enumerate(self._items):
+            if isinstance(queued, tuple):
+                del self._items[i]
+                self.frames -= 1
+                return
+
+    def _coalesce(self, item):
+        for i in range(len(self._items) - 1, -1, -1):
+            if isinstance(self._items[i], tuple):
+                break
+        else:
+            return False
+        audio_b64, store, start, end = self._items[i]
+        new_audio, new_store, new_start, new_end = item
+        try:
+            merged = _merge_wav(audio_b64, new_audio)
+            with wave.open(io.BytesIO(base64.b64decode(merged))) as wav:
+                if wav.getnframes() > wav.getframerate() * self.COALESCE_MAX_SECONDS:
+                    return False
+        except (wave.Error, EOFError, ValueError):
+            return False
+        # Keep indexing the merged frame only if it is one contiguous span.
+        if (
+            store is None
+            or store is not new_store
+            or abs(new_start - end) > TranscriptStore.TOLERANCE_SECONDS
+        ):
+            store = start = new_end = None
+        self._items[i] = (merged, store, start, new_end)
+        return True
+
+
+class AdmissionController:
+    """Refuses new streams while the server is already behind on the ones it has.
+
+    The backlog is the number of audio frames waiting in every session's
+    queues. A stream that can't keep up sheds frames locally (FrameQueue);
+    once the aggregate crosses `max_backlog`, upstream is the bottleneck,
+    and starting more streams would only slow down everyone's.
+    """
+
+    def __init__(self, max_backlog):
+        self.max_backlog = max_backlog
+        self.rejected = 0  # start_stream requests refused
+        self.shed_frames = 0  # frames shed across all sessions, ever
+
+    def backlog(self):
+        return sum(session.backlog() for session in list(streaming_sessions.values()))
+
+    def admit(self):
+        if self.backlog() > self.max_backlog:
+            self.rejected += 1
+            return False
+        return True
+
+
 class StreamingSession:
-    """Maintains a single persistent Sarvam streaming connection for one client+mode.
+    """Maintains one client's persistent Sarvam streaming connections, one per active mode.
 
     The Sarvam streaming API expects ONE long-lived connection that audio is
-    continuously fed into, emitting transcripts as speech segments finalize.
-    We run a dedicated asyncio loop in a background thread: one task pulls audio
-    frames off a queue and forwards them, another loops on recv() and emits
-    results to the browser as they arrive.
+    continuously fed into, emitting transcripts as speech segments finalize,
+    and `mode` ("transcribe" or "translate") is fixed per connection. The
+    browser still uploads each audio frame only once: `send_audio` fans it
+    out to every active mode's connection here, so running transcription and
+    translation together doesn't double the client's upload or the server's
+    ingress.
+
+    Frames carrying a video position are also indexed into that video's
+    TranscriptStore: results are stored against the span of video they
+    came from, and a frame for a span that has already been streamed is
+    answered from the store rather than sent upstream again.
+
+    Each channel's queue is a bounded FrameQueue (config.STREAM_QUEUE_*):
+    if upstream falls behind, frames are shed by the configured policy and
+    the browser is told once, instead of audio piling up in memory.
+
+    Pausing the video parks every channel: its buffered audio is flushed so
+    the last words come back, and the idle connection is kept as a standby
+    for config.PAUSE_STANDBY_SECONDS. Resuming within that window carries on
+    over the same connection; a longer pause closes it, and the next play
+    reconnects straight away, before the first new frame arrives. A
+    connection upstream closes on its own (an idle timeout during the
+    pause) is handled the same way, and a frame that was already on its way
+    goes out on the new connection.
+
+    We run a dedicated asyncio loop in a background thread. Each active mode
+    is a channel: a queue plus a task that pulls audio frames off it and
+    forwards them, with another task looping on recv() and emitting results
+    to the browser as they arrive. The loop shuts down once no mode is left.
     """
 
-    def __init__(self, sid, mode):
+    # Channel queue markers, besides audio frames and the None stop sentinel.
+    PAUSE = "pause"
+    RESUME = "resume"
+    # Returned by _next_item when the connection should be given up.
+    _EXPIRED = object()
+
+    # After a seek, how long to wait for the flushed result of the audio
+    # before it, so that result isn't stored against the new position.
+    SEEK_FLUSH_WAIT_SECONDS = 2
+
+    def __init__(self, sid):
         self.sid = sid
-        self.mode = mode  # "transcribe" or "translate"
         self.loop = asyncio.new_event_loop()
-        self.queue = asyncio.Queue()
         self.thread = threading.Thread(target=self._run, daemon=True)
+        self.channels = {}  # mode -> FrameQueue; only touched on self.loop
+        self.video_id = None  # set by start_stream; enables the TranscriptStore
+        self._replayed_to = {}  # mode -> end of the last frame served from the store
+        # Modes started and not yet stopped, each mapped to a token naming
+        # its current channel, and the count of channel tasks still running
+        # (including stopped ones draining their last results). Guarded by
+        # _lock, since modes are started from Socket.IO threads and finish
+        # on self.loop.
+        self._modes = {}
+        self._live_channels = 0
+        self._lock = threading.Lock()
         self._stopped = False
 
     def start(self):
         self.thread.start()
 
-    def send_audio(self, audio_b64):
+    def start_mode(self, mode):
+        """Open `mode`'s connection. False if this session has already shut
+        down (the caller should start a fresh one)."""
+        with self._lock:
+            if self._stopped:
+                return False
+            if mode in self._modes:
+                return True  # already running
+            # A stopped channel for this mode may still be draining; the
+            # new one opens beside it.
+            token = self._modes[mode] = object()
+            self._live_channels += 1
+        self._call_soon(self._open_channel, mode, token)
+        return True
+
+    def is_running(self, mode):
+        with self._lock:
+            return mode in self._modes and not self._stopped
+
+    def backlog(self):
+        """Audio frames queued across this session's channels."""
+        return sum(queue.frames for queue in list(self.channels.values()))
+
+    def stop_mode(self, mode):
+        with self._lock:
+            self._modes.pop(mode, None)
+        self._call_soon(self._close_channel, mode)
+
+    def send_audio(self, audio_b64, mode=None, start=None, end=None):
+        """Forward one audio frame to every active mode (or just `mode`).
+
+        `start`/`end` are the frame's position in the video, in seconds,
+        when the client knows it.
+        """
         if self._stopped:
             return
         # Scheduled onto the session's own loop from the Socket.IO thread.
-        try:
-            asyncio.run_coroutine_threadsafe(self.queue.put(audio_b64), self.loop)
-        except RuntimeError:
-            self._stopped = True  # loop died (e.g. connection never opened)
+        self._call_soon(self._fan_out, audio_b64, mode, start, end)
+
+    def pause(self):
+        """Flush and park every mode's connection (the video was paused)."""
+        self._call_soon(self._signal, self.PAUSE)
+
+    def resume(self):
+        """Unpark every mode's connection, reconnecting any that expired."""
+        self._call_soon(self._signal, self.RESUME)
 
     def stop(self):
-        if self._stopped:
-            return
-        self._stopped = True
+        with self._lock:
+            modes = list(self._modes)
+        for mode in modes:
+            self.stop_mode(mode)
+
+    def _call_soon(self, callback, *args):
         try:
-            asyncio.run_coroutine_threadsafe(self.queue.put(None), self.loop)
+            self.loop.call_soon_threadsafe(callback, *args)
         except RuntimeError:
-            pass  # loop already dead, nothing to stop
+            self._stopped = True  # loop died (e.g. already shut down)
+
+    def _open_channel(self, mode, token):
+        queue = FrameQueue(config.STREAM_QUEUE_MAX_FRAMES, config.STREAM_QUEUE_POLICY)
+        self.channels[mode] = queue
+        self.loop.create_task(self._channel(mode, queue, token))
+
+    def _close_channel(self, mode):
+        queue = self.channels.pop(mode, None)
+        if queue is not None:
+            queue.put_marker(None)  # stop sentinel
+
+    def _signal(self, marker):
+        for queue in self.channels.values():
+            queue.put_marker(marker)
+
+    def _store(self, mode, start):
+        if self.video_id is None or start is None:
+            return None
+        return get_transcript_store(self.sid, self.video_id, mode)
+
+    def _fan_out(self, audio_b64, mode, start, end):
+        modes = [mode] if mode is not None else list(self.channels)
+        for mode in modes:
+            queue = self.channels.get(mode)
+            if queue is None:
+                continue
+            store = self._store(mode, start)
+            if store is not None and store.is_covered(start, end):
+                # Already streamed: replay what was said in this span, in
+                # step with playback, instead of transcribing it again.
+                previous = self._replayed_to.get(mode)
+                seeked = previous is None or abs(start - previous) > store.TOLERANCE_SECONDS
+                for _, _, text in store.between(start, end, overlapping=seeked):
+                    emit_streaming_result(self.sid, mode, text, replayed=True)
+                self._replayed_to[mode] = end
+                continue
+            self._replayed_to.pop(mode, None)
+            was_overloaded = queue.overloaded
+            if queue.put_frame((audio_b64, store, start, end)):
+                admission.shed_frames += 1
+                if not was_overloaded:
+                    logger.warning(
+                        f"[{mode}] {self.sid} is {queue.frames} frames behind; "
+                        f"shedding audio ({queue.policy})"
+                    )
+                    emit_to(self.sid, "status", {
+                        "message": f"Server is falling behind - some {mode} audio is being skipped"
+                    })
 
     def _run(self):
         asyncio.set_event_loop(self.loop)
         try:
-            self.loop.run_until_complete(self._session())
-        except Exception as e:
-            logger.error(f"[{self.mode}] session loop error: {e}")
-            self._stopped = True
-            # Unregister so the client can retry with a fresh start_stream,
-            # and let the browser know why nothing is coming through.
-            streaming_sessions.pop((self.sid, self.mode), None)
-            with app.app_context():
-                socketio.emit(
-                    "error",
-                    {"message": f"Failed to start {self.mode} stream: {e}"},
-                    to=self.sid,
-                )
+            self.loop.run_forever()
         finally:
+            # Let cancelled receivers finish unwinding before the loop closes.
+            pending = asyncio.all_tasks(self.loop)
+            for task in pending:
+                task.cancel()
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
             self.loop.close()
 
-    async def _session(self):
-        client = AsyncSarvamAI(api_subscription_key=SARVAM_API_KEY)
-        logger.info(f"[{self.mode}] opening persistent streaming connection...")
-
-        # Both modes go through the same unified speech_to_text_streaming
-        # endpoint; the `mode` param ("transcribe" vs "translate") picks the
-        # behavior, and both still call ws.transcribe() to send audio.
-        conn = client.speech_to_text_streaming.connect(
-            language_code=config.API_LANGUAGE, model="saaras:v3", mode=self.mode
-        )
+    async def _channel(self, mode, queue, token):
+        try:
+            await self._session(mode, queue)
+        except Exception as e:
+            logger.error(f"[{mode}] session loop error: {e}")
+            # Drop the channel so the client can retry with a fresh
+            # start_stream, and let the browser know why nothing is coming
+            # through.
+            if self.channels.get(mode) is queue:
+                del self.channels[mode]
+            emit_to(self.sid, "error", {"message": f"Failed to start {mode} stream: {e}"})
+        finally:
+            self._channel_finished(mode, token)
+
+    def _channel_finished(self, mode, token):
+        with self._lock:
+            if self._modes.get(mode) is token:
+                del self._modes[mode]  # failed, rather than stopped
+            self._live_channels -= 1
+            if self._modes or self._live_channels:
+                return
+            self._stopped = True
+        if streaming_sessions.get(self.sid) is self:
+            streaming_sessions.pop(self.sid, None)
+        self.loop.stop()
 
-        async with conn as ws:
-            logger.info(f"[{self.mode}] connected")
-            receiver = asyncio.create_task(self._receive(ws))
+    async def _session(self, mode, queue):
+        client = AsyncSarvamAI(api_subscription_key=SARVAM_API_KEY)
+        item = None  # first item for the next connection, if already taken
+        while True:
+            logger.info(f"[{mode}] opening persistent streaming connection...")
+
+            # Both modes go through the same unified speech_to_text_streaming
+            # endpoint; the `mode` param ("transcribe" vs "translate") picks the
+            # behavior, and both still call ws.transcribe() to send audio.
+            conn = client.speech_to_text_streaming.connect(
+                language_code=config.API_LANGUAGE, model="saaras:v3", mode=mode
+            )
+
+            async with conn as ws:
+                logger.info(f"[{mode}] connected")
+                # Video span of the audio sent since the last result, which
+                # the next result is stored against: [store, start, end].
+                span = [None, None, None]
+                got_result = asyncio.Event()
+                receiver = asyncio.create_task(self._receive(ws, mode, span, got_result))
+                try:
+                    stopped, item = await self._stream(
+                        ws, mode, queue, span, got_result, receiver, item
+                    )
+                finally:
+                    receiver.cancel()
+                    logger.info(f"[{mode}] connection closed")
+            if stopped:
+                return
+
+            # The connection expired while parked, or upstream dropped it.
+            # Reconnect straight away for pending audio or a resume; while
+            # still paused, hold off until playback resumes.
+            if item is None or item == self.PAUSE:
+                item = await queue.get()
+                while item == self.PAUSE:
+                    item = await queue.get()
+                if item is None:  # stop sentinel
+                    return
+            if item == self.RESUME:
+                item = None
+
+    async def _stream(self, ws, mode, queue, span, got_result, receiver, item=None):
+        """Feed queued audio into `ws`.
+
+        Returns (stopped, item): (True, None) once stopped. (False, item)
+        when the connection is done for -- parked past its standby TTL, or
+        closed by upstream (typically an idle timeout while paused) -- with
+        the queue item it was holding, for the next connection to pick up.
+        """
+        parked = False
+        # Until something has gone through, a failing send is this
+        # connection's fault, not a drop worth reconnecting over.
+        used = False
+        while True:
+            if item is None:
+                item = await self._next_item(
+                    queue, receiver, config.PAUSE_STANDBY_SECONDS if parked else None
+                )
+                if item is self._EXPIRED:
+                    if receiver.done():
+                        logger.info(f"[{mode}] upstream closed the connection")
+                    else:
+                        logger.info(f"[{mode}] paused for over {config.PAUSE_STANDBY_SECONDS}s")
+                    return False, None
+                if item is None:  # stop sentinel
+                    break
+            item, current = None, item
+
+            if receiver.done():
+                logger.info(f"[{mode}] upstream closed the connection")
+                return False, current
             try:
-                while True:
-                    audio_b64 = await self.queue.get()
-                    if audio_b64 is None:  # stop sentinel
-                        break
-                    await ws.transcribe(audio=audio_b64)
-
-                # Flush any buffered audio so the final segment is emitted.
+                if current == self.PAUSE:
+                    if not parked:
+                        # Flush so the words before the pause come back now,
+                        # not after playback resumes.
+                        await ws.flush()
+                        parked = used = True
+                        logger.info(f"[{mode}] parked")
+                    continue
+                if current == self.RESUME:
+                    parked = False
+                    continue
+
+                parked = False
+                await self._send(ws, current, span, got_result)
+                used = True
+            except Exception as e:
+                if not used:
+                    raise
+                logger.info(f"[{mode}] connection lost ({e}); reconnecting")
+                return False, current
+
+        if not receiver.done():
+            # Flush any buffered audio so the final segment is emitted.
+            await ws.flush()
+            # Give the receiver a moment to drain remaining transcripts.
+            await asyncio.sleep(2)
+        return True, None
+
+    async def _next_item(self, queue, receiver, timeout):
+        """Next queue item, or _EXPIRED on `timeout` or if the receiver
+        ended (the connection closed under us)."""
+        getter = asyncio.ensure_future(queue.get())
+        done, _ = await asyncio.wait(
+            {getter, receiver}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        if getter in done:
+            return getter.result()
+        getter.cancel()  # FrameQueue.get only takes an item once it returns
+        return self._EXPIRED
+
+    async def _send(self, ws, current, span, got_result):
+        """Send one audio frame, tracking the video span it belongs to."""
+        audio_b64, store, start, end = current
+        if store is not None and (
+            span[0] is not store or abs(start - span[2]) > TranscriptStore.TOLERANCE_SECONDS
+        ):
+            if span[0] is not None and span[2] > span[1]:
+                # Playback jumped with audio still awaiting its result:
+                # flush so that result is stored against the span it
+                # came from, not stretched across the gap.
+                got_result.clear()
                 await ws.flush()
-                # Give the receiver a moment to drain remaining transcripts.
-                await asyncio.sleep(2)
-            finally:
-                receiver.cancel()
-                logger.info(f"[{self.mode}] connection closed")
-
-    async def _receive(self, ws):
+                try:
+                    await asyncio.wait_for(got_result.wait(), self.SEEK_FLUSH_WAIT_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+            span[:] = [store, start, start]
+        await ws.transcribe(audio=audio_b64)
+        if store is not None:
+            span[2] = end
+
+    async def _receive(self, ws, mode, span, got_result):
         """Continuously read transcript messages and push them to the browser."""
         try:
             while True:
                 resp = await ws.recv()
                 text = _extract_text(resp)
                 if text and text.strip():
-                    logger.info(f"[{self.mode}] ✅ {text}")
-                    emit_streaming_result(self.sid, self.mode, text.strip())
+                    logger.info(f"[{mode}] ✅ {text}")
+                    emit_streaming_result(self.sid, mode, text.strip())
+                    if span[0] is not None:
+                        # Only now is the span servable from the store;
+                        # marking it on send would replay nothing for it
+                        # until this result arrived.
+                        span[0].add(span[1], span[2], text.strip())
+                        span[0].mark_covered(span[1], span[2])
+                        span[1] = span[2]
+                    got_result.set()
         except asyncio.CancelledError:
             pass
         except Exception as e:
-            logger.info(f"[{self.mode}] receiver ended: {e}")
+            logger.info(f"[{mode}] receiver ended: {e}")
 
 
-# Active streaming sessions keyed by (sid, mode)
+# Active streaming sessions keyed by sid; each holds that client's modes
 streaming_sessions = {}
 
+admission = AdmissionController(config.MAX_TOTAL_BACKLOG_FRAMES)
+if config.STREAM_QUEUE_POLICY not in FrameQueue.POLICIES:
+    raise ValueError(
+        f"STREAM_QUEUE_POLICY must be one of {FrameQueue.POLICIES}, not {config.STREAM_QUEUE_POLICY!r}"
+    )
+
+# The page sends ~1s frames; a longer reported span means playback jumped.
+MAX_FRAME_SPAN_SECONDS = 5
+
 
-def emit_streaming_result(sid, mode, text):
+def emit_to(sid, event, payload):
+    """Emit to a specific client from outside a Socket.IO handler."""
+    with app.app_context():
+        socketio.emit(event, payload, to=sid)
+
+
+def emit_streaming_result(sid, mode, text, replayed=False):
     """Emit a transcript/translation result to a specific client."""
     event = "transcription_result" if mode == "transcribe" else "translation_result"
-    with app.app_context():
-        socketio.emit(event, {"text": text}, to=sid)
+    payload = {"text": text}
+    if replayed:
+        payload["replayed"] = True
+    emit_to(sid, event, payload)
 
 
 @app.route("/")
@@ -154,6 +666,35 @@ def index():
     return resp
 
 
+@app.route("/metrics")
+def metrics():
+    """Prometheus text-format queue depths and overload counters."""
+    lines = [
+        "# HELP transcription_stream_queue_frames Audio frames waiting to be sent upstream.",
+        "# TYPE transcription_stream_queue_frames gauge",
+    ]
+    for sid, session in list(streaming_sessions.items()):
+        for mode, queue in list(session.channels.items()):
+            lines.append(
+                f'transcription_stream_queue_frames{{sid="{sid}",mode="{mode}"}} {queue.frames}'
+            )
+    gauges = [
+        ("transcription_sessions_active", "gauge", "Clients with a streaming session.",
+         len(streaming_sessions)),
+        ("transcription_backlog_frames", "gauge", "Audio frames queued across all sessions.",
+         admission.backlog()),
+        ("transcription_shed_frames_total", "counter",
+         f"Audio frames shed by full stream queues ({config.STREAM_QUEUE_POLICY}).",
+         admission.shed_frames),
+        ("transcription_streams_rejected_total", "counter",
+         "start_stream requests refused because the backlog was too large.",
+         admission.rejected),
+    ]
+    for name, kind, help_text, value in gauges:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+    return Response("\n".join(lines) + "\n", mimetype="text/plain")
+
+
 @socketio.on("connect")
 def handle_connect():
     """Handle client connection"""
@@ -165,11 +706,11 @@ def handle_connect():
 def handle_disconnect():
     """Handle client disconnection"""
     logger.info(f"Client disconnected: {request.sid}")
-    # Tear down any streaming sessions this client owned
-    for mode in ("transcribe", "translate"):
-        session = streaming_sessions.pop((request.sid, mode), None)
-        if session:
-            session.stop()
+    # Tear down the streaming session this client owned
+    session = streaming_sessions.pop(request.sid, None)
+    if session:
+        session.stop()
+    drop_transcript_stores(request.sid)
 
 
 @socketio.on("start_stream")
@@ -180,54 +721,99 @@ def handle_start_stream(data):
         emit("error", {"message": f"Unknown stream mode: {mode}"})
         return
 
-    key = (request.sid, mode)
-    if key in streaming_sessions:
-        return  # already running
+    session = streaming_sessions.get(request.sid)
+    if not (session and session.is_running(mode)) and not admission.admit():
+        logger.warning(
+            f"Refusing {mode} stream for {request.sid}: {admission.backlog()} frames backlogged"
+        )
+        emit("stream_rejected", {
+            "mode": mode, "message": "Server is overloaded - please try again in a moment"
+        })
+        return
 
     logger.info(f"Starting {mode} stream for {request.sid}")
-    session = StreamingSession(request.sid, mode)
-    streaming_sessions[key] = session
-    session.start()
+    if session is None or not session.start_mode(mode):
+        # No session yet, or its last mode just finished and it shut down.
+        session = StreamingSession(request.sid)
+        streaming_sessions[request.sid] = session
+        session.start()
+        session.start_mode(mode)
+    session.video_id = data.get("video_id") or None
 
 
 @socketio.on("stop_stream")
 def handle_stop_stream(data):
     """Close a streaming session for this client + mode."""
     mode = data.get("mode")
-    session = streaming_sessions.pop((request.sid, mode), None)
+    session = streaming_sessions.get(request.sid)
     if session:
         logger.info(f"Stopping {mode} stream for {request.sid}")
-        session.stop()
+        session.stop_mode(mode)
 
 
 @socketio.on("video_control")
 def handle_video_control(data):
-    """Handle video control events"""
+    """Park the client's streams while the video is paused; resume them on play"""
     action = data.get("action")
     timestamp = data.get("timestamp", 0)
 
     logger.info(f"Video {action} at {timestamp}s")
 
+    session = streaming_sessions.get(request.sid)
     if action == "play":
+        if session:
+            session.resume()
         emit("status", {"message": "Video playing - transcription active"})
     elif action == "pause":
+        if session:
+            session.pause()
         emit("status", {"message": "Video paused - transcription paused"})
 
 
+@socketio.on("audio_frame")
+def handle_audio_frame(data):
+    """Forward one uploaded audio frame into every mode this client has running."""
+    try:
+        audio_base64 = data.get("audio")
+        if not audio_base64:
+            return
+
+        session = streaming_sessions.get(request.sid)
+        if session is None:
+            # No active session — client may not have sent start_stream yet.
+            return
+
+        start, end = data.get("start"), data.get("end")
+        if not (
+            isinstance(start, (int, float))
+            and isinstance(end, (int, float))
+            and 0 <= start < end <= start + MAX_FRAME_SPAN_SECONDS
+        ):
+            # Missing, or the video was seeked mid-frame: the span is
+            # meaningless, so stream the audio without indexing it.
+            start = end = None
+        session.send_audio(audio_base64, start=start, end=end)
+
+    except Exception as e:
+        logger.error(f"Error forwarding audio frame: {e}")
+        emit("error", {"message": f"Processing error: {str(e)}"})
+
+
 @socketio.on("audio_chunk")
 def handle_audio_chunk(data):
-    """Forward an incoming audio chunk into the persistent transcription session."""
+    """Forward an audio chunk into the transcription stream only (older pages
+    that upload each mode's audio separately)."""
     try:
         audio_base64 = data.get("audio")
         if not audio_base64:
             return
 
-        session = streaming_sessions.get((request.sid, "transcribe"))
+        session = streaming_sessions.get(request.sid)
         if session is None:
             # No active session — client may not have sent start_stream yet.
             return
 
-        session.send_audio(audio_base64)
+        session.send_audio(audio_base64, mode="transcribe")
 
     except Exception as e:
         logger.error(f"Error forwarding audio chunk: {e}")
@@ -236,17 +822,17 @@ def handle_audio_chunk(data):
 
 @socketio.on("translation_chunk")
 def handle_translation_chunk(data):
-    """Forward an incoming audio chunk into the persistent translation session."""
+    """Forward an audio chunk into the translation stream only (older pages)."""
     try:
         audio_base64 = data.get("audio")
         if not audio_base64:
             return
 
-        session = streaming_sessions.get((request.sid, "translate"))
+        session = streaming_sessions.get(request.sid)
         if session is None:
             return
 
-        session.send_audio(audio_base64)
+        session.send_audio(audio_base64, mode="translate")
 
     except Exception as e:
         logger.error(f"Error forwarding translation chunk: {e}")
@@ -15,6 +15,24 @@ DEBUG = False
 # Streaming Settings
 API_LANGUAGE = "unknown"  # Options: "en-IN", "hi-IN", "unknown" (auto-detect)
 
+# Backpressure: audio frames (~1s each) queued per stream before shedding
+# kicks in, and how to shed: "drop_oldest" (lose the oldest audio),
+# "coalesce" (merge the new frame into the newest queued one, so upstream
+# catches up in fewer, larger sends) or "reject" (drop the new frame)
+STREAM_QUEUE_MAX_FRAMES = 30
+STREAM_QUEUE_POLICY = "drop_oldest"
+# New streams are refused while frames queued across all sessions exceed this
+MAX_TOTAL_BACKLOG_FRAMES = 300
+
+# How long a stream's connection is kept open while the video is paused, so
+# resuming within this window needs no reconnect; longer pauses close it
+PAUSE_STANDBY_SECONDS = 30
+
+# Transcript store (see TranscriptStore in app.py): how many videos' worth of
+# position-indexed transcripts to keep for replay after a seek, across all
+# connected clients
+TRANSCRIPT_STORE_MAX_VIDEOS = 16
+
 # Flask Configuration
 SECRET_KEY = "live_transcription_demo_secret_key"
 CORS_ALLOWED_ORIGINS = "*"
@@ -1,14 +1,19 @@
 import asyncio
 import base64
+import concurrent.futures
 import json
 import logging
+import random
+import re
 import threading
 import time
+import unicodedata
 import urllib.parse
+from collections import OrderedDict, deque
 
 import websockets
-from flask import Flask, render_template, request
-from flask_socketio import SocketIO, emit
+from flask import Flask, Response, render_template, request
+from flask_socketio import SocketIO, emit, join_room, leave_room
 from sarvamai import AsyncSarvamAI
 
 import config
@@ -33,7 +38,7 @@ REALTIME_WS_URL = "wss://api.sarvam.ai/speech-to-text-realtime/ws"
 # "od-IN" -- confirmed against both APIs' published schemas, this is a real
 # inconsistency between Sarvam's own APIs, not a typo on either side. Only
 # the realtime STT connection needs the override; the Translate API calls in
-# _translate() keep using "od-IN" (self.language_code / self.target_language
+# _translate() keep using "od-IN" (self.language_code / CaptionTrack.target_language
 # are never touched by this).
 STT_LANGUAGE_CODE_OVERRIDES = {"od-IN": "or-IN"}
 
@@ -78,13 +83,28 @@ def _build_realtime_url(language_code, mode):
     return f"{REALTIME_WS_URL}?{urllib.parse.urlencode(params)}"
 
 
-def _strip_wav_header(audio_b64):
-    """The browser sends each chunk as a full 44-byte-header WAV file (see
-    encodeWAV() in index.html), but the realtime endpoint's `encoding` /
-    `sample_rate` query params already declare the format, so `audio_input`
-    expects headerless PCM -- send the raw sample bytes only."""
-    raw = base64.b64decode(audio_b64)
-    return base64.b64encode(raw[44:]).decode("ascii")
+_AUDIO_INPUT_PREFIX = '{"event": "audio_input", "audio": "'
+_AUDIO_INPUT_SUFFIX = '"}'
+
+
+def _audio_input_message(pcm):
+    """Build the upstream `audio_input` event for a frame of raw PCM16 bytes.
+
+    The browser sends headerless little-endian PCM16 as a binary Socket.IO
+    event (see sendAudioChunk() in index.html), so this is the one and only
+    encode the audio goes through: base64's alphabet never needs JSON
+    escaping, so the encoded bytes are spliced straight into the message
+    instead of round-tripping through json.dumps.
+    """
+    return _AUDIO_INPUT_PREFIX + base64.b64encode(pcm).decode("ascii") + _AUDIO_INPUT_SUFFIX
+
+
+def _pcm_from_wav_b64(audio_b64):
+    """Legacy `audio_chunk` payloads are a base64 44-byte-header WAV file per
+    chunk (what older copies of index.html sent); the realtime endpoint's
+    `encoding`/`sample_rate` query params already declare the format, so
+    only the raw sample bytes after the header are forwarded."""
+    return memoryview(base64.b64decode(audio_b64))[44:]
 
 
 # mayura:v1's documented language set (Sarvam's Translate API reference lists
@@ -100,6 +120,161 @@ MAYURA_LANGUAGES = frozenset({
 })
 
 
+class TranslationCache:
+    """Process-wide LRU + TTL cache of Translate API results, with single-flight.
+
+    Keyed by (source, target, model, mode, normalized text), so a growing
+    partial that hasn't changed since the last call, or the same final
+    translated for many viewers of one stream, costs one API call. While a
+    key is being translated, concurrent requests for it await that one call
+    instead of issuing their own -- even from sessions on other
+    `session_loops`, since the in-flight handle is a thread-safe
+    concurrent.futures.Future. Failed or passthrough translations (None)
+    are handed to waiters but never cached, so the next caption retries.
+    """
+
+    def __init__(self, max_entries, ttl_seconds):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()  # key -> (expires_at, translated)
+        self._inflight = {}  # key -> concurrent.futures.Future
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key(source, target, model, mode, text):
+        normalized = unicodedata.normalize("NFC", " ".join(text.split()))
+        return (source, target, model, mode, normalized)
+
+    async def get_or_translate(self, key, translate):
+        """Return the cached translation for key, or await translate() once."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            pending = self._inflight.get(key)
+            leader = pending is None
+            if leader:
+                self.misses += 1
+                pending = self._inflight[key] = concurrent.futures.Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            # shield(): a waiter being cancelled must not cancel the shared call.
+            return await asyncio.shield(asyncio.wrap_future(pending))
+
+        result = None
+        try:
+            result = await translate()
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+                if result is not None:
+                    self._entries[key] = (time.monotonic() + self.ttl_seconds, result)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            pending.set_result(result)
+        return result
+
+
+translation_cache = TranslationCache(
+    config.TRANSLATION_CACHE_SIZE, config.TRANSLATION_CACHE_TTL_SECONDS
+)
+
+
+class LatencyMetrics:
+    """Process-wide latency samples for the caption pipeline, by stage.
+
+    Sampled sessions (see `config.METRICS_SAMPLE_RATE`) call `observe` from
+    whichever session loop they run on; `/metrics` renders the last
+    `window` samples of each stage as a Prometheus summary (p50/p95/p99,
+    plus all-time _sum/_count). Stages:
+
+    - ingest: browser audio chunk received -> sent upstream
+    - transcript_partial / transcript_final: oldest audio not yet reflected
+      in any transcript received -> the transcript event arriving
+    - final_after_flush: `flush` sent -> the next final arriving
+    - translate: one Translate lookup (cache hits included)
+    - caption: the audio behind a caption received -> the caption emitted
+    """
+
+    QUANTILES = (0.5, 0.95, 0.99)
+
+    def __init__(self, window):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}  # stage -> deque of recent seconds
+        self._totals = {}  # stage -> [sum, count]
+
+    def observe(self, stage, seconds):
+        with self._lock:
+            samples = self._samples.get(stage)
+            if samples is None:
+                samples = self._samples[stage] = deque(maxlen=self.window)
+                self._totals[stage] = [0.0, 0]
+            samples.append(seconds)
+            totals = self._totals[stage]
+            totals[0] += seconds
+            totals[1] += 1
+
+    def quantiles(self, stage):
+        with self._lock:
+            ordered = sorted(self._samples.get(stage, ()))
+        if not ordered:
+            return {}
+        return {
+            q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] for q in self.QUANTILES
+        }
+
+    def count(self, stage):
+        """All-time number of samples observed for `stage`."""
+        with self._lock:
+            return self._totals.get(stage, (0.0, 0))[1]
+
+    def render(self):
+        """Prometheus text exposition lines for every observed stage."""
+        lines = [
+            "# HELP caption_latency_seconds Caption pipeline latency by stage (recent window).",
+            "# TYPE caption_latency_seconds summary",
+        ]
+        with self._lock:
+            stages = sorted(self._totals)
+            totals = {stage: list(self._totals[stage]) for stage in stages}
+        for stage in stages:
+            for q, value in self.quantiles(stage).items():
+                lines.append(
+                    f'caption_latency_seconds{{stage="{stage}",quantile="{q}"}} {value:.6f}'
+                )
+            total, count = totals[stage]
+            lines.append(f'caption_latency_seconds_sum{{stage="{stage}"}} {total:.6f}')
+            lines.append(f'caption_latency_seconds_count{{stage="{stage}"}} {count}')
+        return lines
+
+
+latency_metrics = LatencyMetrics(config.METRICS_WINDOW)
+
+
+# A sentence boundary inside a growing partial: terminal punctuation
+# (including the Devanagari danda) followed by whitespace.
+_SENTENCE_BOUNDARY_RE = re.compile(r"(?<=[.!?\u0964\u0965])\s+")
+
+
+def split_settled_sentences(text):
+    """Split a growing partial into (complete sentences, unfinished tail).
+
+    The last piece is always treated as the tail, even if it already ends in
+    punctuation -- more words may still be appended to it.
+    """
+    parts = _SENTENCE_BOUNDARY_RE.split(text.strip())
+    return parts[:-1], parts[-1]
+
+
 def parse_caption_choice(raw_choice):
     """Map a frontend "Captions" dropdown value to (stt_mode, target_language).
 
@@ -126,6 +301,267 @@ def parse_caption_choice(raw_choice):
     return raw_choice or "transcribe", None
 
 
+# linear16 at sample_rate=16000 (see _build_realtime_url): 2 bytes/sample.
+PCM_BYTES_PER_SECOND = 16000 * 2
+
+
+class AudioFrameBuffer:
+    """Bounded jitter buffer between browser audio and the upstream socket.
+
+    Browser frames are appended as they arrive and handed to the sender
+    coalesced into frames of at least `target_bytes` (or whatever arrived
+    within `max_wait` when audio trickles in slower). While the upstream
+    socket is slow, `ws.send` blocks the sender and audio piles up here --
+    up to `max_buffered_bytes`, past which the *oldest* audio is dropped so
+    memory stays bounded and captions resume on current speech rather than
+    replaying a stale backlog. After a stall the backlog drains in frames of
+    up to `max_frame_bytes` instead of one upstream message per browser
+    chunk.
+
+    Only ever touched from the session's event loop.
+    """
+
+    def __init__(self, target_bytes, max_frame_bytes, max_buffered_bytes):
+        self.target_bytes = target_bytes
+        self.max_frame_bytes = max_frame_bytes
+        self.max_buffered_bytes = max_buffered_bytes
+        self.closed = False
+        self.dropped_bytes = 0
+        # When the oldest audio in the last frame from next_frame() reached
+        # the server (time.monotonic()), for latency metrics.
+        self.frame_arrival = None
+        self._buf = bytearray()
+        self._wake = asyncio.Event()
+        # (stream offset just past a pushed chunk, its arrival time), for
+        # the chunks still (partly) in _buf; offsets count every byte ever
+        # pushed, and _taken every byte sent or dropped off the front.
+        self._arrivals = deque()
+        self._pushed = 0
+        self._taken = 0
+
+    def push(self, pcm, arrival=None):
+        self._buf += pcm
+        self._pushed += len(pcm)
+        self._arrivals.append((self._pushed, arrival or time.monotonic()))
+        overflow = len(self._buf) - self.max_buffered_bytes
+        if overflow > 0:
+            overflow += overflow & 1  # keep whole 16-bit samples
+            del self._buf[:overflow]
+            self.dropped_bytes += overflow
+            self._take(overflow)
+        self._wake.set()
+
+    def _take(self, size):
+        self._taken += size
+        while self._arrivals and self._arrivals[0][0] <= self._taken:
+            self._arrivals.popleft()
+
+    def close(self):
+        self.closed = True
+        self._wake.set()
+
+    async def _wait(self):
+        self._wake.clear()
+        await self._wake.wait()
+
+    async def next_frame(self, max_wait):
+        """Return the next coalesced frame, or b"" once closed and drained."""
+        while not self._buf and not self.closed:
+            await self._wait()
+        deadline = time.monotonic() + max_wait
+        while len(self._buf) < self.target_bytes and not self.closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                await asyncio.wait_for(self._wait(), remaining)
+            except asyncio.TimeoutError:
+                break
+        size = min(len(self._buf), self.max_frame_bytes)
+        size -= size & 1
+        frame = bytes(self._buf[:size])
+        del self._buf[:size]
+        self.frame_arrival = self._arrivals[0][1] if self._arrivals else None
+        self._take(size)
+        return frame
+
+
+class AudioReplayBuffer:
+    """Ring buffer of the last `max_bytes` of PCM sent upstream.
+
+    When the upstream connection drops, whatever was in flight (and the
+    start of the utterance it belonged to) is replayed into the new
+    connection so the speech around the drop still gets captioned.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._buf = bytearray()
+
+    def append(self, pcm):
+        self._buf += pcm
+        overflow = len(self._buf) - self.max_bytes
+        if overflow > 0:
+            overflow += overflow & 1  # keep whole 16-bit samples
+            del self._buf[:overflow]
+
+    def frames(self, frame_bytes):
+        """Split the buffered audio into upstream-sized frames."""
+        data = bytes(self._buf)
+        return [data[i:i + frame_bytes] for i in range(0, len(data), frame_bytes)]
+
+    def __len__(self):
+        return len(self._buf)
+
+
+class FlushScheduler:
+    """Decides when to send `flush` on one upstream connection.
+
+    A flush force-finalizes whatever Saaras has recognized so far. It's
+    only worth sending while there is unfinalized speech, so instead of
+    flushing on a fixed cadence whenever audio happens to arrive, this
+    runs on its own timer and tracks the connection's VAD events:
+
+    - while speech is ongoing, flush once `interval()` has passed since the
+      last final (natural or flushed) -- a speaker who pauses often gets
+      finals from VAD alone and is never flushed;
+    - shortly after `vad.speech_end`, flush once if VAD didn't already
+      produce that segment's final;
+    - during silence (speech ended and finalized), never.
+
+    Until the first VAD event arrives it falls back to flushing every
+    `interval()` while audio is flowing, as before.
+    """
+
+    def __init__(self, interval, speech_end_grace):
+        self.interval = interval
+        self.speech_end_grace = speech_end_grace
+        self.speaking = None  # None until the first VAD event
+        self._pending_audio = False
+        self._last_settled = time.monotonic()  # last final or flush
+        self._speech_end_time = None
+        self._wake = asyncio.Event()
+
+    def audio_sent(self):
+        if not self._pending_audio:
+            self._start_pending()
+
+    def speech_started(self):
+        self.speaking = True
+        if not self._pending_audio:
+            self._start_pending()
+
+    def _start_pending(self):
+        # The interval counts from when there was first something to
+        # finalize, not from a final that came before a long silence.
+        self._pending_audio = True
+        self._last_settled = max(self._last_settled, time.monotonic())
+        self._wake.set()
+
+    def speech_ended(self):
+        self.speaking = False
+        self._speech_end_time = time.monotonic()
+        self._wake.set()
+
+    def final_received(self):
+        self._settle(time.monotonic())
+
+    def _settle(self, now):
+        self._last_settled = now
+        if self.speaking is not True:
+            # Audio after this is silence (VAD) or unknown; either way
+            # nothing is waiting on a flush until more arrives.
+            self._pending_audio = False
+        self._wake.set()
+
+    def next_delay(self, now):
+        """Seconds until the next flush is due, or None if none is."""
+        if not self._pending_audio:
+            return None
+        if self.speaking is False:
+            if self._last_settled >= self._speech_end_time:
+                return None
+            return self._speech_end_time + self.speech_end_grace - now
+        return self._last_settled + self.interval() - now
+
+    async def run(self, send_flush):
+        while True:
+            delay = self.next_delay(time.monotonic())
+            if delay is not None and delay <= 0:
+                await send_flush()
+                self._settle(time.monotonic())
+                continue
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+
+class SessionLoopPool:
+    """A small, fixed set of asyncio loops shared by every CaptionSession.
+
+    Each loop runs forever on its own daemon thread and hosts any number of
+    sessions as plain tasks, so the thread count stays at `size` no matter
+    how many viewers are connected. A session's sid picks its loop, so all of
+    one client's work always lands on the same thread. Loops start lazily on
+    first use rather than at import.
+    """
+
+    def __init__(self, size):
+        self.size = max(1, size)
+        self._loops = []
+        self._lock = threading.Lock()
+
+    def _start(self):
+        for i in range(self.size):
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=self._run_forever, args=(loop,), name=f"caption-loop-{i}", daemon=True
+            )
+            thread.start()
+            self._loops.append(loop)
+
+    @staticmethod
+    def _run_forever(loop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def loop_for(self, sid):
+        with self._lock:
+            if not self._loops:
+                self._start()
+        return self._loops[hash(sid) % self.size]
+
+
+session_loops = SessionLoopPool(config.SESSION_LOOP_THREADS)
+
+
+class CaptionTrack:
+    """One caption output of a CaptionSession: a target language and where
+    to emit it (a socket id, or a Socket.IO room shared by many viewers).
+
+    `target_language=None` is the STT output as-is. Each track keeps its own
+    partial-translation throttle and settled-sentence state, so adding a
+    second language to a broadcast doesn't slow down the first.
+    """
+
+    def __init__(self, target_language, to):
+        self.target_language = target_language
+        self.to = to
+        # time.monotonic() is an arbitrary-epoch clock (often seconds since
+        # boot, not since this session) -- seeding this at 0.0 made
+        # `now - 0.0 >= PARTIAL_TRANSLATE_INTERVAL_SECONDS` true on the very
+        # first partial, firing a translate call on a 1-2 word fragment
+        # before there's enough text for reliable language detection. Seed
+        # it when the track starts instead so the interval is measured from here.
+        self.last_partial_translate_time = time.monotonic()
+        self.partial_translate_inflight = False
+        # (utterance_idx, [(source_sentence, translation), ...]) for the
+        # settled prefix of the partial currently being translated.
+        self.settled_translations = (None, [])
+
+
 class CaptionSession:
     """One persistent saaras:v3-realtime connection for a single browser tab.
 
@@ -137,24 +573,40 @@ class CaptionSession:
     either from the UI tears down the old connection and opens a fresh one
     rather than reconfiguring it mid-stream.
 
-    A dedicated asyncio loop runs in a background thread: one task pulls
-    audio frames off a queue and forwards them, another loops on recv() and
-    pushes captions back to the browser as they arrive.
+    The session runs as tasks on one of the shared `session_loops` rather
+    than on a loop and thread of its own: one task pulls coalesced audio
+    frames off a bounded jitter buffer (AudioFrameBuffer) and forwards them,
+    another loops on recv() and pushes captions back to the browser as they
+    arrive. `send_audio`/`stop` are called from Socket.IO handler threads and
+    hand work to that loop thread-safely.
 
     Two things keep captions feeling live rather than laggy: `endpointing=vad`
     (the default) tells Saaras to end a speech segment (and finalize its
-    transcript) on a natural pause, and a periodic `flush` event forces out
-    whatever's been recognized so far every couple of seconds even during
-    continuous, pause-free speech.
+    transcript) on a natural pause, and a timer-driven `flush` (see
+    FlushScheduler) forces out whatever's been recognized so far every
+    couple of seconds during continuous, pause-free speech -- and not at
+    all during silence.
+
+    A connection that drops mid-session is reopened with exponential
+    backoff (see `_run`), primed with the last couple of seconds of audio
+    so the speech around the drop isn't lost; finals that replay re-produces
+    are de-duplicated by utterance_idx and text.
 
     If `target_language` is set, Saaras runs in plain "transcribe" mode and
     each finalized line is additionally translated into that language via
     the Translate API before being sent to the browser -- see
     `parse_caption_choice` and `_translate`.
+
+    Output goes to one or more CaptionTracks. A normal session has a single
+    track addressed to its own tab; a broadcast session (`room=...`, see
+    BroadcastRoom) starts with none and gains one per target language its
+    viewers ask for, each emitted once to a Socket.IO room rather than once
+    per viewer.
     """
 
-    # How often to force-finalize the current segment during continuous
-    # speech, so a caption shows up even if the speaker never pauses.
+    # How long continuous speech may go without a final before the current
+    # segment is force-finalized, so a caption shows up even if the speaker
+    # never pauses. Measured from the last final, not on a fixed cadence.
     FLUSH_INTERVAL_SECONDS = 1.5
 
     # The cross-language translate hop (_translate) does noticeably better
@@ -174,108 +626,284 @@ class CaptionSession:
     # Lowered from 2.5s -- translated captions were noticeably laggier than
     # native ones, and the Translate API round trip (~0.3-0.5s) leaves
     # enough headroom below this that overlapping calls stay rare even at
-    # this tighter interval (see _partial_translate_inflight guard).
+    # this tighter interval (see CaptionTrack.partial_translate_inflight).
     PARTIAL_TRANSLATE_INTERVAL_SECONDS = 1.5
 
-    def __init__(self, sid, language_code, mode, target_language=None):
+    # Translate growing partials sentence by sentence, re-using the
+    # translations of sentences already settled earlier in the same
+    # utterance (see _translate_incremental). Without this every partial
+    # re-sends the whole utterance so far, so each call on a long monologue
+    # is slower and costlier than the last.
+    INCREMENTAL_PARTIAL_TRANSLATION = True
+
+    # Upstream audio_input frames are coalesced to at least this much audio
+    # (or whatever arrived within it), rather than one message per browser
+    # chunk however small.
+    FRAME_TARGET_MS = 100
+
+    # Largest single audio_input frame, used when draining a backlog after
+    # the upstream socket stalled.
+    MAX_FRAME_MS = 400
+
+    # After vad.speech_end, how long to wait for Saaras's own final before
+    # flushing the segment out explicitly.
+    SPEECH_END_FLUSH_GRACE_SECONDS = 0.4
+
+    # Audio buffered beyond this while upstream is slow is dropped, oldest
+    # first -- captions that far behind live speech aren't worth catching up.
+    MAX_BUFFERED_AUDIO_SECONDS = 3.0
+
+    # A dropped upstream connection is reopened up to this many times in a
+    # row, waiting RECONNECT_BACKOFF_BASE_SECONDS * 2^attempt (capped, with
+    # jitter) between tries. The count resets once a connection opens, so a
+    # long session survives any number of isolated hiccups.
+    RECONNECT_MAX_ATTEMPTS = 5
+    RECONNECT_BACKOFF_BASE_SECONDS = 0.5
+    RECONNECT_BACKOFF_MAX_SECONDS = 8.0
+
+    # How much already-sent audio is replayed into a reopened connection, so
+    # speech in flight when the old one dropped is still captioned. Finals
+    # it re-produces are de-duplicated (see _is_duplicate_final).
+    REPLAY_AUDIO_SECONDS = 2.0
+
+    def __init__(self, sid, language_code, mode, target_language=None, room=None):
         self.sid = sid
         self.language_code = language_code
         self.mode = mode
-        self.target_language = target_language
+        self.room = room
+        # Keyed by target language (None = untranslated). Only ever touched
+        # on self.loop -- handler threads go through add_track/remove_track.
+        self.tracks = {} if room else {target_language: CaptionTrack(target_language, sid)}
         self.client = None
-        self.loop = asyncio.new_event_loop()
-        self.queue = asyncio.Queue()
-        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.loop = session_loops.loop_for(sid)
+        # Created on the loop itself (see _enqueue) -- asyncio primitives made
+        # here, on a Socket.IO handler thread, bind to the wrong loop on
+        # older Pythons.
+        self.audio = None
+        self.flusher = None  # per connection, see _session
+        # Whether this session's pipeline timings go into latency_metrics.
+        self.sampled = random.random() < config.METRICS_SAMPLE_RATE
+        # Arrival time of the oldest audio sent since the last transcript
+        # event, and when the last flush went out (latency metrics).
+        self._unreflected_audio_at = None
+        self._reflected_audio_at = None
+        self._flush_sent_at = None
+        self.replay = AudioReplayBuffer(int(PCM_BYTES_PER_SECOND * self.REPLAY_AUDIO_SECONDS))
         self._stopped = False
-        # time.monotonic() is an arbitrary-epoch clock (often seconds since
-        # boot, not since this session) -- seeding this at 0.0 made
-        # `now - 0.0 >= PARTIAL_TRANSLATE_INTERVAL_SECONDS` true on the very
-        # first partial, firing a translate call on a 1-2 word fragment
-        # before there's enough text for reliable language detection. Seed
-        # it at session start instead so the interval is measured from here.
-        self._last_partial_translate_time = time.monotonic()
-        self._partial_translate_inflight = False
+        self._connected = False  # has any upstream connection opened yet
+        self._reconnect_attempt = 0
+        self._fatal_error = None
+        # Saaras numbers utterances from 0 on every connection; captions use
+        # utterance_idx + _utterance_base so indices stay unique (and
+        # de-duplicable) across reconnects.
+        self._utterance_base = 0
+        self._next_utterance_idx = 0
+        self._recent_finals = deque(maxlen=16)  # (utterance_idx, normalized text)
+        self._replaying = False
 
     def start(self):
-        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self._run(), self.loop)
 
-    def send_audio(self, audio_b64):
+    def send_audio(self, pcm):
+        """Queue a frame of raw 16kHz mono PCM16 bytes for the upstream socket."""
         if self._stopped:
             return
         try:
-            asyncio.run_coroutine_threadsafe(self.queue.put(audio_b64), self.loop)
+            self.loop.call_soon_threadsafe(self._enqueue, pcm, time.monotonic())
         except RuntimeError:
-            self._stopped = True  # loop died (e.g. connection never opened)
+            self._stopped = True  # loop closed (interpreter shutting down)
 
     def stop(self):
         if self._stopped:
             return
         self._stopped = True
         try:
-            asyncio.run_coroutine_threadsafe(self.queue.put(None), self.loop)
+            self.loop.call_soon_threadsafe(self._enqueue, None)
         except RuntimeError:
-            pass  # loop already dead, nothing to stop
+            pass  # loop already closed, nothing to stop
+
+    def add_track(self, target_language, to):
+        """Start emitting captions in `target_language` to `to`."""
+        self._call_on_loop(self._add_track, target_language, to)
 
-    def _run(self):
-        asyncio.set_event_loop(self.loop)
+    def remove_track(self, target_language):
+        self._call_on_loop(self.tracks.pop, target_language, None)
+
+    def _add_track(self, target_language, to):
+        if target_language not in self.tracks:
+            self.tracks[target_language] = CaptionTrack(target_language, to)
+
+    def _call_on_loop(self, callback, *args):
+        if self._stopped:
+            return
         try:
-            self.loop.run_until_complete(self._session())
-        except Exception as e:
-            logger.error(f"[{self.sid}] session loop error: {e}")
-            self._stopped = True
+            self.loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # loop closed (interpreter shutting down)
+
+    def _flush_interval(self):
+        if any(target for target in self.tracks):
+            return self.FLUSH_INTERVAL_TRANSLATE_SECONDS
+        return self.FLUSH_INTERVAL_SECONDS
+
+    def _emit(self, event, payload, to):
+        with app.app_context():
+            socketio.emit(event, payload, to=to)
+
+    def _emit_error(self, message):
+        """Errors go to the producing tab and to everyone watching it."""
+        for to in {self.sid, *(track.to for track in self.tracks.values())}:
+            self._emit("error", {"message": message}, to)
+
+    def _new_audio_buffer(self):
+        return AudioFrameBuffer(
+            target_bytes=PCM_BYTES_PER_SECOND * self.FRAME_TARGET_MS // 1000,
+            max_frame_bytes=PCM_BYTES_PER_SECOND * self.MAX_FRAME_MS // 1000,
+            max_buffered_bytes=int(PCM_BYTES_PER_SECOND * self.MAX_BUFFERED_AUDIO_SECONDS),
+        )
+
+    def _enqueue(self, pcm, arrival=None):
+        """Runs on self.loop. Audio sent before _session() starts waits here;
+        None closes the buffer (stop)."""
+        if self.audio is None:
+            self.audio = self._new_audio_buffer()
+        if pcm is None:
+            self.audio.close()
+        else:
+            self.audio.push(pcm, arrival)
+
+    def _observe(self, stage, since):
+        if self.sampled and since is not None:
+            latency_metrics.observe(stage, time.monotonic() - since)
+
+    async def _send_flush(self, ws):
+        await ws.send(json.dumps({"event": "flush"}))
+        self._flush_sent_at = time.monotonic()
+
+    def _emit_caption(self, track, text, audio_at):
+        self._emit("caption", {"text": text}, track.to)
+        self._observe("caption", audio_at)
+
+    async def _run(self):
+        while True:
+            try:
+                await self._session()
+                return
+            except Exception as e:
+                error = e
+            if self._stopped:
+                logger.info(f"[{self.sid}] connection ended while stopping: {error}")
+                return
+            # Only reconnect a session that was actually up: a first connect
+            # failing (bad key, beta flag missing) won't fix itself, and
+            # neither will a connection the server closed as fatal.
+            attempt = self._reconnect_attempt
+            if not self._connected or self._fatal_error or attempt >= self.RECONNECT_MAX_ATTEMPTS:
+                break
+            delay = min(
+                self.RECONNECT_BACKOFF_MAX_SECONDS,
+                self.RECONNECT_BACKOFF_BASE_SECONDS * 2 ** attempt,
+            ) * random.uniform(0.5, 1.0)
+            self._reconnect_attempt += 1
+            logger.warning(
+                f"[{self.sid}] upstream connection lost ({error}); reconnecting in "
+                f"{delay:.1f}s (attempt {attempt + 1}/{self.RECONNECT_MAX_ATTEMPTS})"
+            )
+            for track in list(self.tracks.values()):
+                self._emit("status", {"message": "Reconnecting captions..."}, track.to)
+            # Audio keeps arriving in self.audio meanwhile (bounded), and
+            # the new connection is primed from self.replay.
+            await asyncio.sleep(delay)
+            if self._stopped:
+                return
+
+        logger.error(f"[{self.sid}] session error: {error}")
+        self._stopped = True
+        if caption_sessions.get(self.sid) is self:
             caption_sessions.pop(self.sid, None)
-            with app.app_context():
-                socketio.emit(
-                    "error", {"message": f"Captioning failed to start: {e}"}, to=self.sid
-                )
-        finally:
-            self.loop.close()
+        if self._fatal_error is None:  # a fatal stream error was already reported
+            prefix = "Captioning connection lost" if self._connected else "Captioning failed to start"
+            self._emit_error(f"{prefix}: {error}")
+        if self.room:
+            end_broadcast(self.room, self)
 
     async def _session(self):
-        self.client = AsyncSarvamAI(api_subscription_key=SARVAM_API_KEY)
+        if self.audio is None:
+            self.audio = self._new_audio_buffer()
+        if self.client is None:
+            self.client = AsyncSarvamAI(api_subscription_key=SARVAM_API_KEY)
         url = _build_realtime_url(self.language_code, self.mode)
         logger.info(
             f"[{self.sid}] opening realtime streaming connection (language={self.language_code}, "
-            f"mode={self.mode}, target_language={self.target_language})"
+            f"mode={self.mode}, room={self.room}, tracks={list(self.tracks)})"
         )
 
         async with websockets.connect(
             url, additional_headers={"API-SUBSCRIPTION-KEY": SARVAM_API_KEY}
         ) as ws:
             logger.info(f"[{self.sid}] connected")
+            reconnected = self._connected
+            self._connected = True
+            self._reconnect_attempt = 0
+            self._utterance_base = self._next_utterance_idx
+            self.flusher = FlushScheduler(
+                self._flush_interval, self.SPEECH_END_FLUSH_GRACE_SECONDS
+            )
             receiver = asyncio.create_task(self._receive(ws))
+            # Force out whatever's been recognized so far during long,
+            # continuous speech, rather than waiting for the speaker to
+            # pause or for the stream to end -- see FlushScheduler.
+            flusher = asyncio.create_task(self.flusher.run(lambda: self._send_flush(ws)))
             try:
-                flush_interval = (
-                    self.FLUSH_INTERVAL_TRANSLATE_SECONDS
-                    if self.target_language
-                    else self.FLUSH_INTERVAL_SECONDS
-                )
-                last_flush = time.monotonic()
+                if reconnected:
+                    # Prime the new connection with the audio around the
+                    # drop; finals it re-produces are skipped in _receive.
+                    self._replaying = True
+                    frames = self.replay.frames(
+                        PCM_BYTES_PER_SECOND * self.MAX_FRAME_MS // 1000
+                    )
+                    for frame in frames:
+                        await ws.send(_audio_input_message(frame))
+                    logger.info(
+                        f"[{self.sid}] reconnected; replayed "
+                        f"{len(self.replay) * 1000 // PCM_BYTES_PER_SECOND}ms of audio"
+                    )
+                    for track in list(self.tracks.values()):
+                        self._emit("status", {"message": "Captioning..."}, track.to)
+                reported_drops = 0
                 while True:
-                    audio_b64 = await self.queue.get()
-                    if audio_b64 is None:  # stop sentinel
-                        break
-                    await ws.send(json.dumps({
-                        "event": "audio_input",
-                        "audio": _strip_wav_header(audio_b64),
-                    }))
-
-                    # Force out whatever's been recognized so far every couple
-                    # of seconds, rather than waiting for the speaker to pause
-                    # or for the stream to end -- this is what keeps captions
-                    # showing up during a long, continuous sentence.
-                    now = time.monotonic()
-                    if now - last_flush >= flush_interval:
-                        await ws.send(json.dumps({"event": "flush"}))
-                        last_flush = now
+                    frame = await self.audio.next_frame(self.FRAME_TARGET_MS / 1000)
+                    if not frame:
+                        if self.audio.closed:
+                            break
+                        continue
+                    # Recorded before sending, so a frame lost with the
+                    # connection is replayed into the next one.
+                    self.replay.append(frame)
+                    # Awaiting the send is the backpressure: while upstream
+                    # is slow, new audio accumulates (bounded) in self.audio.
+                    await ws.send(_audio_input_message(frame))
+                    self.flusher.audio_sent()
+                    self._observe("ingest", self.audio.frame_arrival)
+                    if self._unreflected_audio_at is None:
+                        self._unreflected_audio_at = self.audio.frame_arrival
+
+                    if self.audio.dropped_bytes != reported_drops:
+                        reported_drops = self.audio.dropped_bytes
+                        logger.warning(
+                            f"[{self.sid}] upstream too slow; dropped "
+                            f"{reported_drops * 1000 // PCM_BYTES_PER_SECOND}ms of audio so far"
+                        )
 
                 # Flush any buffered audio so the final segment is emitted,
                 # then tell the server this session is done.
+                flusher.cancel()
                 await ws.send(json.dumps({"event": "flush"}))
                 await ws.send(json.dumps({"event": "end"}))
                 # Give the receiver a moment to drain remaining captions.
                 await asyncio.sleep(1.5)
             finally:
+                flusher.cancel()
                 receiver.cancel()
                 logger.info(f"[{self.sid}] connection closed")
 
@@ -292,11 +920,12 @@ class CaptionSession:
                 if event == "error":
                     message = msg.get("message") or str(msg)
                     logger.error(f"[{self.sid}] stream error ({msg.get('code')}): {message}")
-                    with app.app_context():
-                        socketio.emit(
-                            "error", {"message": f"Captioning error: {message}"}, to=self.sid
-                        )
+                    self._emit_error(f"Captioning error: {message}")
                     if msg.get("is_fatal"):
+                        # Closing makes the sender's next send fail, and
+                        # _run won't reconnect into the same error.
+                        self._fatal_error = message
+                        await ws.close()
                         break
                     continue
 
@@ -306,15 +935,42 @@ class CaptionSession:
                 if event == "session.end":
                     logger.info(f"[{self.sid}] session ended: {msg}")
                     continue
+                if event == "vad.speech_start":
+                    self.flusher.speech_started()
+                    # Audio before this was silence; latency counts from
+                    # the next frame sent.
+                    self._unreflected_audio_at = None
+                    continue
+                if event == "vad.speech_end":
+                    self.flusher.speech_ended()
+                    continue
                 if event not in ("transcript.partial", "transcript.final"):
-                    continue  # vad.speech_start/end, config.updated, pong -- nothing to show
+                    continue  # config.updated, pong -- nothing to show
 
                 text = (msg.get("text") or "").strip()
                 if not text:
                     continue
 
+                # The caption's audio arrived no later than the oldest audio
+                # sent since the previous transcript event; with nothing new
+                # sent since (a final right after its partial), it's the
+                # same audio that event reflected.
+                if self._unreflected_audio_at is not None:
+                    self._reflected_audio_at = self._unreflected_audio_at
+                    self._unreflected_audio_at = None
+                    self._observe(event.replace(".", "_"), self._reflected_audio_at)
+                audio_at = self._reflected_audio_at
+                if event == "transcript.final" and self._flush_sent_at is not None:
+                    self._observe("final_after_flush", self._flush_sent_at)
+                    self._flush_sent_at = None
+
+                utterance_idx = msg.get("utterance_idx")
+                if utterance_idx is not None:
+                    utterance_idx += self._utterance_base
+                    self._next_utterance_idx = max(self._next_utterance_idx, utterance_idx + 1)
+
                 logger.debug(
-                    f"[{self.sid}] {event} utterance_idx={msg.get('utterance_idx')} "
+                    f"[{self.sid}] {event} utterance_idx={utterance_idx} "
                     f"len={len(text)} text={text!r}"
                 )
 
@@ -329,9 +985,10 @@ class CaptionSession:
                     # long-lived wrong-language caption would. A translated
                     # mode session would rather wait the ~1-2s for real
                     # translated text than show anything untranslated.
-                    if not self.target_language:
-                        with app.app_context():
-                            socketio.emit("caption", {"text": text}, to=self.sid)
+                    tracks = list(self.tracks.values())
+                    for track in tracks:
+                        if not track.target_language:
+                            self._emit_caption(track, text, audio_at)
 
                     # For translated mode, ALSO periodically translate the
                     # growing partial itself rather than only ever
@@ -347,13 +1004,16 @@ class CaptionSession:
                     # it's more likely to just echo the text back unchanged
                     # (see the passthrough check in _translate_and_emit) --
                     # wait for a bit more context before spending a call on it.
-                    if (
-                        self.target_language
-                        and not self._partial_translate_inflight
-                        and len(text.split()) >= 3
-                    ):
-                        now = time.monotonic()
-                        if now - self._last_partial_translate_time >= self.PARTIAL_TRANSLATE_INTERVAL_SECONDS:
+                    if len(text.split()) < 3:
+                        continue
+                    now = time.monotonic()
+                    for track in tracks:
+                        if (
+                            track.target_language
+                            and not track.partial_translate_inflight
+                            and now - track.last_partial_translate_time
+                            >= self.PARTIAL_TRANSLATE_INTERVAL_SECONDS
+                        ):
                             # Only _translate_partial_and_emit resets this
                             # timestamp, and only when a translation actually
                             # came back (not a passthrough skip) -- a
@@ -363,12 +1023,21 @@ class CaptionSession:
                             # extra seconds of visible delay before anything
                             # ever shows up.
                             asyncio.create_task(
-                                self._translate_partial_and_emit(text, self.language_code)
+                                self._translate_partial_and_emit(
+                                    track, text, self.language_code, utterance_idx, audio_at
+                                )
                             )
                     continue
 
                 # transcript.final
-                if self.target_language:
+                self.flusher.final_received()
+                if self._is_duplicate_final(utterance_idx, text):
+                    logger.debug(f"[{self.sid}] skipping duplicate final {utterance_idx}")
+                    continue
+                for track in list(self.tracks.values()):
+                    if not track.target_language:
+                        self._emit_caption(track, text, audio_at)
+                        continue
                     # Translate in the background instead of awaiting it here.
                     # Awaiting it inline would block this loop from reading
                     # the *next* STT message until the Translate API round
@@ -391,39 +1060,105 @@ class CaptionSession:
                     # correct) or "unknown", which _translate() below
                     # already turns into a proper source_language_code="auto"
                     # for mayura:v1 -- far more reliable than Saaras's guess.
-                    asyncio.create_task(self._translate_and_emit(text, self.language_code))
-                else:
-                    with app.app_context():
-                        socketio.emit("caption", {"text": text}, to=self.sid)
+                    #
+                    # Each target language is translated once per final no
+                    # matter how many viewers are subscribed to it.
+                    track.settled_translations = (None, [])
+                    asyncio.create_task(
+                        self._translate_and_emit(track, text, self.language_code, audio_at)
+                    )
         except asyncio.CancelledError:
             pass
         except Exception as e:
             logger.info(f"[{self.sid}] receiver ended: {e}")
 
-    async def _translate_and_emit(self, text, source_language_code):
-        translated = await self._translate(text, source_language_code)
+    def _is_duplicate_final(self, utterance_idx, text):
+        """True for a final that was already shown: the same utterance_idx
+        and text again, or -- while the audio replayed after a reconnect is
+        being re-recognized -- text already covered by a recent final."""
+        normalized = " ".join(text.lower().split())
+        if (utterance_idx, normalized) in self._recent_finals:
+            return True
+        if self._replaying:
+            if any(normalized in seen for _, seen in self._recent_finals):
+                return True
+            # First genuinely new final: the replayed audio is behind us.
+            self._replaying = False
+        self._recent_finals.append((utterance_idx, normalized))
+        return False
+
+    async def _translate_and_emit(self, track, text, source_language_code, audio_at=None):
+        translated = await self._translate(text, source_language_code, track.target_language)
         if translated is None:
             return  # skip rather than show an untranslated/wrong-language line
-        with app.app_context():
-            socketio.emit("caption", {"text": translated}, to=self.sid)
+        self._emit_caption(track, translated, audio_at)
 
-    async def _translate_partial_and_emit(self, text, source_language_code):
+    async def _translate_partial_and_emit(
+        self, track, text, source_language_code, utterance_idx=None, audio_at=None
+    ):
         """Same as _translate_and_emit, but for a not-yet-finalized partial --
         guards against overlapping calls piling up if the Translate API is
         slower than PARTIAL_TRANSLATE_INTERVAL_SECONDS."""
-        self._partial_translate_inflight = True
+        track.partial_translate_inflight = True
         try:
-            translated = await self._translate(text, source_language_code)
+            if self.INCREMENTAL_PARTIAL_TRANSLATION:
+                translated = await self._translate_incremental(
+                    track, text, source_language_code, utterance_idx
+                )
+            else:
+                translated = await self._translate(
+                    text, source_language_code, track.target_language
+                )
             if translated is None:
-                return  # don't reset _last_partial_translate_time -- retry on the next partial instead of waiting out a fresh cooldown
-            self._last_partial_translate_time = time.monotonic()
-            with app.app_context():
-                socketio.emit("caption", {"text": translated}, to=self.sid)
+                return  # don't reset last_partial_translate_time -- retry on the next partial instead of waiting out a fresh cooldown
+            track.last_partial_translate_time = time.monotonic()
+            self._emit_caption(track, translated, audio_at)
         finally:
-            self._partial_translate_inflight = False
+            track.partial_translate_inflight = False
 
-    async def _translate(self, text, source_language_code):
-        """Translate a caption line (partial or final) into self.target_language.
+    async def _translate_incremental(self, track, text, source_language_code, utterance_idx):
+        """Translate a growing partial, only sending what changed since last time.
+
+        Complete sentences at the front of the partial are translated once
+        and remembered for this utterance_idx; later calls only translate
+        sentences that settled since, plus the unfinished tail, and stitch
+        the pieces together. If Saaras revises an earlier sentence, the
+        remembered prefix is cut back to where the text still matches.
+        Returns None if nothing could be translated.
+        """
+        sentences, tail = split_settled_sentences(text)
+        idx, settled = track.settled_translations
+        if idx != utterance_idx:
+            settled = []
+        keep = 0
+        while keep < min(len(settled), len(sentences)) and settled[keep][0] == sentences[keep]:
+            keep += 1
+        settled = settled[:keep]
+
+        fresh = sentences[keep:]
+        results = await asyncio.gather(
+            *(
+                self._translate(part, source_language_code, track.target_language)
+                for part in fresh + [tail]
+            )
+        )
+        # Only an unbroken run of successes extends the settled prefix; a
+        # sentence that failed is retried on the next partial.
+        for sentence, translated in zip(fresh, results):
+            if translated is None:
+                break
+            settled.append((sentence, translated))
+        track.settled_translations = (utterance_idx, settled)
+
+        # Show the translated prefix, and the tail only if nothing before it
+        # failed -- skipping a sentence would silently drop it mid-caption.
+        pieces = [translated for _, translated in settled]
+        if len(settled) - keep == len(fresh) and results[-1] is not None:
+            pieces.append(results[-1])
+        return " ".join(pieces) or None
+
+    async def _translate(self, text, source_language_code, target):
+        """Translate a caption line (partial or final) into `target`.
 
         Picks the Translate model based on the target language rather than
         hardcoding mayura:v1: mayura:v1 only covers 11 languages (see
@@ -434,8 +1169,11 @@ class CaptionSession:
         None instead of showing it, since a stray line in the wrong language
         reads as "the translation isn't working" just as much as no caption
         at all would.
+
+        Calls go through the process-wide `translation_cache`, so repeated
+        text (an unchanged partial, or one final seen by many viewers) is
+        translated once.
         """
-        target = self.target_language
         use_mayura = target in MAYURA_LANGUAGES
 
         if use_mayura:
@@ -464,6 +1202,16 @@ class CaptionSession:
                 return None
             source = source_language_code
 
+        key = TranslationCache.key(source, target, model, mode, text)
+        started = time.monotonic()
+        translated = await translation_cache.get_or_translate(
+            key, lambda: self._call_translate(text, source, target, model, mode)
+        )
+        self._observe("translate", started)
+        return translated
+
+    async def _call_translate(self, text, source, target, model, mode):
+        """One Translate API call. Returns None on failure or an unchanged echo."""
         try:
             kwargs = dict(
                 input=text,
@@ -497,9 +1245,108 @@ class CaptionSession:
 # Active caption sessions keyed by socket session id. One per client: unlike
 # examples/Live_Video_Transcription this UI shows a single caption track at a
 # time, so a new start_stream simply replaces whatever was running before.
+# A broadcast's producer is registered here too (see BroadcastRoom), so its
+# audio and stop_stream go through the same handlers; viewers are not.
 caption_sessions = {}
 
 
+class BroadcastRoom:
+    """One producer's CaptionSession shared by every viewer of a broadcast.
+
+    The producer's tab streams audio into a single upstream connection;
+    viewers only subscribe. Each distinct caption choice among the viewers
+    becomes one CaptionTrack emitting to a Socket.IO room (`channel`), so
+    STT runs once per broadcast and each translation once per language,
+    however many people are watching. Mutated only under `broadcasts_lock`.
+    """
+
+    def __init__(self, name, producer_sid):
+        self.name = name
+        self.producer_sid = producer_sid
+        self.session = None
+        self.viewers = {}  # sid -> target_language (None = STT output as-is)
+
+    def channel(self, target_language):
+        return f"broadcast:{self.name}:{target_language or 'source'}"
+
+    def start(self, language_code, stt_mode):
+        """(Re)open the upstream session, keeping every viewer's track."""
+        if self.session:
+            self.session.stop()
+        self.session = CaptionSession(self.producer_sid, language_code, stt_mode, room=self.name)
+        for target_language in set(self.viewers.values()):
+            self.session.add_track(target_language, self.channel(target_language))
+        self.session.start()
+        return self.session
+
+    def subscribe(self, sid, target_language):
+        """Point `sid` at `target_language`'s track. Returns the channel it
+        should leave (or None) and the channel it should join."""
+        left = self.unsubscribe(sid)
+        if target_language not in self.viewers.values():
+            self.session.add_track(target_language, self.channel(target_language))
+        self.viewers[sid] = target_language
+        return left, self.channel(target_language)
+
+    def unsubscribe(self, sid):
+        """Drop `sid`; its track goes too once nobody else is watching it.
+        Returns the channel it was in, or None."""
+        if sid not in self.viewers:
+            return None
+        target_language = self.viewers.pop(sid)
+        if target_language not in self.viewers.values():
+            self.session.remove_track(target_language)
+        return self.channel(target_language)
+
+
+# Live broadcasts by room name, plus which broadcast each subscribed socket
+# (producer included) is watching. Both are guarded by broadcasts_lock.
+broadcasts = {}
+broadcast_viewers = {}
+broadcasts_lock = threading.Lock()
+
+
+def end_broadcast(name, session=None):
+    """Tear down a broadcast and tell its viewers. With `session`, only if
+    that is still the broadcast's current session (a failed session must not
+    end the one that replaced it)."""
+    with broadcasts_lock:
+        room = broadcasts.get(name)
+        if room is None or (session is not None and room.session is not session):
+            return
+        del broadcasts[name]
+        for sid in room.viewers:
+            broadcast_viewers.pop(sid, None)
+        channels = {room.channel(target) for target in room.viewers.values()}
+    if caption_sessions.get(room.producer_sid) is room.session:
+        caption_sessions.pop(room.producer_sid, None)
+    room.session.stop()
+    logger.info(f"Broadcast {name!r} ended")
+    with app.app_context():
+        for channel in channels:
+            socketio.emit("broadcast_ended", {"room": name}, to=channel)
+            socketio.close_room(channel)
+
+
+def leave_broadcast(sid):
+    """Unsubscribe `sid` from whatever broadcast it's in. A producer leaving
+    ends the broadcast for everyone."""
+    with broadcasts_lock:
+        name = broadcast_viewers.get(sid)
+        room = broadcasts.get(name)
+        if room is None:
+            return
+        if room.producer_sid == sid:
+            channel = None
+        else:
+            broadcast_viewers.pop(sid, None)
+            channel = room.unsubscribe(sid)
+    if channel is None:
+        end_broadcast(name)
+    else:
+        leave_room(channel, sid=sid)
+
+
 @app.route("/")
 def index():
     """Serve the main page (no-cache so JS updates always load)."""
@@ -510,6 +1357,27 @@ def index():
     return resp
 
 
+@app.route("/metrics")
+def metrics():
+    """Prometheus text-format latency histograms and session/cache gauges."""
+    lines = latency_metrics.render()
+    gauges = [
+        ("caption_sessions_active", "gauge", "Caption sessions with an open upstream stream.",
+         len(caption_sessions)),
+        ("caption_broadcasts_active", "gauge", "Live broadcast rooms.", len(broadcasts)),
+        ("caption_translation_cache_hits_total", "counter", "Translate lookups served from cache.",
+         translation_cache.hits),
+        ("caption_translation_cache_misses_total", "counter", "Translate lookups that called the API.",
+         translation_cache.misses),
+        ("caption_translation_cache_coalesced_total", "counter",
+         "Translate lookups that waited on an identical in-flight call.",
+         translation_cache.coalesced),
+    ]
+    for name, kind, help_text, value in gauges:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"]
+    return Response("\n".join(lines) + "\n", mimetype="text/plain")
+
+
 @socketio.on("connect")
 def handle_connect():
     logger.info(f"Client connected: {request.sid}")
@@ -519,6 +1387,7 @@ def handle_connect():
 @socketio.on("disconnect")
 def handle_disconnect():
     logger.info(f"Client disconnected: {request.sid}")
+    leave_broadcast(request.sid)
     session = caption_sessions.pop(request.sid, None)
     if session:
         session.stop()
@@ -531,6 +1400,7 @@ def handle_start_stream(data):
     raw_choice = (data or {}).get("mode", "transcribe")
     stt_mode, target_language = parse_caption_choice(raw_choice)
 
+    leave_broadcast(request.sid)
     existing = caption_sessions.pop(request.sid, None)
     if existing:
         existing.stop()
@@ -546,15 +1416,103 @@ def handle_start_stream(data):
 
 @socketio.on("stop_stream")
 def handle_stop_stream(data=None):
+    leave_broadcast(request.sid)
     session = caption_sessions.pop(request.sid, None)
     if session:
         logger.info(f"Stopping caption stream for {request.sid}")
         session.stop()
 
 
+@socketio.on("start_broadcast")
+def handle_start_broadcast(data):
+    """Open (or restart) a broadcast fed by this client's audio.
+
+    Same payload as start_stream plus `room`. Viewers join with
+    join_broadcast; restarting (a language/captions change) keeps them.
+    """
+    data = data or {}
+    name = str(data.get("room") or "").strip()
+    if not name:
+        emit("error", {"message": "A broadcast needs a room name"})
+        return
+    language_code = data.get("language_code", "unknown")
+    stt_mode, target_language = parse_caption_choice(data.get("mode", "transcribe"))
+
+    if broadcast_viewers.get(request.sid) != name:
+        leave_broadcast(request.sid)
+    existing = caption_sessions.pop(request.sid, None)
+    if existing:
+        existing.stop()
+
+    with broadcasts_lock:
+        room = broadcasts.get(name)
+        if room is not None and room.producer_sid != request.sid:
+            emit("error", {"message": f"Room {name!r} is already broadcasting"})
+            return
+        if room is None:
+            room = broadcasts[name] = BroadcastRoom(name, request.sid)
+        logger.info(
+            f"Starting broadcast {name!r} from {request.sid} "
+            f"(language={language_code}, stt_mode={stt_mode})"
+        )
+        session = room.start(language_code, stt_mode)
+        left, joined = room.subscribe(request.sid, target_language)
+        broadcast_viewers[request.sid] = name
+    caption_sessions[request.sid] = session
+    if left:
+        leave_room(left)
+    join_room(joined)
+    emit("status", {"message": f"Broadcasting to room {name!r}"})
+
+
+@socketio.on("join_broadcast")
+def handle_join_broadcast(data):
+    """Watch a live broadcast's captions, in the viewer's own caption choice.
+
+    "xlate:<code>" subscribes to that language's translation; anything else
+    gets the broadcaster's STT output as-is (the STT mode is the
+    producer's, since there is only one upstream connection).
+    """
+    data = data or {}
+    name = str(data.get("room") or "").strip()
+    _, target_language = parse_caption_choice(data.get("mode", "transcribe"))
+
+    if broadcast_viewers.get(request.sid) not in (None, name):
+        leave_broadcast(request.sid)
+    with broadcasts_lock:
+        room = broadcasts.get(name)
+        if room is None or room.producer_sid == request.sid:
+            emit("error", {"message": f"No live broadcast in room {name!r}"})
+            return
+        left, joined = room.subscribe(request.sid, target_language)
+        broadcast_viewers[request.sid] = name
+    if left:
+        leave_room(left)
+    join_room(joined)
+    logger.info(f"{request.sid} watching broadcast {name!r} (target_language={target_language})")
+    emit("status", {"message": f"Watching room {name!r}"})
+
+
+@socketio.on("leave_broadcast")
+def handle_leave_broadcast(data=None):
+    leave_broadcast(request.sid)
+
+
+@socketio.on("audio_pcm")
+def handle_audio_pcm(data):
+    """Forward a binary frame of raw 16kHz mono PCM16 into the active session."""
+    if not data:
+        return
+    session = caption_sessions.get(request.sid)
+    if session is None:
+        # No active session -- client may not have sent start_stream yet.
+        return
+    session.send_audio(data)
+
+
 @socketio.on("audio_chunk")
 def handle_audio_chunk(data):
-    """Forward an incoming audio chunk into the active captioning session."""
+    """Legacy transport: a base64 WAV chunk, as sent by older copies of the page."""
     try:
         audio_base64 = (data or {}).get("audio")
         if not audio_base64:
@@ -562,10 +1520,9 @@ def handle_audio_chunk(data):
 
         session = caption_sessions.get(request.sid)
         if session is None:
-            # No active session -- client may not have sent start_stream yet.
             return
 
-        session.send_audio(audio_base64)
+        session.send_audio(_pcm_from_wav_b64(audio_base64))
 
     except Exception as e:
         logger.error(f"Error forwarding audio chunk: {e}")
@@ -0,0 +1,317 @@
+"""Offline load benchmark for the captioning server (app.py).
+
+Runs the real Flask-SocketIO handlers and CaptionSession code against a
+local stand-in for the saaras:v3-realtime WebSocket and a fake Translate
+API, so concurrency changes can be measured without network access or an
+API key:
+
+    python benchmark.py --clients 200 --duration 20
+    python benchmark.py --clients 100 --mode xlate:hi-IN --translate-latency 0.3
+
+Each simulated client is a Flask-SocketIO test client that sends
+start_stream, streams real-time-paced PCM16 frames over audio_pcm, and
+stops. The fake server turns the audio it receives into words at
+`--word-rate`, emitting vad.speech_start/end, cumulative
+transcript.partial and transcript.final events (on VAD or `flush`) after
+the configured latencies. Reported: throughput, the latency distributions
+app.py records for /metrics, and memory per session.
+
+The fake server and the client drivers share the process (and the GIL)
+with the app, so absolute latencies are pessimistic at high client counts;
+compare runs against each other rather than against production.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+
+import websockets
+
+import config
+
+# 16kHz mono PCM16, the same ~120ms frames the browser page sends.
+PCM_BYTES_PER_SECOND = 16000 * 2
+FRAME_SECONDS = 0.12
+FRAME = bytes(int(PCM_BYTES_PER_SECOND * FRAME_SECONDS))
+
+WORDS = (
+    "the quick brown fox jumps over a lazy dog while seven bright birds sing "
+    "softly near the quiet river bank under morning light"
+).split()
+
+
+class FakeRealtimeConnection:
+    """One connection's worth of the saaras:v3-realtime protocol, driven by
+    how much audio has been received rather than by wall-clock time."""
+
+    def __init__(self, ws, args, seed):
+        self.ws = ws
+        self.args = args
+        self.seed = seed
+        self.utterance_idx = 0
+        self.words = []
+        self.speech_audio = 0.0  # seconds of audio in the current utterance
+        self.pause_left = 0.0  # seconds of silence before the next utterance
+        self.speaking = False
+        self.pending = set()
+
+    def later(self, delay, message):
+        """Send `message` after `delay` without blocking the receive loop."""
+        async def send():
+            await asyncio.sleep(delay)
+            try:
+                await self.ws.send(json.dumps(message))
+            except websockets.ConnectionClosed:
+                pass
+
+        task = asyncio.create_task(send())
+        self.pending.add(task)
+        task.add_done_callback(self.pending.discard)
+
+    def finalize(self):
+        if self.words:
+            text = " ".join(self.words)
+            self.later(
+                self.args.final_latency,
+                {"event": "transcript.final", "text": text, "utterance_idx": self.utterance_idx},
+            )
+            self.utterance_idx += 1
+        self.words = []
+        self.speech_audio = 0.0
+
+    def on_audio(self, seconds):
+        if not self.speaking:
+            self.pause_left -= seconds
+            if self.pause_left > 0:
+                return
+            self.speaking = True
+            self.later(self.args.partial_latency, {"event": "vad.speech_start"})
+        self.speech_audio += seconds
+        word_count = int(self.speech_audio * self.args.word_rate)
+        if word_count > len(self.words):
+            while len(self.words) < word_count:
+                position = self.seed * 13 + self.utterance_idx * 7 + len(self.words)
+                word = WORDS[position % len(WORDS)]
+                # A sentence break every eight words exercises the
+                # incremental partial translation path.
+                self.words.append(word + ("." if len(self.words) % 8 == 7 else ""))
+            self.later(
+                self.args.partial_latency,
+                {
+                    "event": "transcript.partial",
+                    "text": " ".join(self.words),
+                    "utterance_idx": self.utterance_idx,
+                },
+            )
+        if self.speech_audio >= self.args.utterance_seconds:
+            self.speaking = False
+            self.pause_left = self.args.pause_seconds
+            self.later(self.args.partial_latency, {"event": "vad.speech_end"})
+            self.finalize()
+
+    async def serve(self):
+        await self.ws.send(json.dumps({"event": "session.begin", "request_id": "benchmark"}))
+        async for raw in self.ws:
+            msg = json.loads(raw)
+            event = msg.get("event")
+            if event == "audio_input":
+                self.on_audio(len(base64.b64decode(msg["audio"])) / PCM_BYTES_PER_SECOND)
+            elif event == "flush":
+                self.finalize()
+            elif event == "end":
+                self.finalize()
+                await asyncio.gather(*self.pending)
+                await self.ws.send(json.dumps({"event": "session.end"}))
+                break
+
+
+class FakeRealtimeServer:
+    """A local ws:// stand-in for the realtime endpoint, on its own thread."""
+
+    def __init__(self, args):
+        self.args = args
+        self.connections = 0
+        self.port = None
+        self._ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._stop = None
+
+    async def _handler(self, ws):
+        self.connections += 1
+        seed = 0 if self.args.shared_text else self.connections
+        await FakeRealtimeConnection(ws, self.args, seed).serve()
+
+    async def _main(self):
+        self._stop = asyncio.Event()
+        async with websockets.serve(self._handler, "127.0.0.1", 0, max_size=None) as server:
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await self._stop.wait()
+
+    def start(self):
+        threading.Thread(
+            target=self._loop.run_until_complete, args=(self._main(),), daemon=True
+        ).start()
+        self._ready.wait()
+        return f"ws://127.0.0.1:{self.port}/speech-to-text-realtime/ws"
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._stop.set)
+
+
+def fake_sarvam_client(translate_latency):
+    """An AsyncSarvamAI stand-in whose text.translate just tags the input."""
+
+    class Result:
+        def __init__(self, translated_text):
+            self.translated_text = translated_text
+
+    class Text:
+        calls = 0
+
+        async def translate(self, input, target_language_code, **kwargs):
+            Text.calls += 1
+            await asyncio.sleep(translate_latency)
+            return Result(f"[{target_language_code}] {input}")
+
+    class Client:
+        text = Text()
+
+        def __init__(self, **kwargs):
+            pass
+
+    return Client
+
+
+def max_rss_bytes():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # Linux reports KiB
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=200, help="simulated browser tabs")
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds of audio per client")
+    parser.add_argument(
+        "--mode", default="transcribe", help='caption choice, e.g. "codemix" or "xlate:hi-IN"'
+    )
+    parser.add_argument("--language", default="hi-IN", help="spoken language_code")
+    parser.add_argument("--ramp", type=float, default=2.0, help="seconds to connect all clients over")
+    parser.add_argument("--word-rate", type=float, default=2.5, help="words recognized per second of speech")
+    parser.add_argument("--utterance-seconds", type=float, default=4.0, help="speech before each VAD end")
+    parser.add_argument("--pause-seconds", type=float, default=0.6, help="silence between utterances")
+    parser.add_argument("--partial-latency", type=float, default=0.15, help="fake server delay for partials/VAD")
+    parser.add_argument("--final-latency", type=float, default=0.3, help="fake server delay for finals")
+    parser.add_argument("--translate-latency", type=float, default=0.3, help="fake Translate API delay")
+    parser.add_argument(
+        "--shared-text", action="store_true",
+        help="every client hears the same speech (exercises the translation cache)",
+    )
+    parser.add_argument("--drivers", type=int, default=4, help="threads streaming client audio")
+    parser.add_argument("--loops", type=int, default=config.SESSION_LOOP_THREADS, help="SESSION_LOOP_THREADS")
+    parser.add_argument(
+        "--tracemalloc", action="store_true",
+        help="measure Python heap per session precisely (slows the run down)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    # Settings read at import time, so set them before app is imported.
+    config.SESSION_LOOP_THREADS = args.loops
+    config.METRICS_SAMPLE_RATE = 1.0
+    config.SARVAM_API_KEY = "benchmark"
+    import app
+
+    # Per-connection logs from both ends would drown out the report.
+    app.logger.setLevel("WARNING")
+    logging.getLogger("websockets").setLevel("WARNING")
+    server = FakeRealtimeServer(args)
+    app.REALTIME_WS_URL = server.start()
+    app.AsyncSarvamAI = fake_sarvam_client(args.translate_latency)
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    rss_before = max_rss_bytes()
+    heap_before = tracemalloc.get_traced_memory()[0] if args.tracemalloc else 0
+
+    clients = []
+    for i in range(args.clients):
+        client = app.socketio.test_client(app.app)
+        client.emit("start_stream", {"language_code": args.language, "mode": args.mode})
+        clients.append(client)
+        time.sleep(args.ramp / max(args.clients, 1))
+
+    # A few pacing threads stream a frame to each of their clients per tick,
+    # the way each browser tab would; lag shows up as the server's handlers
+    # falling behind real time.
+    frames = int(args.duration / FRAME_SECONDS)
+    lags = [0.0] * args.drivers
+    started = time.monotonic()
+
+    def drive(driver):
+        for tick in range(frames):
+            for client in clients[driver::args.drivers]:
+                client.emit("audio_pcm", FRAME)
+            delay = started + (tick + 1) * FRAME_SECONDS - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                lags[driver] = max(lags[driver], -delay)
+
+    drivers = [threading.Thread(target=drive, args=(i,)) for i in range(args.drivers)]
+    for thread in drivers:
+        thread.start()
+    if args.tracemalloc:
+        time.sleep(args.duration / 2)
+        heap_sessions = tracemalloc.get_traced_memory()[0] - heap_before
+    for thread in drivers:
+        thread.join()
+    lag = max(lags)
+    streamed = time.monotonic() - started
+    rss_sessions = max_rss_bytes() - rss_before
+
+    for client in clients:
+        client.emit("stop_stream")
+    time.sleep(2.0 + args.final_latency + args.translate_latency)  # let sessions drain
+
+    captions = 0
+    for client in clients:
+        captions += sum(1 for m in client.get_received() if m["name"] == "caption")
+        client.disconnect()
+    server.stop()
+
+    audio_seconds = args.clients * frames * FRAME_SECONDS
+    print(f"clients                 {args.clients} ({args.mode}, {args.loops} session loops)")
+    print(f"upstream connections    {server.connections}")
+    print(f"audio streamed          {audio_seconds:.0f}s in {streamed:.1f}s "
+          f"({audio_seconds / streamed:.1f}x real time in aggregate, "
+          f"max pacing lag {lag * 1000:.0f}ms)")
+    print(f"captions delivered      {captions} ({captions / streamed:.1f}/s)")
+    print(f"translate API calls     {app.AsyncSarvamAI.text.calls} "
+          f"(cache hits {app.translation_cache.hits}, coalesced {app.translation_cache.coalesced})")
+    print(f"peak RSS per session    {rss_sessions / args.clients / 1024:.1f} KiB")
+    if args.tracemalloc:
+        print(f"heap per session        {heap_sessions / args.clients / 1024:.1f} KiB")
+    print()
+    print(f"{'latency (ms)':<22}{'p50':>8}{'p95':>8}{'p99':>8}{'count':>9}")
+    for stage in ("ingest", "transcript_partial", "transcript_final",
+                  "final_after_flush", "translate", "caption"):
+        quantiles = app.latency_metrics.quantiles(stage)
+        if not quantiles:
+            continue
+        count = app.latency_metrics.count(stage)
+        row = "".join(f"{quantiles[q] * 1000:8.0f}" for q in app.LatencyMetrics.QUANTILES)
+        print(f"{stage:<22}{row}{count:>9}")
+
+
+if __name__ == "__main__":
+    main()
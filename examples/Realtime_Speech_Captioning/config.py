@@ -12,3 +12,19 @@ DEBUG = False
 
 SECRET_KEY = "realtime_speech_captioning_secret_key"
 CORS_ALLOWED_ORIGINS = "*"
+
+# Number of asyncio loops (one background thread each) that host every
+# caption session's realtime connection. Sessions are sharded across them by
+# socket id; one loop comfortably carries hundreds of mostly-idle sessions.
+SESSION_LOOP_THREADS = 2
+
+# Process-wide cache of Translate API results for translated captions (see
+# TranslationCache in app.py): entries kept, and how long each stays valid.
+TRANSLATION_CACHE_SIZE = 4096
+TRANSLATION_CACHE_TTL_SECONDS = 600
+
+# Latency instrumentation (see LatencyMetrics in app.py, served at /metrics):
+# the fraction of caption sessions whose pipeline timings are recorded, and
+# how many recent samples per stage the p50/p95/p99 are computed over.
+METRICS_SAMPLE_RATE = 1.0
+METRICS_WINDOW = 2048
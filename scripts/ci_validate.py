@@ -10,16 +10,16 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
 import sys
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(REPO_ROOT / "scripts"))
 
-from sarvam_checks import Issue, is_recipe_directory  # noqa: E402
+from sarvam_checks import FileDiff, Issue, git_diff_index, git_diff_name_only, is_recipe_directory  # noqa: E402
 from validate_pr import validate_pr_with_refs  # noqa: E402
-from validate_recipe import validate_recipe  # noqa: E402
+from validate_recipe import VALIDATOR_VERSION, validate_recipes  # noqa: E402
+from validation_cache import ResultCache  # noqa: E402
 
 
 def _issue_dict(issue: Issue) -> dict:
@@ -31,32 +31,34 @@ def _issue_dict(issue: Issue) -> dict:
     }
 
 
-def changed_recipe_dirs(base_ref: str, head_ref: str = "HEAD") -> list[Path]:
-    for ref_pair in (f"origin/{base_ref}...{head_ref}", f"{base_ref}...{head_ref}"):
-        result = subprocess.run(
-            ["git", "diff", "--name-only", ref_pair],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            continue
-        dirs: set[str] = set()
-        for path in result.stdout.splitlines():
-            parts = path.strip().split("/")
-            if len(parts) >= 2 and parts[0] == "examples" and parts[1] not in {"TEMPLATE", ""}:
-                candidate = REPO_ROOT / "examples" / parts[1]
-                if is_recipe_directory(candidate):
-                    dirs.add(f"examples/{parts[1]}")
-        return sorted(Path(d) for d in dirs)
-    return []
-
-
-def run_validation(base_ref: str, head_ref: str = "HEAD") -> list[Issue]:
+def changed_recipe_dirs(
+    base_ref: str,
+    head_ref: str = "HEAD",
+    index: dict[str, FileDiff] | None = None,
+) -> list[Path]:
+    dirs: set[str] = set()
+    for path in git_diff_name_only(base_ref, head_ref, diff_filter="ACDMRT", index=index):
+        parts = path.split("/")
+        if len(parts) >= 2 and parts[0] == "examples" and parts[1] not in {"TEMPLATE", ""}:
+            candidate = REPO_ROOT / "examples" / parts[1]
+            if is_recipe_directory(candidate):
+                dirs.add(f"examples/{parts[1]}")
+    return sorted(Path(d) for d in dirs)
+
+
+def run_validation(
+    base_ref: str,
+    head_ref: str = "HEAD",
+    cache: ResultCache | None = None,
+    *,
+    diff_only: bool = False,
+) -> list[Issue]:
     issues: list[Issue] = []
-    issues.extend(validate_pr_with_refs(base_ref, head_ref))
-    for recipe_dir in changed_recipe_dirs(base_ref, head_ref):
-        issues.extend(validate_recipe(REPO_ROOT / recipe_dir))
+    index = git_diff_index(base_ref, head_ref)
+    issues.extend(validate_pr_with_refs(base_ref, head_ref, diff_only=diff_only, index=index))
+    recipe_dirs = [REPO_ROOT / d for d in changed_recipe_dirs(base_ref, head_ref, index)]
+    for _, recipe_issues in validate_recipes(recipe_dirs, cache=cache):
+        issues.extend(recipe_issues)
     return issues
 
 
@@ -65,9 +67,12 @@ def main() -> int:
     parser.add_argument("--base-ref", default="main")
     parser.add_argument("--head-ref", default="HEAD")
     parser.add_argument("--output", help="Write JSON issues to this file")
+    parser.add_argument("--no-cache", action="store_true", help="Skip the recipe result cache")
+    parser.add_argument("--diff-only", action="store_true", help="Secret-scan added hunks only")
     args = parser.parse_args()
 
-    issues = run_validation(args.base_ref, args.head_ref)
+    cache = None if args.no_cache else ResultCache(VALIDATOR_VERSION)
+    issues = run_validation(args.base_ref, args.head_ref, cache, diff_only=args.diff_only)
     payload = [_issue_dict(i) for i in issues]
     errors = [i for i in issues if i.severity == "error"]
 
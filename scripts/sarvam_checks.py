@@ -1,18 +1,20 @@
 """Shared Sarvam cookbook validation rules used by PR and recipe checks."""
 from __future__ import annotations
 
+import codecs
 import json
+import mmap
 import re
 import subprocess
+from bisect import bisect_right
 from pathlib import Path
-from typing import NamedTuple
+from typing import Iterator, NamedTuple
 
 from sarvam_rules import (
     SarvamApiRules,
-    extract_language_codes,
-    extract_models,
     get_rules,
     is_sarvam_model_name,
+    iter_rule_values,
     recommended_for,
 )
 
@@ -42,6 +44,8 @@ SECRET_ASSIGNMENT_RE = re.compile(
 
 SARVAM_KEY_PREFIX_RE = re.compile(r"\bsk_[a-zA-Z0-9]{16,}\b")
 
+CLIENT_SIDE_KEY_RE = re.compile(r"process\.env\.SARVAM_API_KEY|NEXT_PUBLIC_.*SARVAM")
+
 PLACEHOLDER_KEY_PATTERNS = (
     "your-sarvam-api-key",
     "your_sarvam_api_key",
@@ -68,10 +72,165 @@ BINARY_SUFFIXES: frozenset[str] = frozenset(
     }
 )
 
+CLIENT_SIDE_SUFFIXES = frozenset({".tsx", ".jsx", ".ts", ".js"})
+
 SCAN_SKIP_NAMES = frozenset({".gitkeep", "package-lock.json"})
 
 LEGACY_EXAMPLE_DIRS = frozenset({"TEMPLATE"})
 
+# Notebooks at least this large are streamed (outputs skipped, not decoded).
+NOTEBOOK_STREAM_THRESHOLD = 1 << 20
+
+# Other text files at least this large are secret-scanned through mmap in
+# SECRET_SCAN_WINDOW-byte windows that overlap by SECRET_SCAN_OVERLAP bytes
+# (the longest match that is guaranteed to be found whole).
+SECRET_MMAP_THRESHOLD = 1 << 20
+SECRET_SCAN_WINDOW = 1 << 20
+SECRET_SCAN_OVERLAP = 4096
+
+
+# ---------------------------------------------------------------------------
+# Secret scanner engine
+# ---------------------------------------------------------------------------
+
+
+class SecretRule(NamedTuple):
+    """One secret-detection rule for SecretScanner."""
+
+    name: str
+    anchors: tuple[str, ...]  # literals every match starts with (lowercase if ignore_case)
+    confirm: re.Pattern[str]  # full rule, matched at each anchor position
+    ignore_case: bool = False
+    skip_placeholders: bool = True
+
+
+class SecretHit(NamedTuple):
+    """A confirmed rule match."""
+
+    rule: str
+    start: int
+    text: str
+
+
+def _find_all(haystack: str | bytes, needle: str | bytes, lo: int = 0, hi: int | None = None) -> Iterator[int]:
+    pos = haystack.find(needle, lo)
+    while pos != -1 and (hi is None or pos < hi):
+        yield pos
+        pos = haystack.find(needle, pos + 1)
+
+
+class SecretScanner:
+    """Scan a buffer for every secret rule using a literal prefilter.
+
+    Candidate positions come from find() on each rule's literal anchors
+    (against a single lowercased copy for case-insensitive rules), and only
+    those positions are confirmed with the rule's regex. Hits are
+    non-overlapping per rule, exactly as if the rule had been run with
+    finditer, while different rules may overlap (an sk_ key inside a
+    SARVAM_API_KEY assignment yields both).
+
+    scan() works on decoded text; scan_buffer() works on raw bytes such as an
+    mmap, using bytes versions of the same anchors and patterns.
+    """
+
+    def __init__(self, rules: tuple[SecretRule, ...]) -> None:
+        self.rules = rules
+        self._byte_rules = [
+            (
+                tuple(anchor.encode("utf-8") for anchor in rule.anchors),
+                re.compile(rule.confirm.pattern.encode("utf-8"), rule.confirm.flags & ~re.UNICODE),
+            )
+            for rule in rules
+        ]
+
+    def scan(self, text: str) -> list[SecretHit]:
+        """Return confirmed hits ordered by rule, then position."""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            lowered = None  # case mapping shifted offsets; fall back to regex search
+        hits: list[SecretHit] = []
+        for rule in self.rules:
+            haystack = lowered if rule.ignore_case else text
+            if haystack is None:
+                matches = rule.confirm.finditer(text)
+            else:
+                matches = self._confirmed(rule.anchors, rule.confirm, text, haystack, 0, len(text))
+            for match in matches:
+                if rule.skip_placeholders and _is_placeholder_secret(match.group(0)):
+                    continue
+                hits.append(SecretHit(rule.name, match.start(), match.group(0)))
+        return hits
+
+    def scan_buffer(
+        self,
+        buf: bytes | mmap.mmap,
+        window: int = SECRET_SCAN_WINDOW,
+        overlap: int = SECRET_SCAN_OVERLAP,
+    ) -> list[SecretHit]:
+        """Return confirmed hits in a bytes-like buffer, scanned window by window.
+
+        Only one window (plus overlap) is copied out of buf at a time, so an
+        mmap'd file is never decoded into a full Python str. A match must
+        start inside a window's first `window` bytes and be at most `overlap`
+        bytes long to be seen in full. Hit starts are byte offsets.
+        """
+        size = len(buf)
+        next_start = [0] * len(self.rules)
+        hits: list[SecretHit] = []
+        for base in range(0, size, window):
+            lead = 1 if base else 0  # one byte of context so \b sees the previous byte
+            chunk = buf[base - lead:base + window + overlap]
+            lowered = chunk.lower()
+            for idx, rule in enumerate(self.rules):
+                anchors, pattern = self._byte_rules[idx]
+                haystack = lowered if rule.ignore_case else chunk
+                lo = max(next_start[idx] - base + lead, lead)
+                for match in self._confirmed(anchors, pattern, chunk, haystack, lo, lead + window):
+                    next_start[idx] = base - lead + match.end()
+                    text = match.group(0).decode("utf-8", errors="ignore")
+                    if rule.skip_placeholders and _is_placeholder_secret(text):
+                        continue
+                    hits.append(SecretHit(rule.name, base - lead + match.start(), text))
+        order = {rule.name: idx for idx, rule in enumerate(self.rules)}
+        hits.sort(key=lambda hit: (order[hit.rule], hit.start))
+        return hits
+
+    @staticmethod
+    def _confirmed(
+        anchors: tuple,
+        pattern: re.Pattern,
+        subject: str | bytes,
+        haystack: str | bytes,
+        lo: int,
+        hi: int,
+    ) -> Iterator[re.Match]:
+        positions = sorted({pos for anchor in anchors for pos in _find_all(haystack, anchor, lo, hi)})
+        next_start = lo
+        for pos in positions:
+            if pos < next_start:
+                continue
+            match = pattern.match(subject, pos)
+            if match:
+                next_start = match.end()
+                yield match
+
+
+SECRET_SCANNER = SecretScanner((
+    SecretRule(
+        "assignment",
+        ("sarvam_api_key", "api"),
+        SECRET_ASSIGNMENT_RE,
+        ignore_case=True,
+    ),
+    SecretRule("sk-prefix", ("sk_",), SARVAM_KEY_PREFIX_RE),
+    SecretRule(
+        "client-side-key",
+        ("process.env.SARVAM_API_KEY", "NEXT_PUBLIC_"),
+        CLIENT_SIDE_KEY_RE,
+        skip_placeholders=False,
+    ),
+))
+
 
 # ---------------------------------------------------------------------------
 # Path helpers
@@ -137,50 +296,125 @@ def should_scan_file(path: Path) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def git_diff_name_only(base_ref: str, head_ref: str = "HEAD") -> list[str]:
-    """Return changed file paths between base_ref and head_ref."""
+class FileDiff(NamedTuple):
+    """One file's entry in a parsed `git diff -U0` patch."""
+
+    status: str  # "A", "M", "D" or "R", as in --diff-filter
+    added: list[tuple[int, str]]
+
+
+_HUNK_HEADER_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,\d+)? @@")
+
+
+def _unquote_git_path(path: str) -> str:
+    """Undo git's C-style quoting of paths containing quotes or control characters."""
+    path = path.rstrip("\t")  # git pads ---/+++ names containing spaces with a tab
+    if len(path) >= 2 and path[0] == path[-1] == '"':
+        return codecs.escape_decode(path[1:-1].encode("utf-8"))[0].decode("utf-8", "replace")
+    return path
+
+
+def _diff_header_path(line: str) -> str:
+    """Return the path from a `diff --git a/P b/P` line (binary diffs have no +++ line)."""
+    rest = line[len("diff --git "):]
+    half = (len(rest) - 1) // 2
+    left, right = _unquote_git_path(rest[:half]), _unquote_git_path(rest[half + 1:])
+    if rest[half] == " " and left[2:] == right[2:]:
+        return right[2:]
+    return _unquote_git_path(rest.rsplit(" b/", 1)[-1])
+
+
+def parse_diff_index(patch: str) -> dict[str, FileDiff]:
+    """Parse a whole `git diff -U0` patch into {path: FileDiff}, in diff order.
+
+    Deleted files are keyed by their old path; renamed files by the new one.
+    """
+    index: dict[str, FileDiff] = {}
+    path = ""
+    status = ""
+    added: list[tuple[int, str]] = []
+    in_header = False
+    current_line = 0
+
+    def flush() -> None:
+        if path:
+            index[path] = FileDiff(status, added)
+
+    for line in patch.split("\n"):
+        if line.startswith("diff --git "):
+            flush()
+            path, status, added, in_header = _diff_header_path(line), "M", [], True
+            continue
+        if not path:
+            continue
+        if in_header:
+            if line.startswith("@@"):
+                in_header = False
+            else:
+                if line.startswith("new file mode"):
+                    status = "A"
+                elif line.startswith("deleted file mode"):
+                    status = "D"
+                elif line.startswith("rename to "):
+                    path, status = _unquote_git_path(line[len("rename to "):]), "R"
+                elif line.startswith("+++ ") and line != "+++ /dev/null":
+                    path = _unquote_git_path(line[len("+++ "):])[2:]
+                continue
+        if line.startswith("@@"):
+            match = _HUNK_HEADER_RE.match(line)
+            if match:
+                current_line = int(match.group(1)) - 1
+        elif line.startswith("+"):
+            current_line += 1
+            added.append((current_line, line[1:].removesuffix("\r")))
+        elif line.startswith(" "):
+            current_line += 1
+    flush()
+    return index
+
+
+def git_diff_index(base_ref: str, head_ref: str = "HEAD") -> dict[str, FileDiff]:
+    """Return every changed file between base_ref and head_ref with its added lines.
+
+    One `git diff -U0` over the whole tree replaces the per-file invocations;
+    build the index once per run and pass it to the helpers below.
+    """
     for ref_pair in (f"origin/{base_ref}...{head_ref}", f"{base_ref}...{head_ref}"):
         result = subprocess.run(
-            ["git", "diff", "--name-only", "--diff-filter=ACMRT", ref_pair],
+            ["git", "-c", "core.quotePath=false", "diff", "-U0", "--no-color", "--no-ext-diff", ref_pair],
             capture_output=True,
-            text=True,
+            encoding="utf-8",
+            errors="replace",
             check=False,
         )
         if result.returncode == 0:
-            return [line.strip() for line in result.stdout.splitlines() if line.strip()]
-    return []
+            return parse_diff_index(result.stdout)
+    return {}
 
 
-def git_diff_added_lines(base_ref: str, file_path: str, head_ref: str = "HEAD") -> list[tuple[int, str]]:
-    """Return (line_number, content) for lines added in file_path."""
-    for ref_pair in (f"origin/{base_ref}...{head_ref}", f"{base_ref}...{head_ref}"):
-        result = subprocess.run(
-            ["git", "diff", "-U0", ref_pair, "--", file_path],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            continue
+def git_diff_name_only(
+    base_ref: str,
+    head_ref: str = "HEAD",
+    diff_filter: str = "ACMRT",
+    index: dict[str, FileDiff] | None = None,
+) -> list[str]:
+    """Return changed file paths between base_ref and head_ref."""
+    if index is None:
+        index = git_diff_index(base_ref, head_ref)
+    return [path for path, diff in index.items() if diff.status in diff_filter]
 
-        added: list[tuple[int, str]] = []
-        current_line = 0
-        for line in result.stdout.splitlines():
-            if line.startswith("@@"):
-                match = re.search(r"\+(\d+)", line)
-                if match:
-                    current_line = int(match.group(1)) - 1
-                continue
-            if line.startswith("+++") or line.startswith("---"):
-                continue
-            if line.startswith("+"):
-                current_line += 1
-                added.append((current_line, line[1:]))
-            elif line.startswith(" "):
-                current_line += 1
-        if added or result.stdout:
-            return added
-    return []
+
+def git_diff_added_lines(
+    base_ref: str,
+    file_path: str,
+    head_ref: str = "HEAD",
+    index: dict[str, FileDiff] | None = None,
+) -> list[tuple[int, str]]:
+    """Return (line_number, content) for lines added in file_path."""
+    if index is None:
+        index = git_diff_index(base_ref, head_ref)
+    diff = index.get(file_path)
+    return diff.added if diff else []
 
 
 # ---------------------------------------------------------------------------
@@ -188,21 +422,238 @@ def git_diff_added_lines(base_ref: str, file_path: str, head_ref: str = "HEAD")
 # ---------------------------------------------------------------------------
 
 
-def notebook_cell_sources(nb_path: Path) -> list[str]:
-    """Parse notebook JSON and return each cell's source text."""
+class NotebookCell(NamedTuple):
+    """A notebook cell reduced to what the validators inspect."""
+
+    cell_type: str
+    source: str  # list-of-strings sources are pre-joined
+    line_offsets: tuple[int, ...]  # start offset of each line within source
+
+    def line_at(self, offset: int) -> int:
+        """Return the 1-based line number containing character offset."""
+        return bisect_right(self.line_offsets, offset)
+
+
+def _line_offsets(text: str) -> tuple[int, ...]:
+    offsets = [0]
+    pos = text.find("\n")
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = text.find("\n", pos + 1)
+    return tuple(offsets)
+
+
+def _make_cell(cell_type: object, src: object) -> NotebookCell:
+    if isinstance(src, list):
+        text = "".join(src)
+    else:
+        text = str(src) if src else ""
+    return NotebookCell(str(cell_type or ""), text, _line_offsets(text))
+
+
+def parse_notebook(data: bytes) -> list[NotebookCell] | None:
+    """Decode notebook JSON bytes once and return its cells.
+
+    A leading UTF-8 BOM is accepted. Returns None when the bytes are not a
+    valid notebook, and [] when the notebook has no cell list.
+    """
     try:
-        nb = json.loads(nb_path.read_text(encoding="utf-8-sig"))
-    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+        nb = json.loads(data.decode("utf-8-sig"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    cells = nb.get("cells") if isinstance(nb, dict) else None
+    if not isinstance(cells, list):
         return []
-    cells = nb.get("cells", [])
-    sources: list[str] = []
+    parsed: list[NotebookCell] = []
     for cell in cells:
-        src = cell.get("source", [])
-        if isinstance(src, list):
-            sources.append("".join(src))
+        if not isinstance(cell, dict):
+            cell = {}
+        parsed.append(_make_cell(cell.get("cell_type", ""), cell.get("source", [])))
+    return parsed
+
+
+class _NotebookScanner:
+    """Minimal pull scanner over notebook JSON bytes.
+
+    Only the cell_type and source members of each cell are decoded; every
+    other value (outputs, attachments, metadata, ...) is skipped by regex
+    without building Python objects for it.
+    """
+
+    _WS_RE = re.compile(rb"[ \t\r\n]*")
+    _STRING_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+    _STRUCT_RE = re.compile(rb'["\[\]{}]')
+    _SCALAR_RE = re.compile(rb"[^,}\]\s]+")
+
+    def __init__(self, buf: bytes | mmap.mmap) -> None:
+        self.buf = buf
+        self.pos = 3 if buf[:3] == b"\xef\xbb\xbf" else 0
+
+    def peek(self) -> int:
+        self.pos = self._WS_RE.match(self.buf, self.pos).end()
+        return self.buf[self.pos]
+
+    def expect(self, char: bytes) -> None:
+        if self.peek() != char[0]:
+            raise ValueError(f"expected {char!r} at offset {self.pos}")
+        self.pos += 1
+
+    def _string_end(self, start: int) -> int:
+        match = self._STRING_RE.match(self.buf, start)
+        if not match:
+            raise ValueError(f"unterminated string at offset {start}")
+        return match.end()
+
+    def skip_value(self) -> None:
+        char = self.peek()
+        if char == ord('"'):
+            self.pos = self._string_end(self.pos)
+        elif char in b"{[":
+            depth = 0
+            while True:
+                match = self._STRUCT_RE.search(self.buf, self.pos)
+                if not match:
+                    raise ValueError("unterminated container")
+                token = self.buf[match.start()]
+                if token == ord('"'):
+                    self.pos = self._string_end(match.start())
+                    continue
+                self.pos = match.end()
+                depth += 1 if token in b"{[" else -1
+                if depth == 0:
+                    return
         else:
-            sources.append(str(src) if src else "")
-    return sources
+            match = self._SCALAR_RE.match(self.buf, self.pos)
+            if not match:
+                raise ValueError(f"unexpected byte at offset {self.pos}")
+            self.pos = match.end()
+
+    def decode_value(self) -> object:
+        self.peek()
+        start = self.pos
+        self.skip_value()
+        return json.loads(self.buf[start:self.pos])
+
+    def members(self) -> Iterator[str]:
+        """Yield each key of the object at pos; the caller consumes the value."""
+        self.expect(b"{")
+        if self.peek() == ord("}"):
+            self.pos += 1
+            return
+        while True:
+            self.peek()
+            end = self._string_end(self.pos)
+            key = json.loads(self.buf[self.pos:end])
+            self.pos = end
+            self.expect(b":")
+            yield key
+            if self.peek() == ord(","):
+                self.pos += 1
+                continue
+            self.expect(b"}")
+            return
+
+    def elements(self) -> Iterator[None]:
+        """Yield once per element of the array at pos; the caller consumes it."""
+        self.expect(b"[")
+        if self.peek() == ord("]"):
+            self.pos += 1
+            return
+        while True:
+            yield None
+            if self.peek() == ord(","):
+                self.pos += 1
+                continue
+            self.expect(b"]")
+            return
+
+
+def _scan_notebook_cells(
+    buf: bytes | mmap.mmap,
+    spans: list[tuple[int, int]] | None = None,
+) -> list[NotebookCell]:
+    """Scan cells out of buf; if spans is given, fill it with each cell's byte range."""
+    scanner = _NotebookScanner(buf)
+    if scanner.peek() != ord("{"):
+        return []
+    cells: list[NotebookCell] = []
+    for key in scanner.members():
+        if key != "cells" or scanner.peek() != ord("["):
+            scanner.skip_value()
+            continue
+        cells = []
+        if spans is not None:
+            spans.clear()
+        for _ in scanner.elements():
+            fields: dict[str, object] = {}
+            is_object = scanner.peek() == ord("{")
+            cell_start = scanner.pos
+            if not is_object:
+                scanner.skip_value()
+            else:
+                for cell_key in scanner.members():
+                    if cell_key in ("cell_type", "source"):
+                        fields[cell_key] = scanner.decode_value()
+                    else:
+                        scanner.skip_value()
+            cells.append(_make_cell(fields.get("cell_type", ""), fields.get("source", [])))
+            if spans is not None:
+                spans.append((cell_start, scanner.pos))
+    return cells
+
+
+def notebook_cell_line_spans(data: bytes) -> tuple[list[NotebookCell], list[tuple[int, int]]] | None:
+    """Return a notebook's cells and the 1-based raw-file line range of each.
+
+    Used to map diff hunks, whose line numbers refer to the .ipynb JSON text,
+    back to the cells they touch. Returns None if the notebook is unparseable.
+    """
+    byte_spans: list[tuple[int, int]] = []
+    try:
+        cells = _scan_notebook_cells(data, byte_spans)
+    except (ValueError, IndexError):
+        return None
+    line_spans: list[tuple[int, int]] = []
+    line, pos = 1, 0
+    for start, end in byte_spans:
+        line += data.count(b"\n", pos, start)
+        first = line
+        line += data.count(b"\n", start, end)
+        line_spans.append((first, line))
+        pos = end
+    return cells, line_spans
+
+
+def stream_notebook(nb_path: Path) -> list[NotebookCell] | None:
+    """Return a notebook's cells without materialising outputs or attachments.
+
+    The file is memory-mapped and scanned in place, so peak memory and parse
+    time track the size of cell sources rather than embedded outputs. Unlike
+    parse_notebook, skipped values are not fully validated as JSON.
+    """
+    try:
+        with nb_path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            return _scan_notebook_cells(buf)
+    except (ValueError, IndexError, OSError):
+        return None
+
+
+def load_notebook(
+    nb_path: Path,
+    stream_threshold: int = NOTEBOOK_STREAM_THRESHOLD,
+) -> list[NotebookCell] | None:
+    """Load a notebook's cells, streaming files of stream_threshold bytes or more."""
+    try:
+        if nb_path.stat().st_size >= stream_threshold:
+            return stream_notebook(nb_path)
+        return parse_notebook(nb_path.read_bytes())
+    except OSError:
+        return None
+
+
+def notebook_cell_sources(nb_path: Path) -> list[str]:
+    """Parse notebook JSON and return each cell's source text."""
+    return [cell.source for cell in load_notebook(nb_path) or []]
 
 
 # ---------------------------------------------------------------------------
@@ -215,36 +666,74 @@ def _is_placeholder_secret(value: str) -> bool:
     return any(token.lower() in lowered for token in PLACEHOLDER_KEY_PATTERNS)
 
 
-def scan_text_for_secrets(text: str, rel_path: str) -> list[Issue]:
-    """Scan plain text for hardcoded API keys."""
+def _secret_issues(hits: list[SecretHit], rel_path: str) -> list[Issue]:
     issues: list[Issue] = []
-    for match in SECRET_ASSIGNMENT_RE.finditer(text):
-        snippet = match.group(0)
-        if _is_placeholder_secret(snippet):
-            continue
-        issues.append(
-            Issue(
-                "error",
-                "secrets",
-                f"Possible hardcoded API key in {rel_path}: {snippet[:60]}",
-                "Load SARVAM_API_KEY from the environment (.env + python-dotenv). "
-                "See https://docs.sarvam.ai/api-reference-docs/authentication",
+    for hit in hits:
+        if hit.rule == "assignment":
+            issues.append(
+                Issue(
+                    "error",
+                    "secrets",
+                    f"Possible hardcoded API key in {rel_path}: {hit.text[:60]}",
+                    "Load SARVAM_API_KEY from the environment (.env + python-dotenv). "
+                    "See https://docs.sarvam.ai/api-reference-docs/authentication",
+                )
             )
-        )
-    for match in SARVAM_KEY_PREFIX_RE.finditer(text):
-        if _is_placeholder_secret(match.group(0)):
-            continue
-        issues.append(
-            Issue(
-                "error",
-                "secrets",
-                f"Possible Sarvam API key (sk_*) in {rel_path}",
-                "Remove the key immediately and rotate it from the Sarvam dashboard.",
+        elif hit.rule == "sk-prefix":
+            issues.append(
+                Issue(
+                    "error",
+                    "secrets",
+                    f"Possible Sarvam API key (sk_*) in {rel_path}",
+                    "Remove the key immediately and rotate it from the Sarvam dashboard.",
+                )
             )
-        )
     return issues
 
 
+def _has_use_client(buf: str | bytes | mmap.mmap) -> bool:
+    if isinstance(buf, str):
+        return '"use client"' in buf or "'use client'" in buf
+    return buf.find(b'"use client"') != -1 or buf.find(b"'use client'") != -1
+
+
+def file_secret_hits(file_path: Path) -> tuple[list[SecretHit], bool] | None:
+    """Scan a non-notebook file once; return (hits, has "use client") or None.
+
+    Files of SECRET_MMAP_THRESHOLD bytes or more are memory-mapped and scanned
+    as bytes instead of being decoded into a str.
+    """
+    try:
+        if file_path.stat().st_size >= SECRET_MMAP_THRESHOLD:
+            with file_path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                return SECRET_SCANNER.scan_buffer(buf), _has_use_client(buf)
+        text = file_path.read_text(encoding="utf-8", errors="ignore")
+    except (OSError, ValueError):
+        return None
+    return SECRET_SCANNER.scan(text), _has_use_client(text)
+
+
+def _client_side_key_issues(hits: list[SecretHit], file_path: Path, use_client: bool) -> list[Issue]:
+    if file_path.suffix not in CLIENT_SIDE_SUFFIXES or not use_client:
+        return []
+    if not any(hit.rule == "client-side-key" for hit in hits):
+        return []
+    return [
+        Issue(
+            "error",
+            "secrets",
+            f"Client-side Sarvam API key reference in {file_path}",
+            "Keep SARVAM_API_KEY server-side only (API routes / backend). "
+            "Never expose keys in browser bundles.",
+        )
+    ]
+
+
+def scan_text_for_secrets(text: str, rel_path: str) -> list[Issue]:
+    """Scan plain text for hardcoded API keys."""
+    return _secret_issues(SECRET_SCANNER.scan(text), rel_path)
+
+
 def scan_file_for_secrets(file_path: Path, repo_root: Path | None = None) -> list[Issue]:
     """Scan a single file for secret leaks."""
     if not should_scan_file(file_path):
@@ -266,19 +755,16 @@ def scan_file_for_secrets(file_path: Path, repo_root: Path | None = None) -> lis
             )
         ]
 
-    try:
-        text = file_path.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
-        return []
-
     if file_path.suffix == ".ipynb":
         issues: list[Issue] = []
-        for idx, cell_src in enumerate(notebook_cell_sources(file_path)):
-            for issue in scan_text_for_secrets(cell_src, f"{rel} (cell {idx})"):
-                issues.append(issue)
+        for idx, cell in enumerate(load_notebook(file_path) or []):
+            issues.extend(scan_text_for_secrets(cell.source, f"{rel} (cell {idx})"))
         return issues
 
-    return scan_text_for_secrets(text, rel)
+    scanned = file_secret_hits(file_path)
+    if scanned is None:
+        return []
+    return _secret_issues(scanned[0], rel)
 
 
 def scan_added_lines_for_deprecated_api(
@@ -319,100 +805,198 @@ def scan_added_lines_for_allowlist(
     strict: bool,
     rules: SarvamApiRules | None = None,
 ) -> list[Issue]:
-    """Validate Sarvam models and language codes against sarvam_api_rules.json."""
+    """Validate Sarvam models and language codes against sarvam_api_rules.json.
+
+    The eligible lines are joined and scanned once with iter_rule_values,
+    which anchors a match at each "model"/"language_code" keyword occurrence;
+    each hit is then a single lookup in the precomputed rule tables.
+    """
     api_rules = rules or get_rules()
     rel = str(file_path)
     error_sev = "error" if strict else "warning"
     warn_sev = "warning"
     issues: list[Issue] = []
-    all_lang_codes = api_rules.stt_language_codes | api_rules.tts_language_codes
 
+    line_numbers: list[int] = []
+    line_starts: list[int] = []
+    kept: list[str] = []
+    offset = 0
     for line_no, line in added_lines:
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
             continue
         if "re.compile" in line or "DEPRECATED_API_RULES" in line:
             continue
-
-        for model in extract_models(line):
-            if not is_sarvam_model_name(model):
+        line_numbers.append(line_no)
+        line_starts.append(offset)
+        kept.append(line)
+        offset += len(line) + 1
+
+    for start, kind, value in iter_rule_values("\n".join(kept)):
+        line_no = line_numbers[bisect_right(line_starts, start) - 1]
+        if kind == "model":
+            if not is_sarvam_model_name(value):
                 continue
-            if model in api_rules.deprecated_models:
-                replacement = recommended_for(model, api_rules)
+            status = api_rules.model_status.get(value)
+            if status == "deprecated":
+                replacement = recommended_for(value, api_rules)
                 hint = f"Use {replacement} instead." if replacement else f"See {api_rules.docs_url}."
                 issues.append(
                     Issue(
                         error_sev,
                         "deprecated-model",
-                        f"{rel}:{line_no}: Deprecated Sarvam model '{model}'",
+                        f"{rel}:{line_no}: Deprecated Sarvam model '{value}'",
                         hint,
                     )
                 )
-            elif model not in api_rules.allowed_models:
+            elif status is None:
                 issues.append(
                     Issue(
                         error_sev,
                         "unknown-model",
-                        f"{rel}:{line_no}: Unknown Sarvam model '{model}'",
+                        f"{rel}:{line_no}: Unknown Sarvam model '{value}'",
                         f"Allowed models are listed in scripts/sarvam_api_rules.json "
                         f"(synced from {api_rules.docs_url}).",
                     )
                 )
-            elif strict and model in api_rules.allowed_models and model not in api_rules.recommended_models:
+            elif strict and status == "allowed":
                 issues.append(
                     Issue(
                         warn_sev,
                         "non-recommended-model",
-                        f"{rel}:{line_no}: Non-recommended model '{model}'",
+                        f"{rel}:{line_no}: Non-recommended model '{value}'",
                         f"Prefer recommended models from {api_rules.docs_url}.",
                     )
                 )
-
-        for code in extract_language_codes(line):
-            if code in api_rules.invalid_language_codes:
-                fix = api_rules.invalid_language_codes[code]
-                issues.append(
-                    Issue(
-                        error_sev,
-                        "language-code",
-                        f"{rel}:{line_no}: Invalid language code '{code}' — use '{fix}'",
-                        f"See {api_rules.docs_url} for supported language codes.",
-                    )
+        elif value in api_rules.invalid_language_codes:
+            fix = api_rules.invalid_language_codes[value]
+            issues.append(
+                Issue(
+                    error_sev,
+                    "language-code",
+                    f"{rel}:{line_no}: Invalid language code '{value}' — use '{fix}'",
+                    f"See {api_rules.docs_url} for supported language codes.",
                 )
-            elif strict and code not in all_lang_codes:
-                issues.append(
-                    Issue(
-                        warn_sev,
-                        "language-code",
-                        f"{rel}:{line_no}: Unrecognized language code '{code}'",
-                        f"Verify against scripts/sarvam_api_rules.json (STT/TTS lists).",
-                    )
+            )
+        elif strict and value not in api_rules.language_codes:
+            issues.append(
+                Issue(
+                    warn_sev,
+                    "language-code",
+                    f"{rel}:{line_no}: Unrecognized language code '{value}'",
+                    f"Verify against scripts/sarvam_api_rules.json (STT/TTS lists).",
                 )
+            )
 
     return issues
 
 
 def scan_file_for_client_side_keys(file_path: Path) -> list[Issue]:
     """Warn when browser/client code references SARVAM_API_KEY directly."""
-    if file_path.suffix not in {".tsx", ".jsx", ".ts", ".js"}:
+    if file_path.suffix not in CLIENT_SIDE_SUFFIXES:
         return []
-    try:
-        text = file_path.read_text(encoding="utf-8", errors="ignore")
-    except OSError:
+    scanned = file_secret_hits(file_path)
+    if scanned is None:
         return []
+    hits, use_client = scanned
+    return _client_side_key_issues(hits, file_path, use_client)
 
-    rel = str(file_path)
-    if '"use client"' not in text and "'use client'" not in text:
+
+def scan_file_for_secret_rules(file_path: Path, repo_root: Path | None = None) -> list[Issue]:
+    """Run secret and client-side key checks on a file with a single scan.
+
+    Equivalent to scan_file_for_secrets followed by
+    scan_file_for_client_side_keys, but each file is read and scanned once.
+    """
+    if file_path.suffix == ".ipynb" or file_path.name == ".env" or not should_scan_file(file_path):
+        return scan_file_for_secrets(file_path, repo_root) + scan_file_for_client_side_keys(file_path)
+
+    scanned = file_secret_hits(file_path)
+    if scanned is None:
         return []
+    hits, use_client = scanned
+    rel = (
+        str(file_path.relative_to(repo_root))
+        if repo_root and file_path.is_relative_to(repo_root)
+        else str(file_path)
+    )
+    return _secret_issues(hits, rel) + _client_side_key_issues(hits, file_path, use_client)
+
+
+def _added_hunks(added_lines: list[tuple[int, str]]) -> list[tuple[int, str]]:
+    """Group added lines into runs of consecutive line numbers: (first_line, text)."""
+    hunks: list[tuple[int, str]] = []
+    first = prev = -1
+    lines: list[str] = []
+    for line_no, content in added_lines:
+        if lines and line_no != prev + 1:
+            hunks.append((first, "\n".join(lines)))
+            lines = []
+        if not lines:
+            first = line_no
+        lines.append(content)
+        prev = line_no
+    if lines:
+        hunks.append((first, "\n".join(lines)))
+    return hunks
+
+
+def scan_added_lines_for_secrets(
+    file_path: Path,
+    added_lines: list[tuple[int, str]],
+    repo_root: Path | None = None,
+) -> list[Issue]:
+    """Run secret and client-side key checks on the added hunks of a file only.
 
-    if re.search(r"process\.env\.SARVAM_API_KEY|NEXT_PUBLIC_.*SARVAM", text):
-        return [
-            Issue(
-                "error",
-                "secrets",
-                f"Client-side Sarvam API key reference in {rel}",
-                "Keep SARVAM_API_KEY server-side only (API routes / backend). "
-                "Never expose keys in browser bundles.",
-            )
-        ]
-    return []
+    Plain-text hunks are scanned as-is and reported with their line number.
+    Notebook hunks are mapped back to the cells whose JSON they fall in, and
+    only those cells' sources are scanned. Committed .env files and notebooks
+    that cannot be indexed fall back to scan_file_for_secret_rules.
+    """
+    if not should_scan_file(file_path):
+        return []
+    if file_path.name == ".env":
+        return scan_file_for_secret_rules(file_path, repo_root)
+
+    rel = (
+        str(file_path.relative_to(repo_root))
+        if repo_root and file_path.is_relative_to(repo_root)
+        else str(file_path)
+    )
+    issues: list[Issue] = []
+
+    if file_path.suffix == ".ipynb":
+        try:
+            indexed = notebook_cell_line_spans(file_path.read_bytes())
+        except OSError:
+            return []
+        if indexed is None:
+            return scan_file_for_secret_rules(file_path, repo_root)
+        cells, spans = indexed
+        starts = [start for start, _ in spans]
+        touched: set[int] = set()
+        for line_no, _ in added_lines:
+            idx = bisect_right(starts, line_no) - 1
+            if idx >= 0 and line_no <= spans[idx][1]:
+                touched.add(idx)
+        for idx in sorted(touched):
+            issues.extend(scan_text_for_secrets(cells[idx].source, f"{rel} (cell {idx})"))
+        return issues
+
+    client_hits: list[SecretHit] = []
+    for first_line, text in _added_hunks(added_lines):
+        offsets = _line_offsets(text)
+        for hit in SECRET_SCANNER.scan(text):
+            if hit.rule == "client-side-key":
+                client_hits.append(hit)
+                continue
+            line_no = first_line + bisect_right(offsets, hit.start) - 1
+            issues.extend(_secret_issues([hit], f"{rel}:{line_no}"))
+
+    if client_hits and file_path.suffix in CLIENT_SIDE_SUFFIXES:
+        try:
+            use_client = _has_use_client(file_path.read_text(encoding="utf-8", errors="ignore"))
+        except OSError:
+            use_client = False
+        issues.extend(_client_side_key_issues(client_hits, file_path, use_client))
+    return issues
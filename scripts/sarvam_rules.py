@@ -1,13 +1,31 @@
-"""Load and query scripts/sarvam_api_rules.json for PR validation."""
+"""Load and query scripts/sarvam_api_rules.json for PR validation.
+
+get_rules() returns a compiled SarvamApiRules snapshot and reloads it when
+the JSON file changes on disk, so long-running validators pick up edits made
+by sync_sarvam_rules.py without restarting. The compiled snapshot is also
+pickled (keyed by content hash) so fresh processes skip rebuilding the
+lookup tables. The pickle lives in the user's cache directory, outside the
+checkout, and is only loaded when the current user owns it and nobody else
+can write to it -- unpickling runs code, so it must not be something a PR
+can ship.
+"""
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
 import re
-from dataclasses import dataclass
-from functools import lru_cache
+import tempfile
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
 RULES_PATH = Path(__file__).resolve().parent / "sarvam_api_rules.json"
+# Bump when SarvamApiRules or load_rules changes so stale pickles are rebuilt.
+SNAPSHOT_VERSION = 1
+SNAPSHOT_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "sarvam-cookbook"
 
 # Matches model assignments in Python, TS/JS, JSON, and notebooks.
 # Includes unquoted JS/TS object keys: model: "sarvam-30b"
@@ -31,6 +49,29 @@ LANGUAGE_CODE_RE = re.compile(
     re.IGNORECASE | re.VERBOSE,
 )
 
+# MODEL_VALUE_RE and LANGUAGE_CODE_RE rewritten to start at their keyword, with
+# whitespace and values confined to one line. iter_rule_values finds keywords
+# with str.find and matches these anchored there, on lowercased text.
+_WS = r"[^\S\n]*"
+_MODEL_AT = rf"""
+    model(?:(?<=["']model)["']{_WS}:|(?<![a-z0-9_]model){_WS}:|{_WS}=)
+    {_WS}["'](?P<model>[^"'\n]+)["']
+"""
+_LANGUAGE_CODE_AT = rf"""
+    (?:source_|target_)?language_code
+    (?:(?<=["']language_code)["']{_WS}:
+      |(?<=["']source_language_code)["']{_WS}:
+      |(?<=["']target_language_code)["']{_WS}:
+      |{_WS}=)
+    {_WS}["'](?P<language_code>[a-z]{{2,4}}-in)["']
+"""
+_RULE_MATCHERS = (
+    ("model", re.compile(_MODEL_AT, re.VERBOSE)),
+    ("language_code", re.compile(_LANGUAGE_CODE_AT, re.VERBOSE)),
+)
+# Fallback for text whose length changes when lowercased.
+RULE_VALUE_RE = re.compile(f"{_MODEL_AT}|{_LANGUAGE_CODE_AT}", re.IGNORECASE | re.VERBOSE)
+
 SARVAM_MODEL_MARKERS = (
     "sarvam-",
     "sarvam-translate:",
@@ -54,23 +95,41 @@ class SarvamApiRules:
     tts_language_codes: frozenset[str]
     invalid_language_codes: dict[str, str]
     raw: dict
+    # Precomputed lookups so rule checks cost one dict/set probe per match.
+    model_status: dict[str, str] = field(default_factory=dict)  # "deprecated" | "allowed" | "recommended"
+    replacements: dict[str, str] = field(default_factory=dict)  # deprecated -> first recommended in its group
+    language_codes: frozenset[str] = frozenset()  # stt | tts
 
 
 def load_rules(path: Path | None = None) -> SarvamApiRules:
     """Load and parse the API rules JSON file."""
     rules_path = path or RULES_PATH
-    data = json.loads(rules_path.read_text(encoding="utf-8"))
+    return compile_rules(json.loads(rules_path.read_text(encoding="utf-8")))
+
+
+def compile_rules(data: dict) -> SarvamApiRules:
+    """Build SarvamApiRules and its lookup tables from parsed rules JSON."""
 
     allowed: set[str] = set()
     recommended: set[str] = set()
     deprecated: set[str] = set()
+    replacements: dict[str, str] = {}
 
     for group in data.get("models", {}).values():
         allowed.update(group.get("allowed", []))
         recommended.update(group.get("recommended", []))
         deprecated.update(group.get("deprecated", []))
+        rec = group.get("recommended", [])
+        if rec:
+            for model in group.get("deprecated", []):
+                replacements.setdefault(model, rec[0])
+
+    model_status = {model: "recommended" if model in recommended else "allowed" for model in allowed}
+    model_status.update(dict.fromkeys(deprecated, "deprecated"))
 
     lang = data.get("language_codes", {})
+    stt_codes = frozenset(lang.get("stt", []))
+    tts_codes = frozenset(lang.get("tts", []))
     return SarvamApiRules(
         schema_version=data.get("schema_version", 1),
         synced_at=data.get("synced_at", ""),
@@ -79,16 +138,100 @@ def load_rules(path: Path | None = None) -> SarvamApiRules:
         allowed_models=frozenset(allowed),
         recommended_models=frozenset(recommended),
         deprecated_models=frozenset(deprecated),
-        stt_language_codes=frozenset(lang.get("stt", [])),
-        tts_language_codes=frozenset(lang.get("tts", [])),
+        stt_language_codes=stt_codes,
+        tts_language_codes=tts_codes,
         invalid_language_codes=dict(lang.get("invalid", {})),
         raw=data,
+        model_status=model_status,
+        replacements=replacements,
+        language_codes=stt_codes | tts_codes,
     )
 
 
-@lru_cache(maxsize=1)
-def get_rules() -> SarvamApiRules:
-    return load_rules()
+def snapshot_path(rules_path: Path) -> Path:
+    """Return where the pickled snapshot for rules_path is stored."""
+    key = hashlib.sha256(str(rules_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return SNAPSHOT_DIR / f"{rules_path.stem}.{key}.snapshot.pickle"
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """True when only the current user could have written the file behind st."""
+    if hasattr(os, "getuid") and st.st_uid != os.getuid():
+        return False
+    return not st.st_mode & 0o022
+
+
+def _read_snapshot(rules_path: Path, digest: str) -> SarvamApiRules | None:
+    target = snapshot_path(rules_path)
+    try:
+        with target.open("rb") as fh:
+            if not (_is_private(os.fstat(fh.fileno())) and _is_private(target.parent.stat())):
+                return None
+            version, snap_digest, rules = pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError, TypeError):
+        return None
+    if version != SNAPSHOT_VERSION or snap_digest != digest or not isinstance(rules, SarvamApiRules):
+        return None
+    return rules
+
+
+def _write_snapshot(rules_path: Path, digest: str, rules: SarvamApiRules) -> None:
+    """Store the compiled snapshot; failures are ignored (it is only a cache)."""
+    target = snapshot_path(rules_path)
+    try:
+        target.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump((SNAPSHOT_VERSION, digest, rules), fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+    except OSError:
+        pass
+
+
+class _RulesSnapshot:
+    """The last compiled rules, with the stat and content hash they came from."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.stamp: tuple[str, int, int] | None = None
+        self.digest = ""
+        self.rules: SarvamApiRules | None = None
+
+
+_snapshot = _RulesSnapshot()
+
+
+def get_rules(path: Path | None = None) -> SarvamApiRules:
+    """Return compiled rules, reloading when the JSON file changes on disk.
+
+    Each call costs one stat(). A changed mtime or size triggers a re-read;
+    the content hash then decides whether a recompile is actually needed.
+    If the file is mid-rewrite and does not parse, the previous snapshot is
+    kept until the next call.
+    """
+    rules_path = path or RULES_PATH
+    st = rules_path.stat()
+    stamp = (str(rules_path), st.st_mtime_ns, st.st_size)
+    with _snapshot.lock:
+        if _snapshot.rules is not None and _snapshot.stamp == stamp:
+            return _snapshot.rules
+
+        raw = rules_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        rules = _snapshot.rules if _snapshot.digest == digest else None
+        if rules is None:
+            rules = _read_snapshot(rules_path, digest)
+        if rules is None:
+            try:
+                rules = compile_rules(json.loads(raw.decode("utf-8")))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                if _snapshot.rules is not None and _snapshot.stamp is not None and _snapshot.stamp[0] == stamp[0]:
+                    return _snapshot.rules
+                raise
+            _write_snapshot(rules_path, digest, rules)
+
+        _snapshot.stamp, _snapshot.digest, _snapshot.rules = stamp, digest, rules
+        return rules
 
 
 def extract_models(line: str) -> list[str]:
@@ -111,6 +254,36 @@ def extract_language_codes(line: str) -> list[str]:
     return codes
 
 
+def iter_rule_values(text: str) -> Iterator[tuple[int, str, str]]:
+    """Yield (offset, "model" | "language_code", value) for every reference in text.
+
+    Cost is one substring search per keyword plus one anchored match per
+    keyword occurrence, however many lines text holds.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        for match in RULE_VALUE_RE.finditer(text):
+            kind = match.lastgroup or ""
+            yield match.start(), kind, match[kind]
+        return
+
+    found: list[tuple[int, str, str]] = []
+    for kind, pattern in _RULE_MATCHERS:
+        pos = lowered.find(kind)
+        while pos != -1:
+            start = pos
+            if kind == "language_code" and lowered.endswith(("source_", "target_"), 0, pos):
+                start = pos - len("source_")
+            match = pattern.match(lowered, start)
+            if match:
+                found.append((start, kind, text[match.start(kind):match.end(kind)]))
+                pos = lowered.find(kind, match.end())
+            else:
+                pos = lowered.find(kind, pos + 1)
+    found.sort()
+    yield from found
+
+
 def is_sarvam_model_name(model: str) -> bool:
     lowered = model.lower()
     return any(lowered.startswith(marker) for marker in SARVAM_MODEL_MARKERS)
@@ -118,9 +291,4 @@ def is_sarvam_model_name(model: str) -> bool:
 
 def recommended_for(model: str, rules: SarvamApiRules) -> str | None:
     """Suggest a replacement when model is deprecated."""
-    for group_name, group in rules.raw.get("models", {}).items():
-        if model in group.get("deprecated", []):
-            rec = group.get("recommended", [])
-            if rec:
-                return rec[0]
-    return None
+    return rules.replacements.get(model)
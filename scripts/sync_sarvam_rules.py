@@ -16,7 +16,9 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import sys
+import tempfile
 import urllib.error
 import urllib.request
 from datetime import UTC, datetime
@@ -102,6 +104,19 @@ def render_rules(rules: dict) -> str:
     return json.dumps(rules, indent=2, sort_keys=False) + "\n"
 
 
+def write_rules(rules: dict, path: Path | None = None) -> None:
+    """Write rules JSON via rename so watchers never see a half-written file."""
+    target = path or RULES_PATH
+    fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(render_rules(rules))
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
 def rules_fingerprint(rules: dict) -> str:
     """Stable hash of rule content, excluding synced_at timestamp."""
     payload = {k: v for k, v in rules.items() if k != "synced_at"}
@@ -148,7 +163,7 @@ def main() -> int:
         print("sarvam_api_rules.json is up to date.")
         return 0
 
-    RULES_PATH.write_text(render_rules(rules), encoding="utf-8")
+    write_rules(rules)
     if args.verbose or changed:
         print(f"Wrote {RULES_PATH} (changed={changed})")
     else:
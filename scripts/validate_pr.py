@@ -4,11 +4,16 @@ Usage:
     python scripts/validate_pr.py --base-ref main
     python scripts/validate_pr.py --base-ref main --strict
     python scripts/validate_pr.py --base-ref main --json
+    python scripts/validate_pr.py --base-ref main --diff-only
 
 Runs on changed files under examples/ and getting-started/:
   - Secret / API key leak detection (blocking)
   - Client-side API key references (blocking)
 
+With --diff-only, files that already existed on the base ref are scanned in
+their added hunks only (notebook hunks are mapped back to the touched cells);
+new files are still scanned in full.
+
 Recipe structure is validated separately for new kebab-case recipe dirs.
 See scripts/sarvam_api_rules.json for current Sarvam models (reference only).
 
@@ -22,47 +27,71 @@ import sys
 from pathlib import Path
 
 from sarvam_checks import (
+    FileDiff,
     Issue,
+    git_diff_added_lines,
+    git_diff_index,
     git_diff_name_only,
-    scan_file_for_client_side_keys,
-    scan_file_for_secrets,
+    scan_added_lines_for_secrets,
+    scan_file_for_secret_rules,
 )
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 SCAN_PREFIXES = ("examples/", "getting-started/")
 
 
-def changed_paths(base_ref: str, head_ref: str = "HEAD") -> list[Path]:
+def changed_paths(
+    base_ref: str,
+    head_ref: str = "HEAD",
+    index: dict[str, FileDiff] | None = None,
+) -> list[Path]:
     """Return repo-relative paths changed in the PR."""
     paths: list[Path] = []
-    for rel in git_diff_name_only(base_ref, head_ref):
+    for rel in git_diff_name_only(base_ref, head_ref, index=index):
         if rel.startswith(SCAN_PREFIXES):
             paths.append(Path(rel))
     return paths
 
 
-def validate_pr_with_refs(base_ref: str, head_ref: str = "HEAD") -> list[Issue]:
-    """Run PR-scoped secret checks between base_ref and head_ref."""
+def validate_pr_with_refs(
+    base_ref: str,
+    head_ref: str = "HEAD",
+    *,
+    diff_only: bool = False,
+    index: dict[str, FileDiff] | None = None,
+) -> list[Issue]:
+    """Run PR-scoped secret checks between base_ref and head_ref.
+
+    With diff_only, modified files are scanned in their added hunks only.
+    Pass a prebuilt git_diff_index to share one `git diff` with other checks.
+    """
     issues: list[Issue] = []
-    changed = changed_paths(base_ref, head_ref)
+    if index is None:
+        index = git_diff_index(base_ref, head_ref)
+    changed = changed_paths(base_ref, head_ref, index)
     if not changed:
         return issues
 
+    new_files = set(git_diff_name_only(base_ref, head_ref, diff_filter="A", index=index)) if diff_only else set()
+
     seen_files: set[Path] = set()
     for rel in changed:
         full = REPO_ROOT / rel
         if not full.exists() or full in seen_files:
             continue
         seen_files.add(full)
-        issues.extend(scan_file_for_secrets(full, REPO_ROOT))
-        issues.extend(scan_file_for_client_side_keys(full))
+        if diff_only and rel.as_posix() not in new_files:
+            added = git_diff_added_lines(base_ref, rel.as_posix(), head_ref, index)
+            issues.extend(scan_added_lines_for_secrets(full, added, REPO_ROOT))
+        else:
+            issues.extend(scan_file_for_secret_rules(full, REPO_ROOT))
 
     return issues
 
 
-def validate_pr(base_ref: str) -> list[Issue]:
+def validate_pr(base_ref: str, *, diff_only: bool = False) -> list[Issue]:
     """Run PR-scoped secret checks on changed files."""
-    return validate_pr_with_refs(base_ref, "HEAD")
+    return validate_pr_with_refs(base_ref, "HEAD", diff_only=diff_only)
 
 
 def main() -> int:
@@ -84,9 +113,14 @@ def main() -> int:
         action="store_true",
         help="Emit machine-readable JSON output.",
     )
+    parser.add_argument(
+        "--diff-only",
+        action="store_true",
+        help="Scan only added hunks of modified files (new files are scanned in full).",
+    )
     args = parser.parse_args()
 
-    issues = validate_pr(args.base_ref)
+    issues = validate_pr(args.base_ref, diff_only=args.diff_only)
     errors = [i for i in issues if i.severity == "error"]
     warnings = [i for i in issues if i.severity == "warning"]
 
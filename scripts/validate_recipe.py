@@ -5,6 +5,8 @@ Usage:
     python scripts/validate_recipe.py examples/my-recipe --strict
     python scripts/validate_recipe.py examples/my-recipe --json
     python scripts/validate_recipe.py examples/my-recipe --fix
+    python scripts/validate_recipe.py examples/a-recipe examples/b-recipe
+    python scripts/validate_recipe.py --all --jobs 8
 
 Exit codes:
     0  — no errors found (warnings may be present)
@@ -15,6 +17,10 @@ Flags:
     --json    Output results as a JSON array (machine-readable).
     --fix     Auto-repair common issues (.gitignore, .gitkeep, .env.example)
               before running validation.
+    --all     Validate every recipe under examples/.
+    --jobs N  Worker processes used when validating several recipes.
+    --no-cache
+              Skip the content-hash result cache in .cache/validate_recipe/.
 
 All checks are purely file-system based; no network calls are made and no
 API keys are required.
@@ -23,13 +29,26 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import NamedTuple
+from typing import Callable, NamedTuple
 
 from packaging.version import Version
 
+from sarvam_checks import (
+    SECRET_SCANNER,
+    NotebookCell,
+    SecretHit,
+    file_secret_hits,
+    is_recipe_directory,
+    load_notebook,
+)
+from validation_cache import ResultCache, file_digest
+
 # ---------------------------------------------------------------------------
 # Data types
 # ---------------------------------------------------------------------------
@@ -44,26 +63,67 @@ class Issue(NamedTuple):
     suggestion: str | None = None  # optional remediation hint
 
 
+class RecipeSnapshot:
+    """Read-once view of a recipe directory shared by every check.
+
+    The file listing, each file's content digest, and each notebook's decoded
+    cells are loaded lazily on first use and memoised, so a notebook is
+    decoded at most once per validation run no matter how many checks inspect
+    it. Large notebooks are streamed (see sarvam_checks.load_notebook).
+    """
+
+    def __init__(self, recipe_dir: Path) -> None:
+        self.recipe_dir = recipe_dir
+        self._files: list[Path] | None = None
+        self._digests: dict[Path, str | None] = {}
+        self._notebooks: dict[Path, list[NotebookCell] | None] = {}
+
+    def files(self) -> list[Path]:
+        """Return every regular file under the recipe, sorted by path."""
+        if self._files is None:
+            self._files = sorted(p for p in self.recipe_dir.rglob("*") if p.is_file())
+        return self._files
+
+    def digest(self, path: Path) -> str | None:
+        """Return the SHA-256 of path's bytes, or None if it cannot be read."""
+        if path not in self._digests:
+            try:
+                self._digests[path] = file_digest(path)
+            except OSError:
+                self._digests[path] = None
+        return self._digests[path]
+
+    def notebook(self, path: Path) -> list[NotebookCell] | None:
+        """Return the decoded cells of a notebook, or None if it is unparseable."""
+        if path not in self._notebooks:
+            self._notebooks[path] = load_notebook(path)
+        return self._notebooks[path]
+
+
 # ---------------------------------------------------------------------------
 # Module-level constants
 # ---------------------------------------------------------------------------
 
+# Bump whenever a cached check's logic or messages change so that stale
+# entries in the result cache are no longer hit.
+VALIDATOR_VERSION = "2"
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Directory searched for recipes by --all. getting-started/ holds single-API
+# tutorial notebooks rather than recipes, so it is not included.
+_RECIPE_ROOT = "examples"
+
 _REQUIRED_GITIGNORE_PATTERNS: list[str] = [".env", "sample_data/*", "outputs/*"]
 
 _MIN_SARVAMAI_VERSION = Version("0.1.24")
 _MIN_PILLOW_VERSION = Version("12.1.1")
 
-# Matches hardcoded keys of the form:
-#   SARVAM_API_KEY = "real-value"   or   api_subscription_key="real-value"
-# Does NOT match:
-#   YOUR_SARVAM_API_KEY, your_key, <your …>, your-key (placeholder patterns)
-#   Unquoted references such as api_subscription_key=SARVAM_API_KEY
-#   os.environ.get(...) assignments
-_SECRET_RE = re.compile(
-    r"(?:SARVAM_API_KEY|api_subscription_key)\s*=\s*"
-    r"""[\"'](?!YOUR_SARVAM|your_key|<your|your-key)[^\"']{10,}[\"']""",
-    re.IGNORECASE,
-)
+# SECRET_SCANNER rules that count as a hardcoded key in a recipe file:
+#   SARVAM_API_KEY = "real-value", api_subscription_key="real-value", sk_<key>
+# Placeholders (YOUR_SARVAM_API_KEY, your-key, <your …>), unquoted references
+# and os.environ.get(...) assignments are not reported by the scanner.
+_SECRET_RULES = frozenset({"assignment", "sk-prefix"})
 
 # Unicode blocks that cover the overwhelming majority of emoji characters.
 # Deliberately excludes Devanagari, Tamil, and other Indic script blocks so
@@ -104,40 +164,34 @@ def _notebook_name(recipe_dir: Path) -> str:
     return recipe_dir.name.replace("-", "_") + ".ipynb"
 
 
-def _load_notebook_cells(nb_path: Path) -> list[dict] | None:
-    """Parse a Jupyter notebook JSON file and return its cell list.
-
-    Uses the stdlib json module; the notebook is never executed.
-
-    Args:
-        nb_path: Path to the .ipynb file.
-
-    Returns:
-        List of cell dicts, or None if the file cannot be parsed.
-    """
-    try:
-        nb = json.loads(nb_path.read_text(encoding="utf-8"))
-        cells = nb.get("cells")
-        return cells if isinstance(cells, list) else []
-    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
-        return None
-
-
-def _cell_source(cell: dict) -> str:
-    """Return the joined source text of a notebook cell.
-
-    Handles both list-of-strings and plain-string source formats.
+def _cached_issues(
+    cache: ResultCache | None,
+    check: str,
+    rel: Path | str,
+    digest: str,
+    compute: Callable[[], list[Issue]],
+) -> list[Issue]:
+    """Return compute() for one file, served from cache when content is unchanged.
 
     Args:
-        cell: A Jupyter cell dict.
+        cache:   Result cache, or None to always compute.
+        check:   Check name (part of the cache key).
+        rel:     File path relative to the recipe (part of the key and messages).
+        digest:  SHA-256 of the file bytes the result depends on.
+        compute: Zero-argument callable producing the issues on a miss.
 
     Returns:
-        The full source as a single string.
+        The issues for this file.
     """
-    src = cell.get("source", [])
-    if isinstance(src, list):
-        return "".join(src)
-    return str(src) if src else ""
+    if cache is None:
+        return compute()
+    key = cache.key(check, str(rel), digest)
+    rows = cache.get(key)
+    if rows is not None:
+        return [Issue(*row) for row in rows]
+    issues = compute()
+    cache.put(key, [list(i) for i in issues])
+    return issues
 
 
 # ---------------------------------------------------------------------------
@@ -276,7 +330,41 @@ def check_requirements(recipe_dir: Path) -> list[Issue]:
     return issues
 
 
-def check_secrets(recipe_dir: Path) -> list[Issue]:
+def _has_secret(hits: list[SecretHit]) -> bool:
+    """Return True when any scanner hit is a hardcoded key."""
+    return any(hit.rule in _SECRET_RULES for hit in hits)
+
+
+def _file_secret_issues(snapshot: RecipeSnapshot, fp: Path, rel: Path) -> list[Issue]:
+    """Scan one file for hardcoded API keys (uncached core of check_secrets)."""
+    if fp.suffix == ".ipynb":
+        cells = snapshot.notebook(fp)
+        if cells is None:
+            return []
+        for cell in cells:
+            if _has_secret(SECRET_SCANNER.scan(cell.source)):
+                return [Issue(
+                    "error", "secrets",
+                    f"Possible hardcoded API key in notebook: {rel}",
+                    "Remove the key and load it via os.environ or python-dotenv instead.",
+                )]  # one error per notebook is sufficient
+        return []
+
+    scanned = file_secret_hits(fp)
+    if scanned and _has_secret(scanned[0]):
+        return [Issue(
+            "error", "secrets",
+            f"Possible hardcoded API key in: {rel}",
+            "Remove the key and load it via os.environ or python-dotenv instead.",
+        )]
+    return []
+
+
+def check_secrets(
+    recipe_dir: Path,
+    cache: ResultCache | None = None,
+    snapshot: RecipeSnapshot | None = None,
+) -> list[Issue]:
     """Scan all recipe files for possible hardcoded API keys.
 
     Notebooks are parsed as JSON and each cell's source is scanned
@@ -285,70 +373,33 @@ def check_secrets(recipe_dir: Path) -> list[Issue]:
 
     Args:
         recipe_dir: Path to the recipe directory being checked.
+        cache:      Optional result cache; unchanged files are not rescanned.
+        snapshot:   Shared read-once view of recipe_dir (created if omitted).
 
     Returns:
         Error Issues for any suspected secret leaks found.
     """
+    snapshot = snapshot or RecipeSnapshot(recipe_dir)
     issues: list[Issue] = []
 
-    for fp in sorted(recipe_dir.rglob("*")):
-        if not fp.is_file():
-            continue
+    for fp in snapshot.files():
         if fp.suffix.lower() in _BINARY_SUFFIXES or fp.name == ".gitkeep":
             continue
 
-        try:
-            text = fp.read_text(encoding="utf-8", errors="ignore")
-        except OSError:
+        digest = snapshot.digest(fp)
+        if digest is None:
             continue
 
         rel = fp.relative_to(recipe_dir)
-
-        if fp.suffix == ".ipynb":
-            cells = _load_notebook_cells(fp)
-            if cells is None:
-                continue
-            for cell in cells:
-                if _SECRET_RE.search(_cell_source(cell)):
-                    issues.append(Issue(
-                        "error", "secrets",
-                        f"Possible hardcoded API key in notebook: {rel}",
-                        "Remove the key and load it via os.environ or python-dotenv instead.",
-                    ))
-                    break  # one error per notebook is sufficient
-        elif _SECRET_RE.search(text):
-            issues.append(Issue(
-                "error", "secrets",
-                f"Possible hardcoded API key in: {rel}",
-                "Remove the key and load it via os.environ or python-dotenv instead.",
-            ))
+        compute = partial(_file_secret_issues, snapshot, fp, rel)
+        issues.extend(_cached_issues(cache, "secrets", rel, digest, compute))
 
     return issues
 
 
-def check_notebook_structure(recipe_dir: Path) -> list[Issue]:
-    """Validate notebook cell structure against CONTRIBUTING.md standards.
-
-    Checks performed (from CONTRIBUTING.md § Notebook Structure):
-    - Cell 0 (index 0) must be a markdown title cell.
-    - Cell 1 (index 1) must be a code cell containing 'pip install'.
-    - At least one code cell must contain 'from __future__ import annotations'.
-    - At least one code cell must contain 'raise RuntimeError' (API key guard).
-    - pathlib is expected to be imported (warning only).
-
-    The notebook is parsed as JSON; it is never executed.
-
-    Args:
-        recipe_dir: Path to the recipe directory being checked.
-
-    Returns:
-        Issues for structural violations (mix of errors and warnings).
-    """
-    nb_path = recipe_dir / _notebook_name(recipe_dir)
-    if not nb_path.exists():
-        return []  # absence already reported by check_required_files
-
-    cells = _load_notebook_cells(nb_path)
+def _notebook_structure_issues(snapshot: RecipeSnapshot, nb_path: Path) -> list[Issue]:
+    """Validate one notebook (uncached core of check_notebook_structure)."""
+    cells = snapshot.notebook(nb_path)
     if cells is None:
         return [Issue(
             "error", "notebook-structure",
@@ -365,7 +416,7 @@ def check_notebook_structure(recipe_dir: Path) -> list[Issue]:
     issues: list[Issue] = []
 
     # Cell 0 must be markdown.
-    if cells[0].get("cell_type") != "markdown":
+    if cells[0].cell_type != "markdown":
         issues.append(Issue(
             "error", "notebook-structure",
             "Cell 1 (index 0) must be a markdown title cell with pipeline overview",
@@ -381,14 +432,14 @@ def check_notebook_structure(recipe_dir: Path) -> list[Issue]:
         ))
         return issues
 
-    if cells[1].get("cell_type") != "code":
+    if cells[1].cell_type != "code":
         issues.append(Issue(
             "error", "notebook-structure",
             "Cell 2 (index 1) must be a code cell containing the pip install command",
             "Change the second cell type to code and add '%pip install ...'.",
         ))
     else:
-        src = _cell_source(cells[1])
+        src = cells[1].source
         if "pip install" not in src:
             issues.append(Issue(
                 "warning", "notebook-structure",
@@ -398,7 +449,7 @@ def check_notebook_structure(recipe_dir: Path) -> list[Issue]:
 
     # Aggregate all code-cell source for global keyword checks.
     all_code = "\n".join(
-        _cell_source(c) for c in cells if c.get("cell_type") == "code"
+        c.source for c in cells if c.cell_type == "code"
     )
 
     if "from __future__ import annotations" not in all_code:
@@ -425,34 +476,51 @@ def check_notebook_structure(recipe_dir: Path) -> list[Issue]:
     return issues
 
 
-def check_emoji(recipe_dir: Path) -> list[Issue]:
-    """Detect emoji in notebook print statements, comments, and markdown cells.
+def check_notebook_structure(
+    recipe_dir: Path,
+    cache: ResultCache | None = None,
+    snapshot: RecipeSnapshot | None = None,
+) -> list[Issue]:
+    """Validate notebook cell structure against CONTRIBUTING.md standards.
 
-    Per CONTRIBUTING.md § Code Conventions: no emojis in any print statement,
-    inline comment, or markdown cell.
+    Checks performed (from CONTRIBUTING.md § Notebook Structure):
+    - Cell 0 (index 0) must be a markdown title cell.
+    - Cell 1 (index 1) must be a code cell containing 'pip install'.
+    - At least one code cell must contain 'from __future__ import annotations'.
+    - At least one code cell must contain 'raise RuntimeError' (API key guard).
+    - pathlib is expected to be imported (warning only).
 
-    Indic-script characters (Devanagari, Tamil, etc.) are NOT flagged;
-    the regex covers only the standard Unicode emoji blocks.
+    The notebook is parsed as JSON; it is never executed.
 
     Args:
         recipe_dir: Path to the recipe directory being checked.
+        cache:      Optional result cache; an unchanged notebook is not re-parsed.
+        snapshot:   Shared read-once view of recipe_dir (created if omitted).
 
     Returns:
-        Error Issues for each emoji violation found.
+        Issues for structural violations (mix of errors and warnings).
     """
     nb_path = recipe_dir / _notebook_name(recipe_dir)
     if not nb_path.exists():
-        return []
+        return []  # absence already reported by check_required_files
+
+    snapshot = snapshot or RecipeSnapshot(recipe_dir)
+    digest = snapshot.digest(nb_path) or ""
+    compute = partial(_notebook_structure_issues, snapshot, nb_path)
+    return _cached_issues(cache, "notebook-structure", nb_path.name, digest, compute)
 
-    cells = _load_notebook_cells(nb_path)
+
+def _emoji_issues(snapshot: RecipeSnapshot, nb_path: Path) -> list[Issue]:
+    """Scan one notebook for emoji (uncached core of check_emoji)."""
+    cells = snapshot.notebook(nb_path)
     if not cells:
         return []
 
     issues: list[Issue] = []
 
     for cell in cells:
-        cell_type = cell.get("cell_type")
-        src = _cell_source(cell)
+        cell_type = cell.cell_type
+        src = cell.source
 
         if cell_type == "code":
             for line in src.splitlines():
@@ -483,32 +551,130 @@ def check_emoji(recipe_dir: Path) -> list[Issue]:
     return issues
 
 
+def check_emoji(
+    recipe_dir: Path,
+    cache: ResultCache | None = None,
+    snapshot: RecipeSnapshot | None = None,
+) -> list[Issue]:
+    """Detect emoji in notebook print statements, comments, and markdown cells.
+
+    Per CONTRIBUTING.md § Code Conventions: no emojis in any print statement,
+    inline comment, or markdown cell.
+
+    Indic-script characters (Devanagari, Tamil, etc.) are NOT flagged;
+    the regex covers only the standard Unicode emoji blocks.
+
+    Args:
+        recipe_dir: Path to the recipe directory being checked.
+        cache:      Optional result cache; an unchanged notebook is not re-scanned.
+        snapshot:   Shared read-once view of recipe_dir (created if omitted).
+
+    Returns:
+        Error Issues for each emoji violation found.
+    """
+    nb_path = recipe_dir / _notebook_name(recipe_dir)
+    if not nb_path.exists():
+        return []
+
+    snapshot = snapshot or RecipeSnapshot(recipe_dir)
+    digest = snapshot.digest(nb_path)
+    if digest is None:
+        return []
+    compute = partial(_emoji_issues, snapshot, nb_path)
+    return _cached_issues(cache, "no-emoji", nb_path.name, digest, compute)
+
+
 # ---------------------------------------------------------------------------
 # Orchestrator
 # ---------------------------------------------------------------------------
 
+# Check functions in the order defined in CONTRIBUTING.md.
+CHECKS = (
+    check_required_files,
+    check_gitignore,
+    check_requirements,
+    check_secrets,
+    check_notebook_structure,
+    check_emoji,
+)
+
+# Checks that read file contents; they share one RecipeSnapshot per recipe and
+# can serve per-file results from a ResultCache.
+_CONTENT_CHECKS = frozenset({check_secrets, check_notebook_structure, check_emoji})
+
 
-def validate_recipe(recipe_dir: Path) -> list[Issue]:
+def validate_recipe(recipe_dir: Path, cache: ResultCache | None = None) -> list[Issue]:
     """Run all checks on a recipe directory and return aggregated issues.
 
     Runs check functions in the order defined in CONTRIBUTING.md:
     required-files → gitignore → requirements → secrets →
     notebook-structure → no-emoji.
 
+    Files are read, and notebooks decoded, once through a RecipeSnapshot
+    that is shared by all checks.
+
     Args:
         recipe_dir: Absolute or relative path to the recipe directory.
+        cache:      Optional result cache for the file-content checks.
 
     Returns:
         Combined list of Issues from all check functions.
     """
-    return (
-        check_required_files(recipe_dir)
-        + check_gitignore(recipe_dir)
-        + check_requirements(recipe_dir)
-        + check_secrets(recipe_dir)
-        + check_notebook_structure(recipe_dir)
-        + check_emoji(recipe_dir)
-    )
+    snapshot = RecipeSnapshot(recipe_dir)
+    issues: list[Issue] = []
+    for check in CHECKS:
+        if check in _CONTENT_CHECKS:
+            issues.extend(check(recipe_dir, cache=cache, snapshot=snapshot))
+        else:
+            issues.extend(check(recipe_dir))
+    return issues
+
+
+def discover_recipes(repo_root: Path = _REPO_ROOT) -> list[Path]:
+    """Return every recipe directory under examples/, sorted by path.
+
+    A directory counts as a recipe when sarvam_checks.is_recipe_directory
+    accepts it, so app-style and legacy examples are skipped.
+
+    Args:
+        repo_root: Repository root containing examples/.
+
+    Returns:
+        Sorted list of recipe directory paths.
+    """
+    root = repo_root / _RECIPE_ROOT
+    if not root.is_dir():
+        return []
+    return sorted(p for p in root.iterdir() if is_recipe_directory(p))
+
+
+def validate_recipes(
+    recipe_dirs: list[Path],
+    jobs: int | None = None,
+    cache: ResultCache | None = None,
+) -> list[tuple[Path, list[Issue]]]:
+    """Validate several recipe directories in a process pool.
+
+    Each recipe is one task, so its files are read and its notebook decoded
+    once by a single worker. Results are collected in input order, so the
+    output is identical to calling validate_recipe() on each directory in turn.
+
+    Args:
+        recipe_dirs: Recipe directories to validate.
+        jobs:        Worker process count; defaults to os.cpu_count().
+                     1 (or a single recipe) runs everything in-process.
+        cache:       Optional result cache shared by all workers.
+
+    Returns:
+        (recipe_dir, issues) pairs in the same order as recipe_dirs.
+    """
+    workers = jobs or os.cpu_count() or 1
+    if workers <= 1 or len(recipe_dirs) <= 1:
+        return [(d, validate_recipe(d, cache)) for d in recipe_dirs]
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(recipe_dirs))) as pool:
+        issue_lists = list(pool.map(validate_recipe, recipe_dirs, [cache] * len(recipe_dirs)))
+    return list(zip(recipe_dirs, issue_lists))
 
 
 # ---------------------------------------------------------------------------
@@ -585,9 +751,27 @@ def main() -> int:
         ),
     )
     parser.add_argument(
-        "recipe_dir",
+        "recipe_dirs",
         type=Path,
-        help="Path to the recipe directory to validate (e.g. examples/my-recipe)",
+        nargs="*",
+        metavar="recipe_dir",
+        help="Path(s) to the recipe directories to validate (e.g. examples/my-recipe)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Validate every recipe under examples/.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for multi-recipe runs (default: CPU count).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the content-hash result cache.",
     )
     parser.add_argument(
         "--strict",
@@ -606,52 +790,82 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    recipe_dir: Path = args.recipe_dir.resolve()
-    if not recipe_dir.is_dir():
-        print(f"ERROR: {recipe_dir} is not a directory.", file=sys.stderr)
-        return 1
+    if args.all:
+        recipe_dirs = discover_recipes()
+    elif args.recipe_dirs:
+        recipe_dirs = [d.resolve() for d in args.recipe_dirs]
+    else:
+        parser.error("provide at least one recipe_dir or use --all")
+
+    for recipe_dir in recipe_dirs:
+        if not recipe_dir.is_dir():
+            print(f"ERROR: {recipe_dir} is not a directory.", file=sys.stderr)
+            return 1
 
     if args.fix:
-        fixes = auto_fix(recipe_dir)
-        if fixes:
-            print("Auto-fix applied:")
-            for fix in fixes:
-                print(f"  + {fix}")
-            print()
-
-    issues = validate_recipe(recipe_dir)
+        for recipe_dir in recipe_dirs:
+            fixes = auto_fix(recipe_dir)
+            if fixes:
+                print(f"Auto-fix applied ({recipe_dir.name}):")
+                for fix in fixes:
+                    print(f"  + {fix}")
+                print()
+
+    if not recipe_dirs:
+        print("No recipe directories found.")
+        return 0
+
+    cache = None if args.no_cache else ResultCache(VALIDATOR_VERSION)
+    results = validate_recipes(recipe_dirs, jobs=args.jobs, cache=cache)
+    multi = len(results) > 1
+    issues = [i for _, recipe_issues in results for i in recipe_issues]
     errors = [i for i in issues if i.severity == "error"]
-    warnings = [i for i in issues if i.severity == "warning"]
 
     if args.json:
-        print(json.dumps(
-            [
-                {
+        payload: list[dict] = []
+        for recipe_dir, recipe_issues in results:
+            for i in recipe_issues:
+                entry = {
                     "severity": i.severity,
                     "check": i.check,
                     "message": i.message,
                     "suggestion": i.suggestion,
                 }
-                for i in issues
-            ],
-            indent=2,
-        ))
+                if multi:
+                    entry["recipe"] = recipe_dir.name
+                payload.append(entry)
+        print(json.dumps(payload, indent=2))
         if args.strict:
             return 1 if issues else 0
         return 1 if errors else 0
 
-    for issue in issues:
-        tag = "ERROR  " if issue.severity == "error" else "WARNING"
-        print(f"  [{tag}] [{issue.check}] {issue.message}")
-        if issue.suggestion:
-            print(f"    Suggestion: {issue.suggestion}")
-        if issue.severity == "error":
-            print(f"::error::{issue.message}")
-        else:
-            print(f"::warning::{issue.message}")
+    for recipe_dir, recipe_issues in results:
+        if multi:
+            print(f"{recipe_dir.name}:")
+        for issue in recipe_issues:
+            tag = "ERROR  " if issue.severity == "error" else "WARNING"
+            print(f"  [{tag}] [{issue.check}] {issue.message}")
+            if issue.suggestion:
+                print(f"    Suggestion: {issue.suggestion}")
+            if issue.severity == "error":
+                print(f"::error::{issue.message}")
+            else:
+                print(f"::warning::{issue.message}")
+
+        recipe_errors = [i for i in recipe_issues if i.severity == "error"]
+        recipe_warnings = [i for i in recipe_issues if i.severity == "warning"]
+        status = "PASS" if not recipe_errors else "FAIL"
+        print(
+            f"\n{status} — {recipe_dir.name}: "
+            f"{len(recipe_errors)} error(s), {len(recipe_warnings)} warning(s)"
+        )
 
-    status = "PASS" if not errors else "FAIL"
-    print(f"\n{status} — {recipe_dir.name}: {len(errors)} error(s), {len(warnings)} warning(s)")
+    if multi:
+        status = "PASS" if not errors else "FAIL"
+        print(
+            f"\n{status} — {len(results)} recipe(s): "
+            f"{len(errors)} error(s), {len(issues) - len(errors)} warning(s)"
+        )
 
     if args.strict:
         return 1 if issues else 0
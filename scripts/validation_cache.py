@@ -0,0 +1,84 @@
+"""On-disk, content-addressed cache for per-file validation results.
+
+Entries are keyed by a SHA-256 over the validator version, the
+sarvam_api_rules.json fingerprint, the check name, the file's path relative to
+its recipe, and a digest of the file's raw bytes. Any change to one of those
+inputs yields a new key, so entries never need explicit invalidation; stale
+ones are simply never read again. Delete the cache directory to reclaim space.
+
+Values are JSON lists of issue rows, so the cache is independent of which
+Issue type a caller uses.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from sync_sarvam_rules import RULES_PATH, rules_fingerprint
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_DIR = REPO_ROOT / ".cache" / "validate_recipe"
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in fixed-size blocks."""
+    with path.open("rb") as fh:
+        return hashlib.file_digest(fh, "sha256").hexdigest()
+
+
+def current_rules_fingerprint(path: Path = RULES_PATH) -> str:
+    """Return a short hash of the rules file content (ignoring synced_at)."""
+    try:
+        rules = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return ""
+    return hashlib.sha256(rules_fingerprint(rules).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Content-hash keyed store of check results under cache_dir."""
+
+    def __init__(
+        self,
+        version: str,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+        rules_fp: str | None = None,
+    ) -> None:
+        self.version = version
+        self.cache_dir = cache_dir
+        self.rules_fp = current_rules_fingerprint() if rules_fp is None else rules_fp
+
+    def key(self, check: str, rel_path: str, content_digest: str) -> str:
+        """Return the cache key for one check over one file's content digest."""
+        digest = hashlib.sha256()
+        for part in (self.version, self.rules_fp, check, rel_path, content_digest):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> list[list] | None:
+        """Return cached rows for key, or None on a miss or unreadable entry."""
+        try:
+            rows = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        return rows if isinstance(rows, list) else None
+
+    def put(self, key: str, rows: list[list]) -> None:
+        """Store rows for key; write failures are ignored (cache is best-effort)."""
+        path = self._entry_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent workers never observe a torn file.
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(rows, fh)
+            os.replace(tmp, path)
+        except OSError:
+            pass
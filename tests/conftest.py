@@ -0,0 +1,17 @@
+"""Shared fixtures for the validation script tests."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import sarvam_rules  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _isolated_rules_snapshot_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Keep get_rules() from writing its pickled snapshot to the real user cache."""
+    monkeypatch.setattr(sarvam_rules, "SNAPSHOT_DIR", tmp_path / "cache")
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -9,13 +10,18 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
+import sarvam_rules  # noqa: E402
 from sarvam_checks import scan_added_lines_for_allowlist  # noqa: E402
 from sarvam_rules import (  # noqa: E402
+    extract_language_codes,
     extract_models,
     get_rules,
+    iter_rule_values,
     load_rules,
+    recommended_for,
+    snapshot_path,
 )
-from sync_sarvam_rules import canonical_rules, rules_fingerprint, sync_rules  # noqa: E402
+from sync_sarvam_rules import canonical_rules, rules_fingerprint, sync_rules, write_rules  # noqa: E402
 
 
 class TestRulesFile:
@@ -39,6 +45,106 @@ class TestRulesFile:
         # Avoid matching fields like `chat_model: "..."` via bare `model:`.
         assert extract_models('chat_model: "sarvam-30b"') == []
 
+    def test_precomputed_lookups(self) -> None:
+        rules = get_rules()
+        assert rules.model_status["sarvam-m"] == "deprecated"
+        assert rules.model_status["saaras:v3"] == "recommended"
+        assert rules.model_status["bulbul:v3-beta"] == "allowed"
+        assert "sarvam-999b" not in rules.model_status
+        assert recommended_for("saarika:v2.5", rules) == "saaras:v3"
+        assert recommended_for("sarvam-105b", rules) is None
+        assert rules.language_codes == rules.stt_language_codes | rules.tts_language_codes
+
+    def test_combined_matcher_agrees_with_line_extractors(self) -> None:
+        lines = [
+            'data = {"model": "sarvam-105b", "language_code": "hi-IN"}',
+            '  model: "sarvam-30b", target_language_code="ta-IN"',
+            "model='saaras:v3'; source_language_code = 'kok-IN'",
+            'chat_model: "sarvam-30b"',
+            'MODEL = "Sarvam-M"  # "language_code": "HI-IN"',
+            # U+0130 lowercases to two characters, forcing the regex fallback.
+            'title = "\u0130"; "model": "sarvam-m", "language_code": "hi-IN"',
+        ]
+        for line in lines:
+            found = list(iter_rule_values(line))
+            assert [v for _, k, v in found if k == "model"] == extract_models(line)
+            assert [v for _, k, v in found if k == "language_code"] == extract_language_codes(line)
+
+    def test_combined_matcher_does_not_span_lines(self) -> None:
+        assert list(iter_rule_values('model =\n"sarvam-m"')) == []
+
+
+class TestRulesSnapshot:
+    @pytest.fixture(autouse=True)
+    def _fresh_snapshot(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("sarvam_rules._snapshot", sarvam_rules._RulesSnapshot())
+
+    @staticmethod
+    def _write(path: Path, allowed_chat: list[str], mtime_ns: int) -> None:
+        rules = canonical_rules()
+        rules["models"]["chat"]["allowed"] = allowed_chat
+        write_rules(rules, path)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    def test_reloads_when_file_changes(self, tmp_path: Path) -> None:
+        path = tmp_path / "sarvam_api_rules.json"
+        self._write(path, ["sarvam-105b"], 1_000_000_000)
+        first = get_rules(path)
+        assert get_rules(path) is first
+        assert "sarvam-future" not in first.allowed_models
+
+        self._write(path, ["sarvam-105b", "sarvam-future"], 2_000_000_000)
+        assert "sarvam-future" in get_rules(path).allowed_models
+
+    def test_touch_without_content_change_keeps_snapshot(self, tmp_path: Path) -> None:
+        path = tmp_path / "sarvam_api_rules.json"
+        self._write(path, ["sarvam-105b"], 1_000_000_000)
+        first = get_rules(path)
+        os.utime(path, ns=(3_000_000_000, 3_000_000_000))
+        assert get_rules(path) is first
+
+    def test_fresh_process_loads_pickled_snapshot(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "sarvam_api_rules.json"
+        self._write(path, ["sarvam-105b"], 1_000_000_000)
+        expected = get_rules(path)
+        assert snapshot_path(path).exists()
+
+        monkeypatch.setattr("sarvam_rules._snapshot", sarvam_rules._RulesSnapshot())
+        monkeypatch.setattr(
+            "sarvam_rules.compile_rules", lambda _data: pytest.fail("snapshot was not reused")
+        )
+        assert get_rules(path) == expected
+
+    def test_snapshot_is_stored_outside_the_checkout(self, tmp_path: Path) -> None:
+        path = tmp_path / "sarvam_api_rules.json"
+        self._write(path, ["sarvam-105b"], 1_000_000_000)
+        get_rules(path)
+        assert snapshot_path(path).parent == tmp_path / "cache"
+        assert not list(tmp_path.glob("*.pickle"))
+
+    def test_writable_snapshot_is_not_unpickled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "sarvam_api_rules.json"
+        self._write(path, ["sarvam-105b"], 1_000_000_000)
+        get_rules(path)
+        snapshot_path(path).chmod(0o666)
+
+        monkeypatch.setattr("sarvam_rules._snapshot", sarvam_rules._RulesSnapshot())
+        monkeypatch.setattr(
+            "sarvam_rules.pickle.load", lambda _fh: pytest.fail("shared-writable snapshot was loaded")
+        )
+        assert "sarvam-105b" in get_rules(path).allowed_models
+
+    def test_torn_write_keeps_previous_rules(self, tmp_path: Path) -> None:
+        path = tmp_path / "sarvam_api_rules.json"
+        self._write(path, ["sarvam-105b"], 1_000_000_000)
+        first = get_rules(path)
+        path.write_text('{"models": ', encoding="utf-8")
+        assert get_rules(path) is first
+
 
 class TestAllowlistValidation:
     def test_deprecated_model_is_error_in_strict_mode(self) -> None:
@@ -88,6 +194,23 @@ class TestAllowlistValidation:
             strict=True,
         )
         assert not any(i.check == "language-code" for i in issues)
+
+    def test_single_pass_reports_original_line_numbers(self) -> None:
+        issues = scan_added_lines_for_allowlist(
+            Path("examples/new-recipe/app.py"),
+            [
+                (3, 'model = "sarvam-105b"'),
+                (4, "# model = 'sarvam-m'"),
+                (7, ""),
+                (9, 'model = "sarvam-m"; language_code = "xx-IN"'),
+            ],
+            strict=True,
+        )
+        assert [(i.check, i.message.split(": ")[0]) for i in issues] == [
+            ("deprecated-model", "examples/new-recipe/app.py:9"),
+            ("language-code", "examples/new-recipe/app.py:9"),
+        ]
+
     def test_canonical_rules_have_required_keys(self) -> None:
         rules = canonical_rules()
         assert rules["schema_version"] == 1
@@ -1,15 +1,29 @@
 """Unit tests for scripts/sarvam_checks.py and scripts/validate_pr.py."""
 from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from sarvam_checks import (  # noqa: E402
+    SECRET_SCANNER,
+    file_secret_hits,
     is_recipe_directory,
+    load_notebook,
+    notebook_cell_line_spans,
     notebook_cell_sources,
+    parse_diff_index,
+    parse_notebook,
+    scan_added_lines_for_secrets,
+    scan_file_for_client_side_keys,
+    scan_file_for_secret_rules,
+    scan_file_for_secrets,
     scan_text_for_secrets,
+    stream_notebook,
 )
 
 
@@ -31,6 +45,164 @@ class TestSecretScanning:
         issues = scan_text_for_secrets(text, "app.py")
         assert any(i.check == "secrets" for i in issues)
 
+    def test_sk_key_inside_assignment_reports_both_rules(self) -> None:
+        fake_key = "sk_" + ("y" * 24)
+        hits = SECRET_SCANNER.scan(f'SARVAM_API_KEY = "{fake_key}"')
+        assert [h.rule for h in hits] == ["assignment", "sk-prefix"]
+
+    def test_client_side_trigger_does_not_hide_assignment(self) -> None:
+        text = 'process.env.SARVAM_API_KEY = "sarvam_fake_key_abcdefghijklmnopqrst"'
+        rules = {h.rule for h in SECRET_SCANNER.scan(text)}
+        assert rules == {"assignment", "client-side-key"}
+
+    def test_combined_file_scan_matches_separate_scans(self, tmp_path: Path) -> None:
+        page = tmp_path / "page.tsx"
+        page.write_text(
+            '"use client";\n'
+            'const key = process.env.SARVAM_API_KEY;\n'
+            'const api_subscription_key = "sarvam_fake_key_abcdefghijklmnopqrst";\n',
+            encoding="utf-8",
+        )
+        combined = scan_file_for_secret_rules(page, tmp_path)
+        separate = scan_file_for_secrets(page, tmp_path) + scan_file_for_client_side_keys(page)
+        assert combined == separate
+        assert len(combined) == 2
+
+
+class TestMappedSecretScanning:
+    @staticmethod
+    def _text() -> str:
+        fake_key = "sk_" + ("m" * 24)
+        filler = "const x = 1; // padding\n" * 40
+        return (
+            filler
+            + 'SARVAM_API_KEY = "sarvam_fake_key_abcdefghijklmnopqrst"\n'
+            + filler
+            + f"auth = '{fake_key}'\n"
+            + filler
+            + 'api_subscription_key = "your-sarvam-api-key-placeholder"\n'
+        )
+
+    @pytest.mark.parametrize("window", [7, 64, 1000, 1 << 20])
+    def test_windowed_scan_matches_text_scan(self, window: int) -> None:
+        text = self._text()
+        assert SECRET_SCANNER.scan_buffer(text.encode(), window=window, overlap=128) == SECRET_SCANNER.scan(text)
+
+    def test_large_file_is_scanned_through_mmap(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        bundle = tmp_path / "bundle.js"
+        bundle.write_text(self._text(), encoding="utf-8")
+        monkeypatch.setattr("sarvam_checks.SECRET_MMAP_THRESHOLD", 1)
+        monkeypatch.setattr(
+            "sarvam_checks.SECRET_SCANNER.scan",
+            lambda _text: pytest.fail("large file was decoded to str"),
+        )
+        hits, use_client = file_secret_hits(bundle)
+        assert [h.rule for h in hits] == ["assignment", "sk-prefix"]
+        assert use_client is False
+
+
+class TestDiffScopedScanning:
+    FAKE = 'SARVAM_API_KEY = "sarvam_fake_key_abcdefghijklmnopqrst"'
+
+    def test_only_added_lines_are_scanned(self, tmp_path: Path) -> None:
+        app = tmp_path / "app.py"
+        app.write_text(f"{self.FAKE}\nx = 1\ny = 2\n", encoding="utf-8")
+        # The pre-existing leak on line 1 is outside the diff.
+        assert scan_added_lines_for_secrets(app, [(3, "y = 2")], tmp_path) == []
+
+    def test_added_hunk_reports_line_number(self, tmp_path: Path) -> None:
+        app = tmp_path / "app.py"
+        app.write_text(f"x = 1\ny = 2\n{self.FAKE}\n", encoding="utf-8")
+        issues = scan_added_lines_for_secrets(app, [(2, "y = 2"), (3, self.FAKE)], tmp_path)
+        assert len(issues) == 1
+        assert "app.py:3" in issues[0].message
+
+    def test_notebook_hunk_maps_to_touched_cell(self, tmp_path: Path) -> None:
+        nb = {
+            "cells": [
+                {"cell_type": "code", "source": [self.FAKE + "\n"], "outputs": []},
+                {"cell_type": "code", "source": ["print('hi')\n", self.FAKE], "outputs": []},
+                {"cell_type": "markdown", "source": ["# Done"]},
+            ],
+            "metadata": {},
+        }
+        nb_path = tmp_path / "demo.ipynb"
+        nb_path.write_text(json.dumps(nb, indent=1), encoding="utf-8")
+        raw_lines = nb_path.read_text(encoding="utf-8").splitlines()
+        line_no = next(i for i, line in enumerate(raw_lines, 1) if "print('hi')" in line)
+        issues = scan_added_lines_for_secrets(nb_path, [(line_no, raw_lines[line_no - 1])], tmp_path)
+        assert [i.message.split(":")[0] for i in issues] == ["Possible hardcoded API key in demo.ipynb (cell 1)"]
+
+    def test_cell_line_spans_cover_each_cell(self) -> None:
+        nb = {"cells": [{"cell_type": "code", "source": ["a"]}, {"cell_type": "code", "source": ["b"]}]}
+        data = json.dumps(nb, indent=1).encode()
+        cells, spans = notebook_cell_line_spans(data)
+        raw_lines = data.decode().splitlines()
+        for cell, (first, last) in zip(cells, spans):
+            block = "\n".join(raw_lines[first - 1:last]).rstrip(",")
+            assert json.loads(block)["source"] == [cell.source]
+
+
+class TestDiffIndex:
+    PATCH = "\n".join([
+        "diff --git a/examples/app/app.py b/examples/app/app.py",
+        "index 587be6b..354a7a1 100644",
+        "--- a/examples/app/app.py",
+        "+++ b/examples/app/app.py",
+        "@@ -1,0 +2,2 @@ x",
+        "++++ not a header",
+        "+new",
+        "@@ -9 +10,0 @@",
+        "-gone",
+        "diff --git a/examples/Indic Soundbox AI/app.py b/examples/Indic Soundbox AI/app.py",
+        "new file mode 100644",
+        "--- /dev/null",
+        "+++ b/examples/Indic Soundbox AI/app.py\t",
+        "@@ -0,0 +1 @@",
+        "+print('hi')",
+        "diff --git a/logo.png b/logo.png",
+        "new file mode 100644",
+        "Binary files /dev/null and b/logo.png differ",
+        "diff --git a/old.txt b/old.txt",
+        "deleted file mode 100644",
+        "--- a/old.txt",
+        "+++ /dev/null",
+        "@@ -1 +0,0 @@",
+        "-k",
+        "diff --git a/before.py b/after.py",
+        "similarity index 100%",
+        "rename from before.py",
+        "rename to after.py",
+        'diff --git "a/q\\"x.txt" "b/q\\"x.txt"',
+        "--- \"a/q\\\"x.txt\"",
+        "+++ \"b/q\\\"x.txt\"",
+        "@@ -0,0 +1 @@",
+        "+a",
+        "",
+    ])
+
+    def test_parses_every_file_once(self) -> None:
+        index = parse_diff_index(self.PATCH)
+        assert {path: diff.status for path, diff in index.items()} == {
+            "examples/app/app.py": "M",
+            "examples/Indic Soundbox AI/app.py": "A",
+            "logo.png": "A",
+            "old.txt": "D",
+            "after.py": "R",
+            'q"x.txt': "M",
+        }
+
+    def test_added_lines_use_new_line_numbers(self) -> None:
+        index = parse_diff_index(self.PATCH)
+        assert index["examples/app/app.py"].added == [(2, "+++ not a header"), (3, "new")]
+        assert index["examples/Indic Soundbox AI/app.py"].added == [(1, "print('hi')")]
+        assert index["logo.png"].added == []
+
+    def test_empty_patch(self) -> None:
+        assert parse_diff_index("") == {}
+
 
 class TestRecipeDetection:
     def test_recipe_with_env_example_and_notebook(self, tmp_path: Path) -> None:
@@ -63,3 +235,55 @@ class TestNotebookCellSources:
         nb_path.write_bytes(b"\xef\xbb\xbf" + content.encode("utf-8"))
         sources = notebook_cell_sources(nb_path)
         assert sources == ['model = "sarvam-m"']
+
+    def test_parse_notebook_exposes_line_offsets(self) -> None:
+        data = b'{"cells": [{"cell_type": "code", "source": ["a = 1\\n", "b = 2\\n", "c = 3"]}]}'
+        (cell,) = parse_notebook(data)
+        assert cell.cell_type == "code"
+        assert cell.line_offsets == (0, 6, 12)
+        assert cell.line_at(cell.source.index("b")) == 2
+        assert cell.line_at(cell.source.index("c")) == 3
+
+    def test_parse_notebook_rejects_invalid_json(self) -> None:
+        assert parse_notebook(b"{not json") is None
+
+
+class TestStreamingNotebookParser:
+    @staticmethod
+    def _notebook_with_outputs() -> dict:
+        return {
+            "metadata": {"kernelspec": {"name": "python3"}},
+            "cells": [
+                {"cell_type": "markdown", "source": "# Title {not [json]}", "attachments": {
+                    "a.png": {"image/png": "iVBOR" + "A" * 5000},
+                }},
+                {
+                    "cell_type": "code",
+                    "source": ['x = "quote \\" and \\\\ backslash"\n', "print(x)"],
+                    "outputs": [{"output_type": "stream", "text": ["]}", '"' * 3, "{["]}],
+                    "execution_count": 3,
+                },
+                {"cell_type": "raw", "source": [], "metadata": {"tags": [None, True, 1.5e3]}},
+            ],
+            "nbformat": 4,
+        }
+
+    def test_matches_full_parse(self, tmp_path: Path) -> None:
+        nb_path = tmp_path / "nb.ipynb"
+        nb_path.write_text(json.dumps(self._notebook_with_outputs(), indent=1), encoding="utf-8")
+        assert stream_notebook(nb_path) == parse_notebook(nb_path.read_bytes())
+
+    def test_accepts_bom(self, tmp_path: Path) -> None:
+        nb_path = tmp_path / "nb.ipynb"
+        nb_path.write_bytes(b"\xef\xbb\xbf" + json.dumps(self._notebook_with_outputs()).encode())
+        assert [c.cell_type for c in stream_notebook(nb_path)] == ["markdown", "code", "raw"]
+
+    def test_truncated_notebook_returns_none(self, tmp_path: Path) -> None:
+        nb_path = tmp_path / "nb.ipynb"
+        nb_path.write_text(json.dumps(self._notebook_with_outputs())[:-40], encoding="utf-8")
+        assert stream_notebook(nb_path) is None
+
+    def test_load_notebook_streams_above_threshold(self, tmp_path: Path) -> None:
+        nb_path = tmp_path / "nb.ipynb"
+        nb_path.write_text(json.dumps(self._notebook_with_outputs()), encoding="utf-8")
+        assert load_notebook(nb_path, stream_threshold=1) == load_notebook(nb_path)
@@ -13,6 +13,9 @@ Test organisation mirrors the check functions in validate_recipe.py:
     TestNotebookStructure   → check_notebook_structure
     TestEmoji               → check_emoji
     TestValidateRecipe      → validate_recipe (integration)
+    TestValidateRecipes     → discover_recipes / validate_recipes
+    TestResultCache         → validation_cache.ResultCache integration
+    TestRecipeSnapshot      → RecipeSnapshot (shared single-pass loading)
 """
 from __future__ import annotations
 
@@ -28,14 +31,18 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from validate_recipe import (  # noqa: E402
     Issue,
+    RecipeSnapshot,
     check_emoji,
     check_gitignore,
     check_notebook_structure,
     check_required_files,
     check_requirements,
     check_secrets,
+    discover_recipes,
     validate_recipe,
+    validate_recipes,
 )
+from validation_cache import ResultCache  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -378,6 +385,12 @@ class TestSecrets:
         )
         assert any(i.check == "secrets" for i in _errors(check_secrets(d)))
 
+    def test_sk_prefixed_key_in_python_file_flagged(self, tmp_path: Path) -> None:
+        d = _make_recipe(tmp_path)
+        fake_key = "sk_" + ("z" * 24)
+        (d / "helper.py").write_text(f"headers = {{'Authorization': 'Bearer {fake_key}'}}\n", encoding="utf-8")
+        assert any(i.check == "secrets" for i in _errors(check_secrets(d)))
+
     def test_short_quoted_value_under_threshold_not_flagged(self, tmp_path: Path) -> None:
         # Values shorter than 10 characters cannot be real API keys.
         d = _make_recipe(tmp_path)
@@ -661,3 +674,118 @@ class TestValidateRecipe:
         assert "requirements" in checks_found
         assert "notebook-structure" in checks_found
         assert "no-emoji" in checks_found
+
+
+# ---------------------------------------------------------------------------
+# TestValidateRecipes  (multi-recipe / process pool)
+# ---------------------------------------------------------------------------
+
+
+class TestValidateRecipes:
+    def test_discover_finds_only_recipe_directories(self, tmp_path: Path) -> None:
+        examples = tmp_path / "examples"
+        examples.mkdir()
+        _make_recipe(examples, "b-recipe")
+        _make_recipe(examples, "a-recipe")
+        app = examples / "some-app"
+        app.mkdir()
+        (app / ".env.example").write_text("SARVAM_API_KEY=YOUR_SARVAM_API_KEY\n", encoding="utf-8")
+        (app / "app.py").write_text("print('hi')\n", encoding="utf-8")
+        found = discover_recipes(tmp_path)
+        assert [p.name for p in found] == ["a-recipe", "b-recipe"]
+
+    def test_parallel_results_match_serial(self, tmp_path: Path) -> None:
+        good = _make_recipe(tmp_path, "good-recipe")
+        bad = _make_recipe(tmp_path, "bad-recipe")
+        (bad / "README.md").unlink()
+        (bad / "requirements.txt").write_text("requests\n", encoding="utf-8")
+        dirs = [bad, good]
+        parallel = validate_recipes(dirs, jobs=2)
+        assert [d for d, _ in parallel] == dirs
+        assert parallel == [(d, validate_recipe(d)) for d in dirs]
+
+    def test_single_job_runs_in_process(self, tmp_path: Path) -> None:
+        d = _make_recipe(tmp_path)
+        assert validate_recipes([d], jobs=1) == [(d, validate_recipe(d))]
+
+
+# ---------------------------------------------------------------------------
+# TestResultCache
+# ---------------------------------------------------------------------------
+
+
+class TestResultCache:
+    def test_warm_run_matches_cold_run(self, tmp_path: Path) -> None:
+        d = _make_recipe(tmp_path)
+        (d / "helper.py").write_text(
+            'api_subscription_key = "a-real-subscription-key-1234567890"\n',
+            encoding="utf-8",
+        )
+        cache = ResultCache("test", tmp_path / "cache", rules_fp="fp")
+        cold = validate_recipe(d, cache)
+        warm = validate_recipe(d, cache)
+        assert warm == cold == validate_recipe(d)
+
+    def test_warm_run_skips_rescan(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        d = _make_recipe(tmp_path)
+        cache = ResultCache("test", tmp_path / "cache", rules_fp="fp")
+        validate_recipe(d, cache)
+
+        def _boom(*_args: object) -> list[Issue]:
+            raise AssertionError("cached file was rescanned")
+
+        monkeypatch.setattr("validate_recipe._file_secret_issues", _boom)
+        monkeypatch.setattr("validate_recipe._notebook_structure_issues", _boom)
+        monkeypatch.setattr("validate_recipe._emoji_issues", _boom)
+        assert not _errors(validate_recipe(d, cache))
+
+    def test_changed_file_is_rescanned(self, tmp_path: Path) -> None:
+        d = _make_recipe(tmp_path)
+        cache = ResultCache("test", tmp_path / "cache", rules_fp="fp")
+        assert not _errors(check_secrets(d, cache))
+        (d / ".env.example").write_text(
+            'SARVAM_API_KEY="a-real-subscription-key-1234567890"\n', encoding="utf-8"
+        )
+        assert _errors(check_secrets(d, cache))
+
+    def test_key_depends_on_version_and_rules(self, tmp_path: Path) -> None:
+        a = ResultCache("1", tmp_path, rules_fp="x")
+        b = ResultCache("2", tmp_path, rules_fp="x")
+        c = ResultCache("1", tmp_path, rules_fp="y")
+        keys = {cache.key("secrets", "a.py", "digest") for cache in (a, b, c)}
+        assert len(keys) == 3
+
+
+# ---------------------------------------------------------------------------
+# TestRecipeSnapshot
+# ---------------------------------------------------------------------------
+
+
+class TestRecipeSnapshot:
+    def test_notebook_decoded_once_per_validation(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import validate_recipe
+
+        calls: list[Path] = []
+        real_load = validate_recipe.load_notebook
+
+        def _counting_load(path: Path):
+            calls.append(path)
+            return real_load(path)
+
+        monkeypatch.setattr("validate_recipe.load_notebook", _counting_load)
+        validate_recipe.validate_recipe(_make_recipe(tmp_path))
+        assert len(calls) == 1
+
+    def test_files_listing_excludes_directories(self, tmp_path: Path) -> None:
+        d = _make_recipe(tmp_path)
+        files = RecipeSnapshot(d).files()
+        assert all(p.is_file() for p in files)
+        assert files == sorted(files)
+
+    def test_notebook_with_utf8_bom_is_parsed(self, tmp_path: Path) -> None:
+        d = _make_recipe(tmp_path, "my-recipe")
+        nb_path = d / "my_recipe.ipynb"
+        nb_path.write_bytes(b"\xef\xbb\xbf" + nb_path.read_bytes())
+        assert not _errors(check_notebook_structure(d))